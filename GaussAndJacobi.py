@@ -1,14 +1,36 @@
-from math import pi
+from math import inf, pi
+
+import numpy as np
+
+from checkpoint import Checkpointer, warm_start
+from diagonal_matching import matching_permutation_fix
+from linear_operator import LinearOperator
+from sparse_matrix import CSRMatrix
+from spectral_radius import gauss_seidel_spectral_radius, jacobi_spectral_radius, predicted_sweeps
+from stationary_solvers import jacobi, matrix_diagonal
 
 def is_diagonally_dominant(mat):
     """
     Checks if a matrix is diagonally dominant.
-    :param mat: A 2D list representing the matrix.
-    :return: True if the matrix is diagonally dominant, False otherwise.
+    :param mat: A 2D list, a CSRMatrix or a LinearOperator representing the matrix.
+    :return: True if the matrix is diagonally dominant, False otherwise (also for an operator
+             that does not provide abs_row_sums).
     """
     if mat is None:
         return False
 
+    if isinstance(mat, LinearOperator):
+        try:
+            row_sums = mat.abs_row_sums()
+        except NotImplementedError:
+            return False
+        diagonal = np.abs(mat.diagonal())
+        return bool(np.all(diagonal > row_sums - diagonal))
+
+    if isinstance(mat, CSRMatrix):
+        diagonal = np.abs(mat.diagonal())
+        return bool(np.all(diagonal > mat.abs_row_sums() - diagonal))
+
     for i in range(len(mat)):
         diagonal_element = abs(mat[i][i])
         row_sum = sum(abs(mat[i][j]) for j in range(len(mat[i])) if j != i)
@@ -40,10 +62,27 @@ def partial_pivoting_with_vector(A, b):
 def fix(matrix, b):
     """
     Rearranges the rows and columns of a matrix to make it diagonally dominant.
-    :param matrix: A square matrix (2D list or numpy array)
+    The greedy column search is tried first; when it fails the rows are ordered by a
+    maximum-product matching of the diagonal, which finds a strictly dominant ordering
+    whenever one exists.
+    :param matrix: A square matrix (2D list, numpy array or CSRMatrix)
     :param b: A vector (1D list or numpy array)
     :return: A tuple containing the diagonally dominant matrix and the modified vector
     """
+    try:
+        if isinstance(matrix, CSRMatrix):
+            return fix_csr(matrix, b)
+        return fix_greedy(matrix, b)
+    except ValueError:
+        return fix_matching(matrix, b)
+
+def fix_greedy(matrix, b):
+    """
+    The greedy search of `fix`: row i is swapped with the row holding the largest value in column i.
+    :param matrix: A square matrix (2D list)
+    :param b: A vector (1D list)
+    :return: A tuple containing the diagonally dominant matrix and the modified vector
+    """
     n = len(matrix)
     matrix = custom_array(matrix, dtype=float)
     b = custom_array(b, dtype=float)
@@ -66,92 +105,256 @@ def fix(matrix, b):
 
     return matrix, b
 
-def gauss_seidel(A, b, X0, TOL=0.00001, N=200):
+def fix_csr(matrix, b):
+    """
+    The row exchanges of `fix` for a CSRMatrix, done without densifying.
+    Column i is read from the transpose, so the whole search is O(nnz).
+    :param matrix: A square CSRMatrix
+    :param b: A vector (1D list or numpy array)
+    :return: A tuple containing the row-permuted CSRMatrix and the modified vector
+    """
+    n = len(matrix)
+    columns = matrix.transpose()
+    row_sums = matrix.abs_row_sums()
+    order = np.arange(n)         # order[i] - original row now at position i
+    position = np.arange(n)      # position[r] - current position of original row r
+
+    for i in range(n):
+        start, end = columns.indptr[i], columns.indptr[i + 1]
+        rows, values = columns.indices[start:end], np.abs(columns.data[start:end])
+        current = position[rows]
+        candidates = current >= i
+        if not np.any(candidates):
+            raise ValueError("Cannot make the matrix diagonally dominant.")
+
+        # Largest value in column i, earliest position on ties (like the dense search)
+        best = np.lexsort((current[candidates], -values[candidates]))[0]
+        row, pivot = rows[candidates][best], values[candidates][best]
+
+        # Swap rows in the matrix order if necessary
+        max_row = position[row]
+        if max_row != i:
+            other = order[i]
+            order[i], order[max_row] = row, other
+            position[row], position[other] = i, max_row
+
+        # Check if the diagonal element is dominant
+        if pivot < row_sums[row] - pivot:
+            raise ValueError("Cannot make the matrix diagonally dominant.")
+
+    b = np.asarray(b, dtype=float)[order]
+    return matrix.permute_rows(order), b
+
+def fix_matching(matrix, b):
+    """
+    The matching fallback of `fix` - rows ordered by diagonal_matching.maximum_product_matching.
+    :param matrix: A square matrix (2D list, numpy array or CSRMatrix)
+    :param b: A vector (1D list or numpy array)
+    :return: A tuple containing the diagonally dominant matrix and the modified vector
+    """
+    try:
+        matrix, b = matching_permutation_fix(matrix, b)
+    except ValueError:
+        raise ValueError("Cannot make the matrix diagonally dominant.")
+
+    if isinstance(matrix, CSRMatrix):
+        diagonal, row_sums = np.abs(matrix.diagonal()), matrix.abs_row_sums()
+    else:
+        diagonal, row_sums = np.abs(np.diag(matrix)), np.sum(np.abs(matrix), axis=1)
+    # Check if the diagonal elements are dominant
+    if np.any(diagonal < row_sums - diagonal):
+        raise ValueError("Cannot make the matrix diagonally dominant.")
+
+    if isinstance(matrix, CSRMatrix):
+        return matrix, b
+    return matrix.tolist(), b.tolist()
+
+
+def csr_gauss_seidel_sweep(A, b, x, diagonal):
+    """
+    One Gauss-Seidel sweep over a CSRMatrix, updating x in place in O(nnz).
+    :param A: CSRMatrix
+    :param b: Right-hand side (numpy array)
+    :param x: Current iterate (numpy array), overwritten
+    :param diagonal: Diagonal of A
+    """
+    indptr, indices, data = A.indptr, A.indices, A.data
+    for i in range(len(A)):
+        start, end = indptr[i], indptr[i + 1]
+        sigma = data[start:end] @ x[indices[start:end]] - diagonal[i] * x[i]
+        x[i] = (b[i] - sigma) / diagonal[i]
+
+
+def worth_iterating(rho, TOL, N, method):
+    """
+    Prints the sweep count predicted from the spectral radius of an iteration matrix.
+    :param rho: Estimated spectral radius
+    :param TOL: Tolerance of the solve
+    :param N: Maximum number of iterations of the solve
+    :param method: Name of the method for the message
+    :return: False when the method diverges or needs more than N sweeps, True otherwise
+    """
+    sweeps = predicted_sweeps(rho, TOL)
+    if sweeps == inf:
+        print(f"Spectral radius of the {method} iteration matrix is {rho:.4f} >= 1 - the method diverges\n")
+        return False
+    print(f"Spectral radius of the {method} iteration matrix is {rho:.4f} - about {sweeps} iterations predicted\n")
+    if sweeps > N:
+        print(f"More than N = {N} iterations needed - skipping the {method} algorithm")
+        return False
+    return True
+
+def gauss_seidel(A, b, X0, TOL=0.00001, N=200, predict=False, verbose=True, checkpoint=None,
+                 checkpoint_every=10, resume=False):
     """
     Gauss-Seidel iterative method for solving linear equations Ax = b.
+    There is no preconditioner hook (M=) as in jacobi_iterative: a Gauss-Seidel sweep is
+    already the splitting x <- x + (D + L)⁻¹(b - Ax), i.e. the preconditioned Richardson
+    step with M = D + L. For another M, use jacobi_iterative(..., M=M), or the Krylov
+    solvers in krylov_solvers.py.
     Args:
-        A: 2D list (matrix) representing the coefficients of the linear equations.
+        A: 2D list (matrix), CSRMatrix or LinearOperator (swept with its `relax` method)
+           representing the coefficients of the linear equations.
         b: 1D list (vector) representing the constants of the linear equations.
-        X0: vector of initial guesses for the solution.
+        X0: vector of initial guesses for the solution - the first sweep starts from it
+            (see checkpoint.warm_start for what else can seed the solve).
         TOL: Tolerance for convergence (default is 0.00001).
         N: Maximum number of iterations (default is 200).
+        predict: If True, estimate the spectral radius of the iteration matrix first and
+                 skip the solve (returning (pi, pi, pi)) when it cannot converge within N.
+        verbose: If False, the iteration table is not printed (for large systems).
+        checkpoint: Optional file name - the iterate, the sweep count and the history of max
+                    steps are saved there every checkpoint_every sweeps and at the end
+                    (see checkpoint.py)
+        checkpoint_every: Sweeps between two checkpoints (default is 10).
+        resume: If True and the checkpoint file exists, continue from it instead of X0;
+                N still counts all sweeps, including those done before the checkpoint.
 
     Returns: A tuple representing the approximate solution to the system of equations.
 
     """
     n = len(A)
-    k = 1
+    checkpointer = None if checkpoint is None else Checkpointer(checkpoint, n, checkpoint_every, resume)
+    if checkpointer is not None and checkpointer.start is not None:
+        X0 = checkpointer.start
+    X0 = warm_start(X0, n)
+    k = 1 if checkpointer is None else checkpointer.iterations + 1
 
     if is_diagonally_dominant(A):
         print('Matrix is diagonally dominant - preforming gauss seidel algorithm\n')
 
-    print( "Iteration" + "\t\t\t".join([" {:>12}".format(var) for var in ["x{}".format(i) for i in range(1, len(A) + 1)]]))
-    print("-----------------------------------------------------------------------------------------------")
-    x = [0.0 for _ in range(n)]
+    if predict and not worth_iterating(gauss_seidel_spectral_radius(A), TOL, N, "gauss seidel"):
+        return (pi, pi, pi)
+
+    if verbose:
+        print( "Iteration" + "\t\t\t".join([" {:>12}".format(var) for var in ["x{}".format(i) for i in range(1, len(A) + 1)]]))
+        print("-----------------------------------------------------------------------------------------------")
+    x = X0.tolist()
+    operator = isinstance(A, LinearOperator)
+    sparse = operator or isinstance(A, CSRMatrix)
+    if sparse:
+        # One sweep costs O(nnz) instead of O(n^2); an operator sweeps without storing A
+        diagonal = matrix_diagonal(A)
+        b = np.asarray(b, dtype=float)
+        x = X0.copy()
     while k <= N:
 
-        for i in range(n):
-            sigma = 0
-            for j in range(n):
-                if A[i][i] == 0:
-                    raise ZeroDivisionError(f"Zero on diagonal at row {i}, cannot divide by zero.")
-                if j != i:
-                    sigma += A[i][j] * x[j]
-            x[i] = (b[i] - sigma) / A[i][i]
-
-        print("{:<15} ".format(k) + "\t\t".join(["{:<15} ".format(val) for val in x]))
-
-        max_diff = max(abs(x[i] - X0[i]) for i in range(n))
+        if operator:
+            A.relax(b, x)
+        elif sparse:
+            csr_gauss_seidel_sweep(A, b, x, diagonal)
+        else:
+            for i in range(n):
+                sigma = 0
+                for j in range(n):
+                    if A[i][i] == 0:
+                        raise ZeroDivisionError(f"Zero on diagonal at row {i}, cannot divide by zero.")
+                    if j != i:
+                        sigma += A[i][j] * x[j]
+                x[i] = (b[i] - sigma) / A[i][i]
+
+        if verbose:
+            print("{:<15} ".format(k) + "\t\t".join(["{:<15} ".format(val) for val in x]))
+
+        if sparse:
+            max_diff = np.max(np.abs(x - X0))
+        else:
+            max_diff = max(abs(x[i] - X0[i]) for i in range(n))
+        if checkpointer is not None:
+            checkpointer.record(k, x, max_diff)
         if max_diff < TOL:
-            return tuple(x)
+            if checkpointer is not None:
+                checkpointer.save(x)
+            return tuple(x.tolist()) if sparse else tuple(x)
 
         k += 1
         X0 = x.copy()
 
+    if checkpointer is not None:
+        checkpointer.save(x)
     print("Maximum number of iterations exceeded")
     return (pi, pi, pi)
 
-def jacobi_iterative(A, b, X0, TOL=0.00001, N=200):
+def jacobi_iterative(A, b, X0, TOL=0.00001, N=200, M=None, predict=False, verbose=True, checkpoint=None,
+                     checkpoint_every=10, resume=False):
     """
     Jacobi iterative method for solving linear equations Ax = b.
+    The sweeps are done by the vectorized `stationary_solvers.jacobi` engine; this function
+    adds the iteration table.
     Args:
-        A: 2D list (matrix) representing the coefficients of the linear equations.
+        A: 2D list (matrix), CSRMatrix or LinearOperator representing the coefficients of the
+           linear equations.
         b: 1D list (vector) representing the constants of the linear equations.
         X0: vector of initial guesses for the solution.
         TOL: Tolerance for convergence (default is 0.00001).
         N: Maximum number of iterations (default is 200).
+        M: Optional preconditioner (see preconditioners.py) replacing the diagonal in each sweep.
+        predict: If True, estimate the spectral radius of the iteration matrix first and
+                 skip the solve (returning (pi, pi, pi)) when it cannot converge within N.
+        verbose: If False, the iteration table is not printed (for large systems).
+        checkpoint: Optional file name - the iterate, the sweep count and the history of max
+                    steps are saved there every checkpoint_every sweeps and at the end
+                    (see checkpoint.py)
+        checkpoint_every: Sweeps between two checkpoints (default is 10).
+        resume: If True and the checkpoint file exists, continue from it instead of X0;
+                N still counts all sweeps, including those done before the checkpoint.
 
     Returns: A tuple representing the approximate solution to the system of equations.
 
     """
-    n = len(A)
-    k = 1
-
     if is_diagonally_dominant(A):
         print('Matrix is diagonally dominant - preforming jacobi algorithm\n')
 
-    print( "Iteration" + "\t\t\t".join([" {:>12}".format(var) for var in ["x{}".format(i) for i in range(1, len(A) + 1)]]))
-    print("-----------------------------------------------------------------------------------------------")
+    if predict and M is None and not worth_iterating(jacobi_spectral_radius(A), TOL, N, "jacobi"):
+        return (pi, pi, pi)
 
-    while k <= N:
-        x = [0.0 for _ in range(n)]
-        for i in range(n):
-            sigma = 0
-            for j in range(n):
-                if A[i][i] == 0:
-                    raise ZeroDivisionError(f"Zero on diagonal at row {i}, cannot divide by zero.")
-                if j != i:
-                    sigma += A[i][j] * X0[j]
-            x[i] = (b[i] - sigma) / A[i][i]
-
-        print("{:<15} ".format(k) + "\t\t".join(["{:<15} ".format(val) for val in x]))
-
-        max_diff = max(abs(x[i] - X0[i]) for i in range(n))
-        if max_diff < TOL:
-            return tuple(x)
-
-        k += 1
-        X0 = x.copy()
+    n = len(A)
+    checkpointer = None if checkpoint is None else Checkpointer(checkpoint, n, checkpoint_every, resume)
+    if checkpointer is not None and checkpointer.start is not None:
+        X0 = checkpointer.start
+    X0 = warm_start(X0, n)
+    done = 0 if checkpointer is None else checkpointer.iterations
+
+    if verbose:
+        print( "Iteration" + "\t\t\t".join([" {:>12}".format(var) for var in ["x{}".format(i) for i in range(1, len(A) + 1)]]))
+        print("-----------------------------------------------------------------------------------------------")
+
+    previous = X0
+
+    def after_sweep(k, x):
+        nonlocal previous
+        if verbose:
+            print("{:<15} ".format(done + k) + "\t\t".join(["{:<15} ".format(val) for val in x.tolist()]))
+        if checkpointer is not None:
+            checkpointer.record(done + k, x, np.max(np.abs(x - previous)))
+            previous = x.copy()
+
+    trace = after_sweep if verbose or checkpointer is not None else None
+    result = jacobi(A, b, X0, TOL, N - done, trace=trace, M=M)
+    if checkpointer is not None:
+        checkpointer.save(result.x)
+    if result.converged:
+        return tuple(result.x.tolist())
 
     print("Maximum number of iterations exceeded")
     return (pi, pi, pi)
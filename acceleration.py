@@ -0,0 +1,143 @@
+import time
+
+import numpy as np
+
+from preconditioners import as_csr, lower_solve, split_triangles
+from stationary_solvers import IterationResult, as_operator_matrix, matrix_diagonal
+
+
+def jacobi_map(A, b):
+    """
+    The Jacobi sweep as a fixed-point map G(x) = D^-1 (b - (A - D) x).
+    :param A: 2D list, numpy array or CSRMatrix
+    :param b: Vector n
+    :return: Callable G
+    """
+    A = as_operator_matrix(A)
+    b = np.asarray(b, dtype=float)
+    diagonal = matrix_diagonal(A)
+    return lambda x: (b - A @ x + diagonal * x) / diagonal
+
+
+def gauss_seidel_map(A, b):
+    """
+    The Gauss-Seidel sweep as a fixed-point map G(x) = (D + L)^-1 (b - U x).
+    :param A: 2D list, numpy array or CSRMatrix
+    :param b: Vector n
+    :return: Callable G
+    """
+    matrix_diagonal(as_operator_matrix(A))
+    lower, diagonal, upper = split_triangles(as_csr(A))
+    b = np.asarray(b, dtype=float)
+    return lambda x: lower_solve(lower, diagonal, b - upper @ x)
+
+
+def anderson(G, x0, m=5, TOL=0.00001, N=200):
+    """
+    Anderson acceleration of the fixed-point iteration x <- G(x).
+
+    The last m differences of the residuals f = G(x) - x and of the G values are kept in a
+    fixed m x n ring buffer; each step takes the combination of them that minimizes the
+    residual in the least-squares sense.
+    Args:
+        G: Fixed-point map (e.g. jacobi_map(A, b))
+        x0: Initial guess
+        m: History depth (m = 0 is the plain iteration)
+        TOL: Tolerance for convergence - max |G(x) - x| (default is 0.00001).
+        N: Maximum number of iterations (G evaluations) (default is 200).
+
+    Returns: IterationResult(x, iterations, converged)
+    """
+    if m < 0:
+        raise ValueError("m must not be negative.")
+
+    x = np.array(x0, dtype=float)
+    n = len(x)
+    delta_f = np.zeros((m, n))
+    delta_g = np.zeros((m, n))
+    g_previous = f_previous = None
+
+    for k in range(1, N + 1):
+        g = G(x)
+        f = g - x
+        if np.max(np.abs(f)) < TOL:
+            return IterationResult(g, k, True)
+
+        if m == 0:
+            x = g
+            continue
+        if f_previous is not None:
+            slot = (k - 2) % m
+            delta_f[slot] = f - f_previous
+            delta_g[slot] = g - g_previous
+        g_previous, f_previous = g, f
+
+        stored = min(k - 1, m)
+        if stored == 0:
+            x = g
+            continue
+        gamma = np.linalg.lstsq(delta_f[:stored].T, f, rcond=None)[0]
+        x = g - gamma @ delta_g[:stored]
+
+    return IterationResult(x, N, False)
+
+
+def aitken(G, x0, TOL=0.00001, N=200):
+    """
+    Vector Aitken delta-squared extrapolation of the fixed-point iteration x <- G(x).
+
+    From x, x1 = G(x) and x2 = G(x1) the next iterate is
+    x2 - (Δx1·Δ²x) / (Δ²x·Δ²x) Δx1, with Δx1 = x2 - x1 and Δ²x = x2 - 2 x1 + x.
+    Args:
+        G: Fixed-point map (e.g. jacobi_map(A, b))
+        x0: Initial guess
+        TOL: Tolerance for convergence - max |G(x) - x| (default is 0.00001).
+        N: Maximum number of iterations (G evaluations) (default is 200).
+
+    Returns: IterationResult(x, iterations, converged)
+    """
+    x = np.array(x0, dtype=float)
+    k = 0
+    while k < N:
+        x1 = G(x)
+        k += 1
+        if np.max(np.abs(x1 - x)) < TOL:
+            return IterationResult(x1, k, True)
+        x2 = G(x1)
+        k += 1
+        step = x2 - x1
+        if np.max(np.abs(step)) < TOL:
+            return IterationResult(x2, k, True)
+
+        second_difference = step - (x1 - x)
+        denominator = second_difference @ second_difference
+        if denominator == 0:
+            x = x2
+        else:
+            x = x2 - (step @ second_difference) / denominator * step
+
+    return IterationResult(x, k, False)
+
+
+if __name__ == '__main__':
+    """
+    Sweeps and wall time of plain Jacobi / Gauss-Seidel against Anderson and Aitken
+    acceleration on the iterative-methods matrix of main.py and a 2D Poisson system.
+    """
+    from sparse_matrix import poisson_2d
+
+    benchmarks = [("main.py iter_A", [[4, 2, 0], [2, 10, 4], [0, 4, 5]], [2, 6, 5]),
+                  ("Poisson 30x30", poisson_2d(30), np.ones(900))]
+    print("{:<18}{:<16}{:<16}{:>8}{:>12}".format("Matrix", "Sweep", "Acceleration", "Sweeps", "Time [s]"))
+    print("-" * 70)
+    for name, A, b in benchmarks:
+        for sweep_name, make_map in [("Jacobi", jacobi_map), ("Gauss-Seidel", gauss_seidel_map)]:
+            G = make_map(A, b)
+            x0 = np.zeros(len(b))
+            for method, solve in [("none", lambda: anderson(G, x0, m=0, N=5000)),
+                                  ("Anderson m=5", lambda: anderson(G, x0, m=5, N=5000)),
+                                  ("Aitken", lambda: aitken(G, x0, N=5000))]:
+                start = time.perf_counter()
+                result = solve()
+                elapsed = time.perf_counter() - start
+                print("{:<18}{:<16}{:<16}{:>8}{:>12.4f}".format(name, sweep_name, method, result.iterations, elapsed))
@@ -0,0 +1,251 @@
+import numpy as np
+
+
+def bandwidth(A):
+    """
+    Lower and upper bandwidth of a dense matrix - the number of nonzero subdiagonals and
+    superdiagonals.
+    Args:
+        A: Matrix nxn (list of lists or numpy array)
+
+    Returns: Tuple (lower, upper)
+    """
+    rows, cols = np.nonzero(np.asarray(A))
+    if len(rows) == 0:
+        return 0, 0
+    offsets = rows - cols
+    return int(max(offsets.max(), 0)), int(max(-offsets.min(), 0))
+
+
+class BandedMatrix:
+    """
+    Square band matrix in LAPACK diagonal-ordered storage: A[i][j] is stored in
+    ab[upper + i - j, j], so row 0 of ab holds the highest superdiagonal, row `upper` the
+    main diagonal and the last row the lowest subdiagonal. Storage is (lower + upper + 1)·n.
+    """
+
+    def __init__(self, ab, lower, upper):
+        """
+        Args:
+            ab: Array of shape (lower + upper + 1, n) in diagonal-ordered form
+            lower: Number of subdiagonals
+            upper: Number of superdiagonals
+
+        Raises:
+            ValueError: If the shape of ab does not match the bandwidths.
+        """
+        self.ab = np.asarray(ab, dtype=float)
+        self.lower = int(lower)
+        self.upper = int(upper)
+        if self.ab.ndim != 2 or self.ab.shape[0] != self.lower + self.upper + 1:
+            raise ValueError("ab must have lower + upper + 1 rows.")
+
+    @classmethod
+    def from_dense(cls, A, lower=None, upper=None):
+        """
+        Builds the band storage of a dense matrix; the bandwidths are detected if not given.
+        Args:
+            A: Matrix nxn (list of lists or numpy array)
+            lower: Number of subdiagonals to keep
+            upper: Number of superdiagonals to keep
+
+        Returns: BandedMatrix
+        """
+        A = np.asarray(A, dtype=float)
+        detected = bandwidth(A)
+        lower = detected[0] if lower is None else lower
+        upper = detected[1] if upper is None else upper
+        n = len(A)
+        ab = np.zeros((lower + upper + 1, n))
+        for offset in range(-upper, lower + 1):
+            # offset = i - j; the diagonal starts at column max(0, -offset)
+            diagonal = np.diagonal(A, -offset)
+            start = max(0, -offset)
+            ab[upper + offset, start:start + len(diagonal)] = diagonal
+        return cls(ab, lower, upper)
+
+    @classmethod
+    def from_diagonals(cls, sub, diag, sup):
+        """
+        Builds a tridiagonal matrix.
+        Args:
+            sub: Subdiagonal (n - 1 values)
+            diag: Main diagonal (n values)
+            sup: Superdiagonal (n - 1 values)
+
+        Returns: BandedMatrix
+        """
+        n = len(diag)
+        ab = np.zeros((3, n))
+        ab[0, 1:] = sup
+        ab[1] = diag
+        ab[2, :-1] = sub
+        return cls(ab, 1, 1)
+
+    def __len__(self):
+        return self.ab.shape[1]
+
+    @property
+    def shape(self):
+        return len(self), len(self)
+
+    def to_dense(self):
+        """Returns the matrix as a dense numpy array"""
+        n = len(self)
+        A = np.zeros((n, n))
+        for offset in range(-self.upper, self.lower + 1):
+            start = max(0, -offset)
+            length = n - abs(offset)
+            if length > 0:
+                A[np.arange(length) + start + offset, np.arange(length) + start] = \
+                    self.ab[self.upper + offset, start:start + length]
+        return A
+
+    def matvec(self, x):
+        """Multiplies the matrix by a vector in O(n·bandwidth)"""
+        x = np.asarray(x, dtype=float)
+        n = len(self)
+        result = np.zeros(n)
+        for offset in range(-self.upper, self.lower + 1):
+            start = max(0, -offset)
+            length = n - abs(offset)
+            if length > 0:
+                result[start + offset:start + offset + length] += \
+                    self.ab[self.upper + offset, start:start + length] * x[start:start + length]
+        return result
+
+    def __matmul__(self, x):
+        return self.matvec(x)
+
+
+class BandedLU:
+    """
+    LU factorization of a band matrix in O(n·lower·(lower + upper)), optionally with partial
+    pivoting. Row exchanges can push U up to lower + upper superdiagonals, so the factors
+    are kept in an array with `lower` extra rows (the layout of LAPACK's gbtrf).
+    """
+
+    def __init__(self, banded, pivoting=True):
+        """
+        Args:
+            banded: BandedMatrix
+            pivoting: Use partial pivoting (False keeps the band of U at `upper`, which is
+                      safe for diagonally dominant or SPD matrices)
+
+        Raises:
+            ValueError: If a zero pivot is found (singular matrix).
+        """
+        n, lower = len(banded), banded.lower
+        upper = banded.upper + (lower if pivoting else 0)
+        ab = np.zeros((lower + upper + 1, n))
+        ab[upper - banded.upper:] = banded.ab
+        perm = np.arange(n)
+
+        for k in range(n):
+            rows = np.arange(k, min(n, k + lower + 1))
+            cols = np.arange(k, min(n, k + upper + 1))
+            if pivoting:
+                max_row = k + int(np.argmax(np.abs(ab[upper + rows - k, k])))
+                if max_row != k:
+                    ab[upper + k - cols, cols], ab[upper + max_row - cols, cols] = \
+                        ab[upper + max_row - cols, cols], ab[upper + k - cols, cols].copy()
+                perm[k] = max_row
+            if ab[upper, k] == 0:
+                raise ValueError("Matrix is singular – zero on diagonal.")
+
+            below = rows[1:]
+            if len(below):
+                ab[upper + below - k, k] /= ab[upper, k]
+                right = cols[1:]
+                ab[upper + below[:, None] - right[None, :], right[None, :]] -= \
+                    np.outer(ab[upper + below - k, k], ab[upper + k - right, right])
+
+        self.ab = ab
+        self.lower = lower
+        self.upper = upper
+        # perm[k] is the row exchanged with row k at step k (LAPACK ipiv convention)
+        self.perm = perm
+
+    def solve(self, b):
+        """
+        Solves A·x = b with the stored factors.
+        Args:
+            b: Vector n, or an nxk block whose columns are right-hand sides
+
+        Returns: numpy array with the same shape as b
+        """
+        x = np.array(b, dtype=float)
+        ab, lower, upper = self.ab, self.lower, self.upper
+        n = ab.shape[1]
+        if x.shape[0] != n:
+            raise ValueError(f"Right-hand side must have {n} rows.")
+
+        for k in range(n):
+            p = self.perm[k]
+            if p != k:
+                x[[k, p]] = x[[p, k]]
+            end = min(n, k + lower + 1)
+            if end > k + 1:
+                multipliers = ab[upper + 1:upper + end - k, k]
+                x[k + 1:end] -= np.multiply.outer(multipliers, x[k]) if x.ndim > 1 else multipliers * x[k]
+
+        for i in range(n - 1, -1, -1):
+            end = min(n, i + upper + 1)
+            cols = np.arange(i + 1, end)
+            x[i] = (x[i] - ab[upper + i - cols, cols] @ x[i + 1:end]) / ab[upper, i]
+        return x
+
+
+def solve_banded(A, b, pivoting=True):
+    """
+    Solves A·x = b for a band matrix.
+    Args:
+        A: BandedMatrix, or a dense matrix whose bandwidth is detected
+        b: Vector n, or an nxk block of right-hand sides
+        pivoting: Use partial pivoting
+
+    Returns: numpy array with the solution
+    """
+    if not isinstance(A, BandedMatrix):
+        A = BandedMatrix.from_dense(A)
+    return BandedLU(A, pivoting).solve(b)
+
+
+def solve_tridiagonal(sub, diag, sup, rhs):
+    """
+    Solves a tridiagonal system without pivoting (the Thomas algorithm).
+    Args:
+        sub: Subdiagonal (n - 1 values)
+        diag: Main diagonal (n values)
+        sup: Superdiagonal (n - 1 values)
+        rhs: Right-hand side
+
+    Returns: numpy array with the solution
+    """
+    return BandedLU(BandedMatrix.from_diagonals(sub, diag, sup), pivoting=False).solve(rhs)
+
+
+def is_narrow_band(A, ratio=0.25):
+    """
+    Whether a dense matrix is worth solving as a band matrix - its band (lower + upper + 1)
+    is at most `ratio` of its order.
+    """
+    lower, upper = bandwidth(A)
+    return lower + upper + 1 <= ratio * len(A)
+
+
+if __name__ == '__main__':
+    """
+    Demonstration of the banded solver on a pentadiagonal system.
+    """
+
+    n = 8
+    A = np.diag(np.full(n, 6.0)) + np.diag(np.full(n - 1, -2.0), 1) + np.diag(np.full(n - 1, -2.0), -1) \
+        + np.diag(np.ones(n - 2), 2) + np.diag(np.ones(n - 2), -2)
+    b = np.arange(1.0, n + 1)
+    banded = BandedMatrix.from_dense(A)
+    print("Bandwidth (lower, upper):", (banded.lower, banded.upper))
+    print("Diagonal-ordered storage:\n", banded.ab)
+    x = solve_banded(banded, b)
+    print("Solution:", x)
+    print("Residual:", np.max(np.abs(A @ x - b)))
@@ -0,0 +1,85 @@
+import time
+
+import numpy as np
+
+
+def solve_batched(A, b):
+    """
+    Solves a stack of independent systems A[s]·x[s] = b[s] with Gaussian elimination and
+    partial pivoting, vectorized over the leading (batch) axis.
+
+    A singular system does not stop the others: it is flagged, and its solution is NaN.
+    Args:
+        A: Array of shape (m, n, n) - m square matrices
+        b: Array of shape (m, n) - one right-hand side per matrix
+
+    Returns: Tuple (x, singular) - x of shape (m, n) and a boolean flag per system
+             (True where a zero pivot was found)
+
+    Raises:
+        ValueError: If the shapes of A and b do not match.
+    """
+    A = np.array(A, dtype=float)
+    b = np.array(b, dtype=float)
+    if A.ndim != 3 or A.shape[1] != A.shape[2]:
+        raise ValueError("A must have shape (m, n, n).")
+    if b.shape != A.shape[:2]:
+        raise ValueError("b must have shape (m, n).")
+
+    m, n, _ = A.shape
+    batch = np.arange(m)
+    singular = np.zeros(m, dtype=bool)
+
+    for i in range(n):
+        # Pivoting: Find the maximum element in the column of every system and swap rows
+        max_row = i + np.argmax(np.abs(A[:, i:, i]), axis=1)
+        singular |= A[batch, max_row, i] == 0
+        row_i = A[:, i].copy()
+        A[:, i] = A[batch, max_row]
+        A[batch, max_row] = row_i
+        b_i = b[:, i].copy()
+        b[:, i] = b[batch, max_row]
+        b[batch, max_row] = b_i
+
+        # Eliminate below the pivot (singular systems divide by 1 and are discarded at the end)
+        pivot = np.where(singular, 1.0, A[:, i, i])
+        factors = A[:, i + 1:, i] / pivot[:, None]
+        A[:, i + 1:, i:] -= factors[:, :, None] * A[:, None, i, i:]
+        b[:, i + 1:] -= factors * b[:, i, None]
+
+    diagonal = np.where(singular[:, None], 1.0, np.diagonal(A, axis1=1, axis2=2))
+    x = np.zeros((m, n))
+    for i in range(n - 1, -1, -1):
+        s = np.einsum("sj,sj->s", A[:, i, i + 1:], x[:, i + 1:])
+        x[:, i] = (b[:, i] - s) / diagonal[:, i]
+
+    x[singular] = np.nan
+    return x, singular
+
+
+if __name__ == '__main__':
+    """
+    Solving many small systems at once compared to one solve_gaussian call per system.
+    """
+    from condition_of_linear_equations import solve_gaussian
+
+    rng = np.random.default_rng(0)
+    m, n = 20000, 3
+    A = rng.standard_normal((m, n, n))
+    A[0] = [[1, 2, 3], [2, 4, 6], [1, 1, 1]]  # a singular system
+    b = rng.standard_normal((m, n))
+
+    start = time.perf_counter()
+    x, singular = solve_batched(A, b)
+    batched_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for s in range(1, m):
+        solve_gaussian(A[s].tolist(), b[s].tolist())
+    loop_time = time.perf_counter() - start
+
+    residual = np.max(np.abs(np.einsum("sij,sj->si", A[~singular], x[~singular]) - b[~singular]))
+    print(f"{m} systems of size {n}x{n}")
+    print(f"solve_batched:           {batched_time:.3f} s, singular systems: {np.flatnonzero(singular)}, "
+          f"max residual: {residual:.2e}")
+    print(f"solve_gaussian per system: {loop_time:.3f} s")
@@ -1,4 +1,11 @@
 import math
+from collections import namedtuple
+
+import numpy as np
+
+# roots - root of every lane (NaN where [a, b] does not bracket a root), iterations - midpoints
+# evaluated per lane, converged - whether the lane reached the tolerance
+BisectionResult = namedtuple("BisectionResult", ["roots", "iterations", "converged"])
 
 def max_steps(a, b, err):
     """
@@ -34,7 +41,8 @@ def bisection_method(f, a, b, tol=1e-6, verbose=True):
     ValueError: If the scalars a and b do not bound a root (f(a) and f(b) must have opposite signs).
     RuntimeError: If the maximum number of iterations is reached without convergence.
     """
-    if f(a) * f(b) >= 0:
+    f_a, f_b = f(a), f(b)
+    if f_a * f_b >= 0:
         raise ValueError("The scalars a and b do not bound a root. f(a) and f(b) must have opposite signs.")
 
     c, k = 0, 0
@@ -50,15 +58,15 @@ def bisection_method(f, a, b, tol=1e-6, verbose=True):
 
         if verbose:
             print("{:<10} {:<15.6f} {:<15.6f} {:<15.6f} {:<15.6f} {:<15.6f} {:<15.6f}".format(
-                k, a, b, f(a), f(b), c, f_c))
+                k, a, b, f_a, f_b, c, f_c))
 
         if abs(f_c) < tol:  # Root found
             return c
 
-        if f_c * f(a) < 0:
-            b = c
+        if f_c * f_a < 0:
+            b, f_b = c, f_c
         else:
-            a = c
+            a, f_a = c, f_c
 
         k += 1
 
@@ -70,6 +78,80 @@ def bisection_method(f, a, b, tol=1e-6, verbose=True):
     return c
 
 
+def bisection_vectorized(f, a, b, tol=1e-6, args=()):
+    """
+    The bisection method of `bisection_method` run on many brackets at once.
+
+    f is called once per iteration, on the midpoints of the lanes that are still active
+    only; lanes leave the active set as soon as they converge, and f(a) is carried from
+    one iteration to the next instead of being evaluated again. Every lane follows the
+    same steps as bisection_method on its own bracket.
+    Parameters:
+    f (function): Vectorized function - f(x, *args) with x and every arg arrays of the same length.
+    a (array): Start of every interval.
+    b (array): End of every interval (a and b may be given in either order).
+    tol (float): Tolerable error, default is 1e-6.
+    args (tuple): Per-lane parameter arrays passed to f, sliced to the active lanes.
+    Returns:
+    BisectionResult(roots, iterations, converged), arrays with the broadcast shape of a and b.
+    Lanes whose interval does not bracket a root get a NaN root and converged False.
+    Raises:
+    ValueError: If tol <= 0.
+    """
+    if tol <= 0:
+        raise ValueError("Invalid input: ensure tol > 0.")
+
+    a, b, *args = np.broadcast_arrays(np.asarray(a, dtype=float), np.asarray(b, dtype=float),
+                                      *[np.asarray(arg) for arg in args])
+    shape = a.shape
+    lo, hi = np.minimum(a, b).ravel(), np.maximum(a, b).ravel()
+    args = [arg.ravel() for arg in args]
+    lanes = lo.size
+    roots = np.full(lanes, np.nan)
+    iterations = np.zeros(lanes, dtype=int)
+    converged = np.zeros(lanes, dtype=bool)
+
+    def evaluate(x, lane_args):
+        return np.broadcast_to(np.asarray(f(x, *lane_args), dtype=float), x.shape)
+
+    f_lo = evaluate(lo, args)
+    f_hi = evaluate(hi, args)
+    width = hi - lo
+    # Lanes narrower than tol from the start are done without iterating
+    narrow = (f_lo * f_hi < 0) & (width <= tol)
+    roots[narrow] = (lo[narrow] + hi[narrow]) / 2
+    converged[narrow] = True
+
+    active = np.flatnonzero((f_lo * f_hi < 0) & (width > tol))
+    lo, hi, f_lo = lo[active], hi[active], f_lo[active]
+    args = [arg[active] for arg in args]
+    steps = np.ceil(np.log2((hi - lo) / tol))
+
+    k = 0
+    while len(active):
+        c = (lo + hi) / 2  # Midpoint
+        f_c = evaluate(c, args)
+        k += 1
+
+        left = f_c * f_lo < 0
+        hi = np.where(left, c, hi)
+        lo = np.where(left, lo, c)
+        f_lo = np.where(left, f_lo, f_c)
+
+        reached = (np.abs(f_c) < tol) | (hi - lo <= tol)
+        done = reached | (k >= steps)
+        finished = active[done]
+        roots[finished] = c[done]
+        iterations[finished] = k
+        converged[finished] = reached[done]
+
+        keep = ~done
+        active, lo, hi, f_lo, steps = active[keep], lo[keep], hi[keep], f_lo[keep], steps[keep]
+        args = [arg[keep] for arg in args]
+
+    return BisectionResult(roots.reshape(shape), iterations.reshape(shape), converged.reshape(shape))
+
+
 if __name__ == '__main__':
     # Define the function
     f = lambda x:  x**3 - x-1  # Example: Change this to your desired function
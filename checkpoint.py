@@ -0,0 +1,163 @@
+import os
+import struct
+import zlib
+from collections import namedtuple
+
+import numpy as np
+
+# x - the iterate, iterations - sweeps done to reach it, history - max |x_k - x_(k-1)| of
+# every sweep (for Jacobi this is the diagonally scaled residual max |D⁻¹(b - A x)|)
+Checkpoint = namedtuple("Checkpoint", ["x", "iterations", "history"])
+
+# magic, format version, n, iterations, length of the history
+HEADER = struct.Struct("<4sHQQQ")
+MAGIC = b"NACP"
+VERSION = 1
+
+
+def save_checkpoint(path, x, iterations, history):
+    """
+    Writes a checkpoint as a compact binary file: a fixed header, the iterate and the
+    history as little-endian float64, and a CRC32 of everything before it. The file is
+    written next to its final name and then renamed, so a preempted write never leaves a
+    truncated checkpoint behind.
+    Args:
+        path: File name
+        x: Iterate (vector n)
+        iterations: Sweeps done
+        history: Max step of every sweep
+    """
+    x = np.ascontiguousarray(x, dtype="<f8")
+    history = np.ascontiguousarray(history, dtype="<f8")
+    payload = HEADER.pack(MAGIC, VERSION, len(x), iterations, len(history)) + x.tobytes() + history.tobytes()
+    temporary = f"{path}.tmp"
+    with open(temporary, "wb") as file:
+        file.write(payload + struct.pack("<I", zlib.crc32(payload)))
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(temporary, path)
+
+
+def load_checkpoint(path):
+    """
+    Reads a file written by save_checkpoint.
+    Args:
+        path: File name
+
+    Returns: Checkpoint(x, iterations, history)
+
+    Raises:
+        ValueError: If the file is not a checkpoint or is damaged.
+    """
+    with open(path, "rb") as file:
+        content = file.read()
+    if len(content) < HEADER.size + 4:
+        raise ValueError(f"{path} is not a checkpoint file.")
+    magic, version, n, iterations, length = HEADER.unpack_from(content)
+    if magic != MAGIC or version != VERSION or len(content) != HEADER.size + 8 * (n + length) + 4:
+        raise ValueError(f"{path} is not a checkpoint file.")
+    if struct.unpack("<I", content[-4:])[0] != zlib.crc32(content[:-4]):
+        raise ValueError(f"Checkpoint {path} is damaged (checksum mismatch).")
+    values = np.frombuffer(content, dtype="<f8", count=n + length, offset=HEADER.size).astype(float)
+    return Checkpoint(values[:n], iterations, values[n:])
+
+
+def warm_start(source, n):
+    """
+    Starting vector of a solve from whatever a previous solve left behind.
+    Args:
+        source: None (zeros), a vector (e.g. the tuple returned by gauss_seidel), a
+                Checkpoint, or the path of a checkpoint file
+        n: Number of unknowns of the new solve
+
+    Returns: numpy array of length n
+
+    Raises:
+        ValueError: If the source does not have n values.
+    """
+    if source is None:
+        return np.zeros(n)
+    if isinstance(source, (str, os.PathLike)):
+        source = load_checkpoint(source)
+    if isinstance(source, Checkpoint):
+        source = source.x
+    x = np.array(source, dtype=float)
+    if x.shape != (n,):
+        raise ValueError(f"The starting vector must have {n} values.")
+    return x
+
+
+class Checkpointer:
+    """
+    Keeps the step history of a running solve and saves a checkpoint every `every` sweeps.
+    With resume=True an existing checkpoint file is loaded first, and the solve continues
+    from its iterate, sweep count and history.
+    """
+
+    def __init__(self, path, n, every=10, resume=False):
+        """
+        Args:
+            path: Checkpoint file
+            n: Number of unknowns
+            every: Sweeps between two checkpoints
+            resume: Load the checkpoint file if it exists
+
+        Raises:
+            ValueError: If every < 1, or the checkpoint to resume from has another size.
+        """
+        if every < 1:
+            raise ValueError("every must be at least 1.")
+        self.path = path
+        self.every = every
+        self.start = None
+        self.iterations = 0
+        self.history = []
+        if resume and os.path.exists(path):
+            checkpoint = load_checkpoint(path)
+            if len(checkpoint.x) != n:
+                raise ValueError(f"Checkpoint {path} is for {len(checkpoint.x)} unknowns, not {n}.")
+            self.start = checkpoint.x
+            self.iterations = checkpoint.iterations
+            self.history = checkpoint.history.tolist()
+
+    def record(self, k, x, step):
+        """Records sweep k (with its max step) and saves a checkpoint when one is due"""
+        self.iterations = k
+        self.history.append(float(step))
+        if k % self.every == 0:
+            self.save(x)
+
+    def save(self, x):
+        save_checkpoint(self.path, x, self.iterations, self.history)
+
+
+if __name__ == '__main__':
+    """
+    A Gauss-Seidel solve interrupted after 20 sweeps and resumed from its checkpoint, and
+    a second solve with a nearby right-hand side warm-started from the first solution.
+    """
+    import contextlib
+    import io
+    import tempfile
+
+    from GaussAndJacobi import gauss_seidel
+    from sparse_matrix import poisson_2d
+
+    A = poisson_2d(20)
+    b = np.ones(400)
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "solve.ckpt")
+        with contextlib.redirect_stdout(io.StringIO()):
+            gauss_seidel(A, b, None, TOL=1e-8, N=20, verbose=False, checkpoint=path, checkpoint_every=5)
+        saved = load_checkpoint(path)
+        print(f"Interrupted: {saved.iterations} sweeps saved, {os.path.getsize(path)} bytes, "
+              f"last step {saved.history[-1]:.2e}")
+        with contextlib.redirect_stdout(io.StringIO()):
+            x = gauss_seidel(A, b, None, TOL=1e-8, N=2000, verbose=False, checkpoint=path, resume=True)
+        print(f"Resumed and converged after {load_checkpoint(path).iterations} sweeps in total")
+
+        b_near = b + 0.01
+        for name, start in [("zeros", None), ("warm start", x)]:
+            with contextlib.redirect_stdout(io.StringIO()):
+                gauss_seidel(A, b_near, start, TOL=1e-8, N=2000, verbose=False, checkpoint=path)
+            print(f"{name}: {load_checkpoint(path).iterations} sweeps")
@@ -1,12 +1,18 @@
-def norm(mat):
-    """Computes the max row sum (infinity norm) of a matrix"""
-    size = len(mat)
-    max_row = 0
-    for row in range(size):
-        sum_row = sum(abs(mat[row][col]) for col in range(size))
-        if sum_row > max_row:
-            max_row = sum_row
-    return max_row
+from collections import namedtuple
+
+import numpy as np
+
+from banded_solver import BandedMatrix, is_narrow_band, solve_banded
+from lu_factorization import LUFactorization, as_square_array
+from norms import matrix_norm
+
+# Below this order the dense elimination is as fast as detecting the band
+BANDED_MIN_ORDER = 64
+
+
+def norm(mat, ord=np.inf):
+    """Computes a matrix norm (the max row sum by default) - see norms.matrix_norm"""
+    return matrix_norm(mat, ord)
 
 
 def print_matrix(mat):
@@ -22,46 +28,122 @@ def identity_matrix(size):
 
 
 
-def solve_gaussian(A, b):
-    """Solves Ax = b using Gaussian elimination with pivoting"""
+def solve_gaussian(A, b, engine="row", precision="double", cache=None, return_info=False):
+    """Solves Ax = b using Gaussian elimination with pivoting
+
+    The elimination is done by `LUFactorization`; to solve the same A against many
+    right-hand sides, factor it once and call its `solve` method directly; when A
+    changes by a few rows or columns between solves, `low_rank_update.LowRankUpdate`
+    updates the solution in O(n²·k) instead of refactoring.
+    engine selects the LU kernel: "row" (default) or "blocked" for large systems.
+    precision="mixed" factors in single precision and refines to double accuracy
+    (see `mixed_precision_solve`).
+    A `BandedMatrix`, or a large dense matrix with a narrow band, is solved in O(n·bw²)
+    by `banded_solver` instead.
+    With a `factorization_cache.FactorizationCache` as cache, the LU factors of a matrix
+    seen before are reused (the banded and mixed-precision paths do not use the cache).
+    The solution is returned as a list. With return_info=True a RefinementResult(x, steps,
+    precision) is returned instead, x being that list: steps is the number of refinement
+    steps, and precision is "mixed", or "double" for a double-precision solve (steps 0)
+    or when the mixed mode fell back to one.
+    """
+    result = _solve_gaussian(A, b, engine, precision, cache)
+    if isinstance(result, RefinementResult):
+        result = result._replace(x=result.x.tolist())
+    else:
+        result = RefinementResult(result, 0, "double")
+    return result if return_info else result.x
+
+
+def _solve_gaussian(A, b, engine, precision, cache):
+    """The paths of solve_gaussian - a list, or the RefinementResult of the mixed mode"""
+    if isinstance(A, BandedMatrix):
+        return solve_banded(A, b).tolist()
+
     n = len(A)
     if n == 0 or len(b) == 0:
         raise ValueError("Matrix or vector is empty.")
     if any(len(row) != n for row in A):
         raise ValueError("Matrix is not square.")
 
-    A = [row[:] for row in A]
-    b = b[:]
+    if precision == "mixed":
+        return mixed_precision_solve(A, b, engine)
+    if precision != "double":
+        raise ValueError("precision must be 'double' or 'mixed'.")
+    if n >= BANDED_MIN_ORDER and is_narrow_band(A):
+        return solve_banded(A, b).tolist()
+    if cache is not None:
+        return cache.factorization(A, engine).solve(b).tolist()
+    return LUFactorization(A, engine=engine).solve(b).tolist()
 
-    for i in range(n):
-        # Pivoting: Find the maximum element in the column and swap rows
-        max_row = max(range(i, n), key=lambda r: abs(A[r][i]))
-        if A[max_row][i] == 0:
-            raise ValueError("Matrix is singular – zero on diagonal.")
-        if max_row != i:
-            A[i], A[max_row] = A[max_row], A[i]
-            b[i], b[max_row] = b[max_row], b[i]
 
-        # Normalize pivot row
-        for j in range(i + 1, n):
-            factor = A[j][i] / A[i][i]
-            for k in range(i, n):
-                A[j][k] -= factor * A[i][k]
-            b[j] -= factor * b[i]
+# x - the solution, steps - refinement steps done, precision - "mixed", or "double" after a fallback
+RefinementResult = namedtuple("RefinementResult", ["x", "steps", "precision"])
 
-    x = [0] * n
-    for i in range(n - 1, -1, -1):
-        s = sum(A[i][j] * x[j] for j in range(i + 1, n))
-        x[i] = (b[i] - s) / A[i][i]
 
-    return x
+def mixed_precision_solve(A, b, engine="row", max_steps=10):
+    """
+    Solves Ax = b by factoring A in float32 and refining the solution with float64 residuals,
+    x <- x + A⁻¹(b - Ax), where each correction reuses the float32 factors.
 
+    Refinement converges when cond(A)·u32 is well below 1 (u32 ≈ 6e-8). If the estimated
+    condition number is too large, or the residual stops decreasing, the system is solved
+    again with a float64 factorization.
 
-def inverse(A):
+    Args:
+        A (list of float lists): Square matrix
+        b (list of floats): Right-hand side
+        engine (str): LU kernel, "row" or "blocked"
+        max_steps (int): Maximum number of refinement steps
+
+    Returns:
+        RefinementResult: (x, steps, precision) - precision is "double" when it fell back
+    Raises:
+        ValueError: If the matrix A is not square or is singular (zero on diagonal).
+    """
+    A = as_square_array(A)
+    b = np.asarray(b, dtype=float)
+
+    def double_solve(steps):
+        return RefinementResult(LUFactorization(A, engine=engine).solve(b), steps, "double")
+
+    try:
+        factorization = LUFactorization(A, engine=engine, dtype=np.float32)
+    except ValueError:
+        # A zero pivot in single precision may just be rounding
+        return double_solve(0)
+
+    unit_roundoff = np.finfo(np.float32).eps / 2
+    if norm(A) * factorization.inverse_norm_estimate(np.inf) * unit_roundoff > 0.1:
+        return double_solve(0)
+
+    x = factorization.solve(b).astype(float)
+    residual_norm = np.inf
+    for step in range(1, max_steps + 1):
+        r = b - A @ x
+        new_residual_norm = np.max(np.abs(r))
+        if not np.isfinite(new_residual_norm) or new_residual_norm > 0.5 * residual_norm:
+            # Not contracting - either converged to rounding level or diverging
+            if new_residual_norm <= np.finfo(float).eps * norm(A) * np.max(np.abs(x)) * len(b):
+                return RefinementResult(x, step - 1, "mixed")
+            return double_solve(step - 1)
+        residual_norm = new_residual_norm
+
+        correction = factorization.solve(r).astype(float)
+        x += correction
+        if np.max(np.abs(correction)) <= np.finfo(float).eps * np.max(np.abs(x)):
+            return RefinementResult(x, step, "mixed")
+
+    return RefinementResult(x, max_steps, "mixed")
+
+
+def inverse(A, engine=None):
     """Computes the inverse of matrix A using Gauss-Jordan elimination with pivoting
 
     Parameters:
     A (list of float lists ): Square matrix to be inverted
+    engine (str): None for Gauss-Jordan elimination, or an `LUFactorization` engine
+                  ("row" or "blocked") to factor A and solve against the identity
     Returns:
     list of float lists  : Inverse of matrix A
     """
@@ -69,6 +151,9 @@ def inverse(A):
     if n == 0 or any(len(row) != n for row in A):
         raise ValueError("Matrix is empty or not square.")
 
+    if engine is not None:
+        return LUFactorization(A, engine=engine).solve(np.identity(n)).tolist()
+
     A = [row[:] for row in A]
     I = identity_matrix(n)
 
@@ -97,13 +182,41 @@ def inverse(A):
 
     return I
 
-def condition_number(A):
+def condition_estimate(A, factorization=None):
+    """
+    Estimates the infinity-norm condition number of A without forming its inverse.
+
+    ‖A⁻¹‖∞ is estimated from one LU factorization and a few triangular solves, so this is
+    the quiet, return-only variant meant for screening many matrices.
+
+    Args:
+        A (list of float lists)
+        factorization (LUFactorization): Existing factorization of A to reuse (optional)
+
+    Returns:
+        float: Estimated condition number of the matrix A
+    Raises:
+        ValueError: If the matrix A is not square or is singular (zero on diagonal).
+    """
+    if factorization is None:
+        factorization = LUFactorization(A)
+    return norm(A) * factorization.inverse_norm_estimate(np.inf)
+
+
+def condition_number(A, verbose=True, estimate=False, ord=np.inf, cache=None):
     """
-Calculates the condition number of matrix A using infinity norm.
-    The condition number is defined as the product of the infinity norm of A and the infinity norm of its inverse.
+Calculates the condition number of matrix A in the norm chosen by `ord` (infinity norm by default).
+    The condition number is defined as the product of the norm of A and the norm of its inverse.
 
     Args:
         A (list of float lists)
+        verbose (bool): If True, prints the matrices, the norms and the assessment.
+        estimate (bool): If True, ‖A⁻¹‖ is estimated from an LU factorization instead of
+                         computing the inverse (see `condition_estimate`).
+        ord: Norm to use, passed to norms.matrix_norm - np.inf (default, maximum absolute
+             row sum), 1, "fro" or 2 (estimated); the estimate supports 1 and np.inf only.
+        cache (FactorizationCache): Reuse the LU factors and ‖A⁻¹‖ estimates of matrices
+             seen before (optional); the inverse is then formed from the cached factors.
 
 
     Returns:
@@ -112,19 +225,34 @@ Calculates the condition number of matrix A using infinity norm.
         ValueError: If the matrix A is not square or is singular (zero on diagonal).
 
     """
-    norm_A = norm(A)
-    A_inv = inverse(A)
-    norm_A_inv = norm(A_inv)
+    norm_A = norm(A, ord)
+    if estimate:
+        A_inv = None
+        if cache is not None:
+            norm_A_inv = cache.inverse_norm(A, ord)
+        else:
+            norm_A_inv = LUFactorization(A).inverse_norm_estimate(ord)
+    else:
+        if cache is not None:
+            A_inv = cache.factorization(A).solve(np.identity(len(A))).tolist()
+        else:
+            A_inv = inverse(A)
+        norm_A_inv = norm(A_inv, ord)
     cond = norm_A * norm_A_inv
 
+    if not verbose:
+        return cond
+
     print("\nMatrix A:")
     print_matrix(A)
 
-    print("Inverse of A:")
-    print_matrix(A_inv)
+    if A_inv is not None:
+        print("Inverse of A:")
+        print_matrix(A_inv)
 
-    print("‖A‖∞ =", norm_A)
-    print("‖A⁻¹‖∞ =", norm_A_inv)
+    suffix = {1: "₁", 2: "₂", "fro": "F"}.get(ord, "∞")
+    print(f"‖A‖{suffix} =", norm_A)
+    print(f"‖A⁻¹‖{suffix} =", norm_A_inv)
     print("Condition number =", cond)
 
     if cond < 10:
@@ -1,5 +1,6 @@
 import numpy as np
 import matplotlib.pyplot as plt
+from banded_solver import solve_tridiagonal
 from colors import bcolors
 from math import pi
 
@@ -33,24 +34,16 @@ def cubicSplineInterpolation(xList, yList, point):
     for i in range(1, n):
         alpha[i - 1] = (3 / h[i] * (yList[i + 1] - yList[i]) - 3 / h[i - 1] * (yList[i] - yList[i - 1]))
 
-    l = [1] + [0] * n
-    mu = [0] * n
-    z = [0] * (n + 1)
+    # Natural spline: c[0] = c[n] = 0 and a tridiagonal system for the interior c[i]
+    sub = h[:n - 1] + [0]
+    diag = [1] + [2 * (xList[i + 1] - xList[i - 1]) for i in range(1, n)] + [1]
+    sup = [0] + h[1:]
+    c = solve_tridiagonal(sub, diag, sup, [0] + alpha + [0]).tolist()
 
-    for i in range(1, n):
-        l[i] = 2 * (xList[i + 1] - xList[i - 1]) - h[i - 1] * mu[i - 1]
-        mu[i] = h[i] / l[i]
-        z[i] = (alpha[i - 1] - h[i - 1] * z[i - 1]) / l[i]
-
-    l[n] = 1
-    z[n] = 0
-
-    c = [0] * (n + 1)
     b = [0] * n
     d = [0] * n
 
     for j in range(n - 1, -1, -1):
-        c[j] = z[j] - mu[j] * c[j + 1]
         b[j] = (yList[j + 1] - yList[j]) / h[j] - h[j] * (c[j + 1] + 2 * c[j]) / 3
         d[j] = (c[j + 1] - c[j]) / (3 * h[j])
 
@@ -0,0 +1,142 @@
+import heapq
+
+import numpy as np
+
+from preconditioners import as_csr
+from sparse_matrix import CSRMatrix
+
+
+def maximum_product_matching(A, scale=False):
+    """
+    Row permutation that puts a maximum-product set of entries on the diagonal (the
+    objective of MC64 job 5), for dense or sparse input.
+
+    With c_ij = log(max_k |a_kj|) - log|a_ij| the problem is a minimum-cost assignment,
+    solved by successive shortest augmenting paths (Dijkstra with a heap over the stored
+    entries, so each augmentation is O(nnz log n)) after a cheap greedy start. The dual
+    potentials u, v of the assignment give the MC64 scaling.
+    Args:
+        A: Square matrix - 2D list, numpy array or CSRMatrix
+        scale: If True, also return row and column scaling factors
+
+    Returns: perm - A[perm] (row i of the result is row perm[i] of A) has the matched entries
+             on the diagonal; with scale=True a tuple (perm, row_scale, col_scale) such that
+             diag(row_scale)·A·diag(col_scale) has entries of absolute value <= 1 and 1 on the
+             matched entries
+
+    Raises:
+        ValueError: If the matrix is not square or is structurally singular (no permutation
+                    gives a zero-free diagonal).
+    """
+    csr = as_csr(A)
+    n = len(csr)
+    if csr.shape != (n, n):
+        raise ValueError("Matrix is not square.")
+
+    # Drop explicit zeros - they cannot be matched
+    keep = csr.data != 0
+    rows, cols, values = csr.row_ids()[keep], csr.indices[keep], np.abs(csr.data[keep])
+    column_max = np.zeros(n)
+    np.maximum.at(column_max, cols, values)
+    if np.any(column_max == 0):
+        raise ValueError("Matrix is structurally singular.")
+    cost = np.log(column_max[cols]) - np.log(values)
+    indptr = np.concatenate(([0], np.cumsum(np.bincount(rows, minlength=n))))
+    if np.any(np.diff(indptr) == 0):
+        raise ValueError("Matrix is structurally singular.")
+
+    # Feasible start: u_i = min_j c_ij, v = 0, and a greedy matching on zero reduced cost
+    u = np.minimum.reduceat(cost, indptr[:-1])
+    v = np.zeros(n)
+    row_of = np.full(n, -1)      # row matched to column j
+    col_of = np.full(n, -1)      # column matched to row i
+    for i in range(n):
+        for p in range(indptr[i], indptr[i + 1]):
+            if row_of[cols[p]] < 0 and cost[p] - u[i] <= 0:
+                row_of[cols[p]], col_of[i] = i, cols[p]
+                break
+
+    for start in np.flatnonzero(col_of < 0):
+        column_dist = {}
+        previous_row = {}
+        row_dist = {start: 0.0}
+        finished = []
+        heap = []
+        done = set()
+
+        def relax(i, d):
+            for p in range(indptr[i], indptr[i + 1]):
+                j = cols[p]
+                if j in done:
+                    continue
+                candidate = d + cost[p] - u[i] - v[j]
+                if candidate < column_dist.get(j, np.inf):
+                    column_dist[j] = candidate
+                    previous_row[j] = i
+                    heapq.heappush(heap, (candidate, j))
+
+        relax(start, 0.0)
+        sink, sink_dist = -1, np.inf
+        while heap:
+            d, j = heapq.heappop(heap)
+            if j in done or d > column_dist[j]:
+                continue
+            done.add(j)
+            finished.append(j)
+            if row_of[j] < 0:
+                sink, sink_dist = j, d
+                break
+            # The matched edge has zero reduced cost
+            row_dist[row_of[j]] = d
+            relax(row_of[j], d)
+
+        if sink < 0:
+            raise ValueError("Matrix is structurally singular.")
+
+        # Update the potentials of the settled nodes, keeping the reduced costs non-negative
+        for i, d in row_dist.items():
+            u[i] += sink_dist - d
+        for j in finished:
+            v[j] -= sink_dist - column_dist[j]
+
+        # Augment along the shortest path
+        j = sink
+        while True:
+            i = previous_row[j]
+            next_j = col_of[i]
+            row_of[j], col_of[i] = i, j
+            if i == start:
+                break
+            j = next_j
+
+    perm = row_of.copy()
+    if not scale:
+        return perm
+    return perm, np.exp(u), np.exp(v) / column_max
+
+
+def matching_permutation_fix(matrix, b):
+    """
+    Reorders the rows of a matrix (and the vector) by maximum_product_matching.
+    :param matrix: A square matrix (2D list, numpy array or CSRMatrix)
+    :param b: A vector (1D list or numpy array)
+    :return: A tuple containing the reordered matrix (same kind as the input) and vector
+    """
+    perm = maximum_product_matching(matrix)
+    b = np.asarray(b, dtype=float)[perm]
+    if isinstance(matrix, CSRMatrix):
+        return matrix.permute_rows(perm), b
+    return np.asarray(matrix, dtype=float)[perm], b
+
+
+if __name__ == '__main__':
+    """
+    Demonstration on a matrix that the greedy column search of GaussAndJacobi.fix cannot
+    make diagonally dominant.
+    """
+
+    A = [[1, 1, 3], [4, 9, 1], [3, 1, 1]]
+    perm, row_scale, col_scale = maximum_product_matching(A, scale=True)
+    print("Row order:", perm)
+    print("Reordered matrix:\n", np.asarray(A, dtype=float)[perm])
+    print("Scaled matrix:\n", (row_scale[:, None] * np.asarray(A, dtype=float) * col_scale)[perm])
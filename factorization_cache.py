@@ -0,0 +1,140 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict, namedtuple
+
+import numpy as np
+
+from lu_factorization import LUFactorization, as_square_array
+
+# hits / misses - lookups that found / did not find the matrix, evictions - entries dropped
+# to stay under the byte limit, entries and nbytes - the current content
+CacheStats = namedtuple("CacheStats", ["hits", "misses", "evictions", "entries", "nbytes"])
+
+
+def fingerprint(A):
+    """
+    Key of a matrix: a BLAKE2 hash of its own bytes together with its shape and dtype, so
+    equal matrices passed as different objects (or as lists) share one entry. The bytes are
+    hashed as stored, without a cast: the same values in another dtype get their own entry.
+    Returns: Tuple (digest, shape, dtype)
+    """
+    a = np.ascontiguousarray(A)
+    return hashlib.blake2b(a.tobytes(), digest_size=16).hexdigest(), a.shape, a.dtype.str
+
+
+class FactorizationCache:
+    """
+    Opt-in cache of LU factorizations and inverse-norm estimates, keyed by the matrix
+    fingerprint and the LU engine.
+
+    The least recently used entries are evicted once the factors held pass `max_bytes`
+    (an entry larger than the whole budget is returned but not kept). Lookups are
+    thread-safe; the factorization itself runs outside the lock, so two threads missing on
+    the same matrix at once may both factor it and the first one stored is kept.
+    """
+
+    def __init__(self, max_bytes=64 * 2 ** 20):
+        """
+        Args:
+            max_bytes: Upper bound on the bytes of the cached factors
+        """
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def factorization(self, A, engine="row"):
+        """
+        The LU factorization of A, computed on the first request only.
+        Args:
+            A: Matrix nxn (list of lists or numpy array)
+            engine: LU engine (see LUFactorization)
+
+        Returns: LUFactorization (shared between callers - do not modify it)
+
+        Raises:
+            ValueError: If the matrix is empty, not square or singular.
+        """
+        return self._entry(A, engine)["factorization"]
+
+    def inverse_norm(self, A, ord=np.inf, engine="row"):
+        """
+        The estimate of ‖A⁻¹‖ (LUFactorization.inverse_norm_estimate), computed on the first
+        request only.
+        Args:
+            A: Matrix nxn (list of lists or numpy array)
+            ord: 1 or np.inf
+            engine: LU engine (see LUFactorization)
+
+        Returns: float
+        """
+        entry = self._entry(A, engine)
+        estimates = entry["inverse_norms"]
+        if ord not in estimates:
+            estimates[ord] = entry["factorization"].inverse_norm_estimate(ord)
+        return estimates[ord]
+
+    def _entry(self, A, engine):
+        key = fingerprint(A) + (engine,)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry
+            self.misses += 1
+
+        factorization = LUFactorization(as_square_array(A), engine=engine)
+        entry = {"factorization": factorization, "inverse_norms": {},
+                 "nbytes": factorization.lu.nbytes + factorization.perm.nbytes}
+
+        with self._lock:
+            if key in self._entries:
+                return self._entries[key]
+            if entry["nbytes"] > self.max_bytes:
+                return entry
+            self._entries[key] = entry
+            self.nbytes += entry["nbytes"]
+            while self.nbytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self.nbytes -= evicted["nbytes"]
+                self.evictions += 1
+        return entry
+
+    def stats(self):
+        """Returns: CacheStats"""
+        with self._lock:
+            return CacheStats(self.hits, self.misses, self.evictions, len(self._entries), self.nbytes)
+
+    def clear(self):
+        """Drops all entries (the statistics are kept)"""
+        with self._lock:
+            self._entries.clear()
+            self.nbytes = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+
+if __name__ == '__main__':
+    """
+    Repeated solves and condition estimates of the same matrices with and without a cache.
+    """
+    from condition_of_linear_equations import condition_number, solve_gaussian
+
+    rng = np.random.default_rng(0)
+    matrices = [rng.standard_normal((300, 300)) + 300 * np.eye(300) for _ in range(3)]
+    b = np.ones(300)
+
+    for cache in (None, FactorizationCache()):
+        start = time.perf_counter()
+        for _ in range(5):
+            for A in matrices:
+                solve_gaussian(A, b, cache=cache)
+                condition_number(A, verbose=False, estimate=True, cache=cache)
+        print(f"cache={'off' if cache is None else 'on'}: {time.perf_counter() - start:.3f} s",
+              "" if cache is None else cache.stats())
@@ -0,0 +1,81 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+
+def multiply(A, B, workers=1, block_rows=256):
+    """
+    Matrix product that dispatches on the shapes of its operands:
+    mat-mat (n x m)·(m x p), mat-vec (n x m)·(m,) and batched (s x n x m)·(s x m x p) or
+    (s x n x m)·(m x p). The products run in numpy's BLAS (cache-blocked and vectorized).
+    With workers > 1 a mat-mat product is split into panels of block_rows rows
+    run on a thread pool; small operands (fewer than 2 * block_rows rows) are not split.
+    Args:
+        A: Matrix (list of lists or numpy array), or a stack of matrices
+        B: Matrix, vector or stack of matrices
+        workers: Number of threads for large mat-mat products
+        block_rows: Rows per panel of the threaded product
+
+    Returns: numpy array with the product (integer inputs give an integer result)
+
+    Raises:
+        ValueError: If the dimensions are incompatible for multiplication.
+    """
+    A = np.asarray(A)
+    B = np.asarray(B)
+    if A.ndim not in (2, 3) or B.ndim not in (1, 2, 3) or A.shape[-1] != B.shape[-2 if B.ndim > 1 else 0]:
+        raise ValueError("Matrix dimensions are incompatible for multiplication.")
+    if B.ndim == 3 and (A.ndim != 3 or A.shape[0] != B.shape[0]):
+        raise ValueError("Matrix dimensions are incompatible for multiplication.")
+
+    if workers <= 1 or A.ndim != 2 or B.ndim != 2 or A.shape[0] < 2 * block_rows:
+        return A @ B
+
+    result = np.empty((A.shape[0], B.shape[1]), dtype=np.result_type(A, B))
+
+    def panel(start):
+        result[start:start + block_rows] = A[start:start + block_rows] @ B
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        list(pool.map(panel, range(0, A.shape[0], block_rows)))
+    return result
+
+
+def multiply_gflops(n, seconds):
+    """Rate of an n x n matrix product in GFLOP/s (2·n³ floating point operations)"""
+    return 2 * n ** 3 / seconds / 1e9
+
+
+if __name__ == '__main__':
+    """
+    Benchmark of the triple-loop list multiply that MultiplyMatrix / matrix_multiply /
+    MulMatrixVector used before, against `multiply` on one and four threads.
+    """
+
+    def triple_loop(matrixA, matrixB):
+        result = [[0 for y in range(len(matrixB[0]))] for x in range(len(matrixA))]
+        for i in range(len(matrixA)):
+            for j in range(len(matrixB[0])):
+                for k in range(len(matrixB)):
+                    result[i][j] += matrixA[i][k] * matrixB[k][j]
+        return result
+
+    rng = np.random.default_rng(0)
+    print("{:<8}{:>22}{:>22}{:>22}".format("n", "triple loop", "multiply x1", "multiply x4"))
+    print("-" * 74)
+    for n in [50, 100, 200, 500, 1000, 2000]:
+        A = rng.standard_normal((n, n))
+        B = rng.standard_normal((n, n))
+        row = "{:<8}".format(n)
+        if n <= 200:
+            start = time.perf_counter()
+            triple_loop(A.tolist(), B.tolist())
+            row += "{:>22}".format(f"{multiply_gflops(n, time.perf_counter() - start):.3f} GFLOP/s")
+        else:
+            row += "{:>22}".format("(skipped)")
+        for workers in (1, 4):
+            start = time.perf_counter()
+            multiply(A, B, workers=workers)
+            row += "{:>22}".format(f"{multiply_gflops(n, time.perf_counter() - start):.3f} GFLOP/s")
+        print(row)
@@ -0,0 +1,228 @@
+import numpy as np
+
+from GaussAndJacobi import is_diagonally_dominant
+from sparse_matrix import CSRMatrix
+from stationary_solvers import IterationResult, as_operator_matrix, matrix_diagonal
+
+
+def as_matvec(A):
+    """
+    Turns A into a matrix-vector product function.
+    :param A: 2D list, numpy array, CSRMatrix, an object with a matvec method, or a callable x -> A·x
+    :return: Tuple (matvec, matrix) - matrix is the explicit matrix, or None for a matrix-free operator
+    """
+    if callable(A) and not hasattr(A, "matvec"):
+        return A, None
+    if hasattr(A, "matvec"):
+        return A.matvec, A if isinstance(A, CSRMatrix) else None
+    A = as_operator_matrix(A)
+    return (lambda x: A @ x), A
+
+
+def default_preconditioner(matrix):
+    """
+    Picks the preconditioner used when none is given: Jacobi (division by the diagonal)
+    for a diagonally dominant matrix, where the diagonal carries most of the operator,
+    and none otherwise or for matrix-free operators.
+    :param matrix: Explicit matrix, or None
+    :return: Callable r -> M^-1 r
+    """
+    if matrix is None:
+        return lambda r: r
+    if isinstance(matrix, np.ndarray):
+        # Vectorized check - is_diagonally_dominant walks a dense matrix element by element
+        magnitude = np.abs(np.diag(matrix))
+        dominant = bool(np.all(magnitude > np.sum(np.abs(matrix), axis=1) - magnitude))
+    else:
+        dominant = is_diagonally_dominant(matrix)
+    if dominant:
+        diagonal = matrix_diagonal(matrix)
+        return lambda r: r / diagonal
+    return lambda r: r
+
+
+def as_preconditioner(M, A, matrix):
+    """
+    :param M: None (see default_preconditioner), a Preconditioner (set up for A here, which is
+              cached per matrix) or a callable r -> M^-1 r
+    :param A: The operator as passed by the caller
+    :param matrix: Explicit matrix, or None for a matrix-free operator
+    :return: Callable r -> M^-1 r
+    """
+    if M is None:
+        return default_preconditioner(matrix)
+    if hasattr(M, "setup"):
+        if matrix is None:
+            raise ValueError("A Preconditioner needs an explicit matrix to set up.")
+        return M.setup(A).apply
+    return M
+
+
+def start_vector(b, x0):
+    """Returns (b, x) as float arrays, x a copy of x0 or zeros"""
+    b = np.asarray(b, dtype=float)
+    x = np.zeros_like(b) if x0 is None else np.array(x0, dtype=float)
+    if x.shape != b.shape:
+        raise ValueError("x0 must have the same shape as b.")
+    return b, x
+
+
+def pcg(A, b, x0=None, TOL=0.00001, N=200, M=None):
+    """
+    Preconditioned Conjugate Gradient method for symmetric positive definite systems Ax = b.
+    Args:
+        A: Matrix (2D list, numpy array, CSRMatrix) or matrix-free operator (see as_matvec)
+        b: Vector n
+        x0: Initial guess (zeros if None)
+        TOL: Relative tolerance - stop when ||b - Ax||2 <= TOL * ||b||2 (default is 0.00001).
+        N: Maximum number of iterations (default is 200).
+        M: Preconditioner object or callable r -> M^-1 r; chosen by default_preconditioner if None
+
+    Returns: IterationResult(x, iterations, converged)
+
+    Raises:
+        ValueError: If A turns out not to be positive definite.
+    """
+    matvec, matrix = as_matvec(A)
+    precondition = as_preconditioner(M, A, matrix)
+    b, x = start_vector(b, x0)
+    threshold = TOL * (np.linalg.norm(b) or 1.0)
+
+    r = b - matvec(x)
+    if np.linalg.norm(r) <= threshold:
+        return IterationResult(x, 0, True)
+    z = precondition(r)
+    p = z.copy()
+    rz = r @ z
+
+    for k in range(1, N + 1):
+        Ap = matvec(p)
+        curvature = p @ Ap
+        if curvature <= 0:
+            raise ValueError("Matrix is not positive definite.")
+        alpha = rz / curvature
+        x += alpha * p
+        r -= alpha * Ap
+        if np.linalg.norm(r) <= threshold:
+            return IterationResult(x, k, True)
+
+        z = precondition(r)
+        rz_new = r @ z
+        p = z + (rz_new / rz) * p
+        rz = rz_new
+
+    return IterationResult(x, N, False)
+
+
+def gmres(A, b, x0=None, TOL=0.00001, N=200, restart=30, M=None):
+    """
+    Restarted GMRES with right preconditioning for general (nonsymmetric) systems Ax = b.
+    Args:
+        A: Matrix (2D list, numpy array, CSRMatrix) or matrix-free operator (see as_matvec)
+        b: Vector n
+        x0: Initial guess (zeros if None)
+        TOL: Relative tolerance - stop when ||b - Ax||2 <= TOL * ||b||2 (default is 0.00001).
+        N: Maximum total number of iterations (Arnoldi steps) (default is 200).
+        restart: Krylov subspace size before a restart
+        M: Preconditioner object or callable r -> M^-1 r; chosen by default_preconditioner if None
+
+    Returns: IterationResult(x, iterations, converged) - when a singular system makes the
+             iteration stagnate, the finite iterate built so far (converged only if it
+             meets TOL)
+    """
+    if restart < 1:
+        raise ValueError("restart must be positive.")
+
+    matvec, matrix = as_matvec(A)
+    precondition = as_preconditioner(M, A, matrix)
+    b, x = start_vector(b, x0)
+    n = len(b)
+    threshold = TOL * (np.linalg.norm(b) or 1.0)
+    total = 0
+
+    while True:
+        r = b - matvec(x)
+        beta = np.linalg.norm(r)
+        if beta <= threshold:
+            return IterationResult(x, total, True)
+        if total >= N:
+            return IterationResult(x, total, False)
+
+        m = min(restart, N - total)
+        V = np.zeros((m + 1, n))
+        Z = np.zeros((m, n))
+        H = np.zeros((m + 1, m))
+        cs, sn = np.zeros(m), np.zeros(m)
+        g = np.zeros(m + 1)
+        g[0] = beta
+        V[0] = r / beta
+
+        steps = 0
+        stagnated = False
+        for j in range(m):
+            # Arnoldi step with modified Gram-Schmidt
+            Z[j] = precondition(V[j])
+            w = matvec(Z[j])
+            for i in range(j + 1):
+                H[i, j] = w @ V[i]
+                w -= H[i, j] * V[i]
+            H[j + 1, j] = np.linalg.norm(w)
+            # A zero norm means the Krylov subspace is invariant - the solution is exact
+            breakdown = H[j + 1, j] == 0
+            if not breakdown:
+                V[j + 1] = w / H[j + 1, j]
+
+            # Apply the previous Givens rotations, then one that zeroes H[j+1, j]
+            for i in range(j):
+                H[i, j], H[i + 1, j] = cs[i] * H[i, j] + sn[i] * H[i + 1, j], \
+                    -sn[i] * H[i, j] + cs[i] * H[i + 1, j]
+            radius = np.hypot(H[j, j], H[j + 1, j])
+            # The rotations keep the column norm, so a radius at round-off level of it means
+            # A·M⁻¹ is singular on the Krylov subspace and the new column adds nothing: no
+            # restart can make progress, so finish with the columns built so far
+            if radius <= n * np.finfo(float).eps * np.linalg.norm(H[:j + 2, j]):
+                stagnated = True
+                total += 1
+                break
+            cs[j], sn[j] = H[j, j] / radius, H[j + 1, j] / radius
+            H[j, j], H[j + 1, j] = radius, 0.0
+            g[j], g[j + 1] = cs[j] * g[j], -sn[j] * g[j]
+
+            steps = j + 1
+            total += 1
+            # |g[j+1]| is the residual norm of the current least-squares solution
+            if abs(g[j + 1]) <= threshold or breakdown:
+                break
+
+        # Solve the small upper triangular system and update the solution
+        y = np.zeros(steps)
+        for i in range(steps - 1, -1, -1):
+            y[i] = (g[i] - H[i, i + 1:steps] @ y[i + 1:]) / H[i, i]
+        x += Z[:steps].T @ y
+        if stagnated:
+            return IterationResult(x, total, bool(np.linalg.norm(b - matvec(x)) <= threshold))
+
+
+if __name__ == '__main__':
+    """
+    Demonstration of PCG on an SPD Poisson system and GMRES on a nonsymmetric system,
+    both with a matrix and with a matrix-free operator.
+    """
+    from sparse_matrix import poisson_2d
+
+    A = poisson_2d(30)
+    b = np.ones(len(A))
+    result = pcg(A, b, TOL=1e-8, N=1000)
+    print(f"PCG (CSR matrix):      {result.iterations} iterations, converged = {result.converged}, "
+          f"residual = {np.linalg.norm(b - A @ result.x):.2e}")
+    result = pcg(A.matvec, b, TOL=1e-8, N=1000)
+    print(f"PCG (matrix-free):     {result.iterations} iterations, converged = {result.converged}")
+
+    rng = np.random.default_rng(0)
+    B = np.identity(200) * 4 + rng.standard_normal((200, 200)) / 10
+    c = rng.standard_normal(200)
+    result = gmres(B, c, TOL=1e-10, N=500)
+    print(f"GMRES (dense matrix):  {result.iterations} iterations, converged = {result.converged}, "
+          f"residual = {np.linalg.norm(c - B @ result.x):.2e}")
+    result = gmres(lambda v: B @ v, c, TOL=1e-10, N=500, restart=10)
+    print(f"GMRES(10) matrix-free: {result.iterations} iterations, converged = {result.converged}")
@@ -0,0 +1,150 @@
+import time
+
+import numpy as np
+
+
+class LinearOperator:
+    """
+    Matrix-free n x n operator accepted by the iterative solvers in place of a matrix.
+
+    Subclasses implement `matvec(x)` (for a vector or an n x k block of columns) and
+    `diagonal()`. `relax(b, x)`, one Gauss-Seidel sweep done in place, is optional and
+    needed only by gauss_seidel; `abs_row_sums()` is optional and used by the diagonal
+    dominance check. `symmetric` tells the spectral radius estimates they may use Lanczos.
+    """
+
+    symmetric = False
+
+    def __init__(self, n):
+        self.n = n
+
+    @property
+    def shape(self):
+        return self.n, self.n
+
+    def __len__(self):
+        return self.n
+
+    def matvec(self, x):
+        raise NotImplementedError
+
+    def diagonal(self):
+        raise NotImplementedError
+
+    def relax(self, b, x):
+        """
+        :param b: Right-hand side (numpy array)
+        :param x: Current iterate (numpy array), overwritten by one Gauss-Seidel sweep
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not provide a Gauss-Seidel relaxation.")
+
+    def abs_row_sums(self):
+        raise NotImplementedError
+
+    def __matmul__(self, x):
+        return self.matvec(x)
+
+
+class LaplacianStencil(LinearOperator):
+    """
+    The (2·d + 1)-point finite-difference Laplacian on a d-dimensional grid (d = 1, 2 or 3)
+    with Dirichlet boundary, unknowns numbered in row-major order: 2·d on the diagonal and
+    -1 for every grid neighbor, the matrix of sparse_matrix.poisson_2d for d = 2.
+
+    Only the grid shape is stored; a product or a sweep needs O(n) temporary memory.
+    """
+
+    symmetric = True
+
+    def __init__(self, grid_shape):
+        """
+        Args:
+            grid_shape: Tuple with the number of grid points along each axis (1 to 3 axes)
+
+        Raises:
+            ValueError: If the grid has no axes, more than 3, or an empty axis.
+        """
+        grid_shape = tuple(int(size) for size in grid_shape)
+        if not 1 <= len(grid_shape) <= 3 or min(grid_shape) < 1:
+            raise ValueError("Grid must have 1 to 3 non-empty axes.")
+        super().__init__(int(np.prod(grid_shape)))
+        self.grid_shape = grid_shape
+        self.center = 2.0 * len(grid_shape)
+        self._red = None
+
+    def neighbor_sum(self, x):
+        """Sum of the grid neighbors of every point (zero outside the grid)"""
+        total = np.zeros_like(x)
+        for axis in range(len(self.grid_shape)):
+            before = (slice(None),) * axis
+            total[before + (slice(1, None),)] += x[before + (slice(None, -1),)]
+            total[before + (slice(None, -1),)] += x[before + (slice(1, None),)]
+        return total
+
+    def matvec(self, x):
+        """
+        :param x: Vector n or an n x k block
+        :return: A·x with the shape of x
+        """
+        x = np.asarray(x, dtype=float)
+        grid = x.reshape(self.grid_shape + x.shape[1:])
+        return (self.center * grid - self.neighbor_sum(grid)).reshape(x.shape)
+
+    def diagonal(self):
+        return np.full(self.n, self.center)
+
+    def abs_row_sums(self):
+        # A·1 = 2d - (number of neighbors), so |A| row sums are 2d + neighbors
+        return 2 * self.center - self.matvec(np.ones(self.n))
+
+    def relax(self, b, x):
+        """
+        One red-black Gauss-Seidel sweep in place: the points of one checkerboard color are
+        not coupled, so each color is updated at once. This is an exact Gauss-Seidel sweep
+        in the red-black ordering of the unknowns.
+        :param b: Right-hand side (numpy array)
+        :param x: Current iterate (numpy array), overwritten
+        """
+        if self._red is None:
+            parity = sum(np.ix_(*[np.arange(size) for size in self.grid_shape])) % 2
+            self._red = np.broadcast_to(parity == 0, self.grid_shape)
+        grid, b = x.reshape(self.grid_shape), np.reshape(b, self.grid_shape)
+        for color in (self._red, ~self._red):
+            grid[color] = (b[color] + self.neighbor_sum(grid)[color]) / self.center
+
+
+def laplacian_1d(n):
+    """Second-difference matrix tridiag(-1, 2, -1) of order n as a LaplacianStencil"""
+    return LaplacianStencil((n,))
+
+
+def laplacian_2d(nx, ny=None):
+    """5-point Laplacian on an nx x ny grid (ny = nx if not given) as a LaplacianStencil"""
+    return LaplacianStencil((nx, nx if ny is None else ny))
+
+
+def laplacian_3d(nx, ny=None, nz=None):
+    """7-point Laplacian on an nx x ny x nz grid (missing sizes equal nx) as a LaplacianStencil"""
+    return LaplacianStencil((nx, nx if ny is None else ny, nx if nz is None else nz))
+
+
+if __name__ == '__main__':
+    """
+    Memory and time of one Jacobi-type product and one red-black sweep of the matrix-free
+    3D Laplacian, against the CSR and dense storage the same problem would need.
+    """
+
+    for m in (20, 50, 100, 215):
+        A = laplacian_3d(m)
+        b = np.ones(A.n)
+        x = np.zeros(A.n)
+        start = time.perf_counter()
+        A.matvec(x)
+        product_time = time.perf_counter() - start
+        start = time.perf_counter()
+        A.relax(b, x)
+        sweep_time = time.perf_counter() - start
+        csr_bytes = (7 * A.n) * 16 + (A.n + 1) * 8
+        print(f"n = {A.n:>9}: product {product_time:.3f} s, sweep {sweep_time:.3f} s, "
+              f"vector {A.n * 8 / 2 ** 20:.1f} MiB, CSR ~{csr_bytes / 2 ** 20:.0f} MiB, "
+              f"dense {A.n ** 2 * 8 / 2 ** 30:.3g} GiB")
@@ -0,0 +1,237 @@
+import numpy as np
+
+from blocked_lu import blocked_lu
+
+
+def as_square_array(A, dtype=float):
+    """
+    Converts a square matrix (list of lists or numpy array) to a float numpy array copy.
+    Args:
+        A: Matrix nxn
+        dtype: Floating point type of the copy (float64 by default)
+
+    Returns: numpy array of shape (n, n)
+
+    Raises:
+        ValueError: If the matrix is empty or not square.
+    """
+    n = len(A)
+    if n == 0:
+        raise ValueError("Matrix is empty.")
+    if any(len(row) != n for row in A):
+        raise ValueError("Matrix is not square.")
+    return np.array(A, dtype=dtype)
+
+
+def row_lu(a):
+    """
+    Row-at-a-time LU factorization with partial pivoting, done in place.
+    Args:
+        a: Float matrix nxn (numpy array), overwritten with the packed L and U factors
+
+    Returns: Tuple (perm, swaps) - the row permutation and the number of row swaps
+
+    Raises:
+        ValueError: If a zero pivot is found (singular matrix).
+    """
+    n = a.shape[0]
+    perm = np.arange(n)
+    swaps = 0
+
+    for i in range(n):
+        # Pivoting: Find the maximum element in the column and swap rows
+        max_row = i + int(np.argmax(np.abs(a[i:, i])))
+        if a[max_row, i] == 0:
+            raise ValueError("Matrix is singular – zero on diagonal.")
+        if max_row != i:
+            a[[i, max_row]] = a[[max_row, i]]
+            perm[[i, max_row]] = perm[[max_row, i]]
+            swaps += 1
+
+        # Store the multipliers below the pivot and update the trailing rows at once
+        a[i + 1:, i] /= a[i, i]
+        a[i + 1:, i + 1:] -= np.outer(a[i + 1:, i], a[i, i + 1:])
+
+    return perm, swaps
+
+
+def inverse_norm_estimate(solve, solve_transpose, n, ord=np.inf, max_iter=5):
+    """
+    Estimates ‖A⁻¹‖ from solves with A and Aᵀ only (Hager's method with Higham's safeguard).
+
+    The result is a lower bound that is exact in most cases and almost always within a
+    factor of 3.
+    Args:
+        solve: Callable b -> A⁻¹·b
+        solve_transpose: Callable b -> A⁻ᵀ·b
+        n: Order of A
+        ord: 1 or np.inf - which norm to estimate
+        max_iter: Maximum number of Hager steps
+
+    Returns: float - estimate of ‖A⁻¹‖ in the requested norm
+    """
+    if ord == np.inf:
+        # ‖A⁻¹‖∞ = ‖A⁻ᵀ‖₁
+        solve, solve_transpose = solve_transpose, solve
+    elif ord != 1:
+        raise ValueError("Only the 1-norm and the infinity norm can be estimated.")
+
+    x = np.full(n, 1.0 / n)
+    estimate = 0.0
+    for k in range(max_iter):
+        y = solve(x)
+        new_estimate = np.sum(np.abs(y))
+        if k > 0 and new_estimate <= estimate:
+            break
+        estimate = new_estimate
+        z = solve_transpose(np.where(y >= 0, 1.0, -1.0))
+        j = int(np.argmax(np.abs(z)))
+        if k > 0 and abs(z[j]) <= z @ x:
+            break
+        x = np.zeros(n)
+        x[j] = 1.0
+
+    # Higham's alternating-sign test vector catches cases where the iteration stalls
+    if n > 1:
+        alt = np.array([(-1) ** i * (1 + i / (n - 1)) for i in range(n)])
+        estimate = max(estimate, 2 * np.sum(np.abs(solve(alt))) / (3 * n))
+    return float(estimate)
+
+
+class LUFactorization:
+    """
+    LU factorization with partial pivoting, P·A = L·U.
+
+    The unit lower triangle L (below the diagonal) and the upper triangle U are packed
+    into the single array `lu`. `perm` is the row permutation, so A[perm] = L·U.
+    The factorization is computed once and can then be reused by `solve` for any
+    number of right-hand sides.
+    """
+
+    def __init__(self, A, engine="row", block_size=64, workers=1, dtype=float):
+        """
+        Factors the matrix A.
+        Args:
+            A: Matrix nxn (list of lists or numpy array)
+            engine: "row" for row-at-a-time elimination, "blocked" for the cache-blocked
+                    kernel in `blocked_lu` (faster past a few hundred unknowns)
+            block_size: Panel width of the blocked engine
+            workers: Number of threads for the trailing updates of the blocked engine
+            dtype: Floating point type of the factors (np.float32 halves memory and bandwidth;
+                   right-hand sides are then solved in that precision too)
+
+        Raises:
+            ValueError: If the matrix is empty, not square or singular (zero pivot),
+                        or the engine is unknown.
+        """
+        lu = as_square_array(A, dtype)
+        if engine == "row":
+            perm, swaps = row_lu(lu)
+        elif engine == "blocked":
+            perm, swaps = blocked_lu(lu, block_size, workers)
+        else:
+            raise ValueError(f"Unknown LU engine '{engine}'.")
+
+        self.lu = lu
+        self.perm = perm
+        self.swaps = swaps
+
+    @property
+    def n(self):
+        """Order of the factored matrix"""
+        return self.lu.shape[0]
+
+    def solve(self, b):
+        """
+        Solves A·x = b using the stored factors.
+        Args:
+            b: Vector n, or an nxk block whose columns are right-hand sides
+
+        Returns: numpy array with the same shape as b
+
+        Raises:
+            ValueError: If b does not have n rows.
+        """
+        b = self.check_rhs(b)
+        lu = self.lu
+        y = b[self.perm]
+        # Forward substitution with the unit lower triangle
+        for i in range(1, self.n):
+            y[i] -= lu[i, :i] @ y[:i]
+        # Back substitution with the upper triangle
+        for i in range(self.n - 1, -1, -1):
+            y[i] = (y[i] - lu[i, i + 1:] @ y[i + 1:]) / lu[i, i]
+        return y
+
+    def solve_transpose(self, b):
+        """
+        Solves Aᵀ·x = b using the stored factors (Aᵀ = Uᵀ·Lᵀ·P).
+        Args:
+            b: Vector n, or an nxk block whose columns are right-hand sides
+
+        Returns: numpy array with the same shape as b
+
+        Raises:
+            ValueError: If b does not have n rows.
+        """
+        b = self.check_rhs(b)
+        lu = self.lu
+        y = b.copy()
+        # Forward substitution with Uᵀ
+        for i in range(self.n):
+            y[i] = (y[i] - lu[:i, i] @ y[:i]) / lu[i, i]
+        # Back substitution with the unit upper triangle Lᵀ
+        for i in range(self.n - 2, -1, -1):
+            y[i] -= lu[i + 1:, i] @ y[i + 1:]
+        x = np.empty_like(y)
+        x[self.perm] = y
+        return x
+
+    def slogdet(self):
+        """
+        Sign and natural log of the absolute value of the determinant of A.
+        Working with logs keeps large matrices from overflowing.
+
+        Returns: Tuple (sign, logabsdet) with det(A) = sign·exp(logabsdet)
+        """
+        diagonal = np.diag(self.lu)
+        sign = (-1.0) ** self.swaps * np.prod(np.sign(diagonal))
+        return float(sign), float(np.sum(np.log(np.abs(diagonal))))
+
+    def det(self):
+        """Determinant of A - the product of the pivots, negated for an odd number of row swaps"""
+        return float((-1.0) ** self.swaps * np.prod(np.diag(self.lu)))
+
+    def check_rhs(self, b):
+        """Converts b to the precision of the factors and checks that it has n rows"""
+        b = np.asarray(b, dtype=self.lu.dtype)
+        if b.ndim not in (1, 2) or b.shape[0] != self.n:
+            raise ValueError(f"Right-hand side must have {self.n} rows.")
+        return b
+
+    def inverse_norm_estimate(self, ord=np.inf, max_iter=5):
+        """
+        Estimates ‖A⁻¹‖ without forming the inverse (see `inverse_norm_estimate`).
+
+        Each step costs one solve with A and one with Aᵀ, so the estimate is O(n²)
+        on top of the factorization.
+        Args:
+            ord: 1 or np.inf - which norm to estimate
+            max_iter: Maximum number of Hager steps
+
+        Returns: float - estimate of ‖A⁻¹‖ in the requested norm
+        """
+        return inverse_norm_estimate(self.solve, self.solve_transpose, self.n, ord, max_iter)
+
+
+if __name__ == '__main__':
+    """
+    Demonstration of factoring a matrix once and reusing it for several right-hand sides.
+    """
+
+    A = [[2, 1.7, -2.5], [1.24, -2, -0.5], [3, 0.2, 1]]
+    factorization = LUFactorization(A)
+    print("Packed LU:\n", factorization.lu)
+    print("Permutation:", factorization.perm)
+    print("Solution for b = [3.5, -1.2, 4.8]:", factorization.solve([3.5, -1.2, 4.8]))
+    print("Solutions for the columns of I (the inverse):\n", factorization.solve(np.identity(3)))
@@ -1,5 +1,10 @@
 import numpy as np
 
+from diagonal_matching import maximum_product_matching
+from fast_multiply import multiply
+from lu_factorization import LUFactorization, as_square_array
+from norms import matrix_norm
+
 def print_matrix(matrix):
     """
     Function for printing a matrix in a readable format
@@ -21,17 +26,8 @@ def MaxNorm(matrix):
     Function for calculating the max-norm of a matrix    :param matrix:  nxn
     :return:max-norm of a matrix
     """
-    max_norm = 0
-    for i in range(len(matrix)):
-        norm = 0
-        for j in range(len(matrix)):
-            # Sum of organs per line with absolute value
-            norm += abs(matrix[i][j])
-        # Maximum row amount
-        if norm > max_norm:
-            max_norm = norm
-
-    return max_norm
+    # Maximum row amount
+    return matrix_norm(matrix, np.inf)
 
 #  swapping between row i to row j in the matrix
 def swap_row(mat, i, j):
@@ -106,27 +102,21 @@ def reorder_dominant_diagonal(matrix):
 def DominantDiagonalFix(matrix):
     """
     Function to change a matrix to create a dominant diagonal
+    The rows are ordered by a maximum-product matching of the diagonal, which is the
+    dominant ordering whenever one exists.
     :param matrix: Matrix nxn
     :return: Change the matrix to a dominant diagonal
     """
-    #Check if we have a dominant for each column
-    dom = [0]*len(matrix)
-    result = list()
-   # Find the largest organ in a row
-    for i in range(len(matrix)):
-        for j in range(len(matrix[0])):
-            if (matrix[i][j] > sum(map(abs,map(int,matrix[i])))-matrix[i][j]) :
-                dom[i]=j
-    for i in range(len(matrix)):
-        result.append([])
-        # Cannot dominant diagonal
-        if i not in dom:
-            print("Couldn't find dominant diagonal.")
-            return matrix
+    try:
+        perm = maximum_product_matching(matrix)
+    except ValueError:
+        perm = None
+    # Cannot dominant diagonal
+    if perm is None or not is_diagonally_dominant(np.asarray(matrix, dtype=float)[perm]):
+        print("Couldn't find dominant diagonal.")
+        return matrix
     # Change the matrix to a dominant diagonal
-    for i,j in enumerate(dom):
-        result[j]=(matrix[i])
-    return result
+    return [matrix[i] for i in perm]
 
 
 def swap_rows_elementary_matrix(n, row1, row2):
@@ -137,17 +127,11 @@ def swap_rows_elementary_matrix(n, row1, row2):
 
 
 def matrix_multiply(A, B):
-    if len(A[0]) != len(B):
-        raise ValueError("Matrix dimensions are incompatible for multiplication.")
-
-    result = [[0 for _ in range(len(B[0]))] for _ in range(len(A))]
-
-    for i in range(len(A)):
-        for j in range(len(B[0])):
-            for k in range(len(B)):
-                result[i][j] += A[i][k] * B[k][j]
-
-    return np.array(result)
+    """
+    Function for multiplying 2 matrices (see fast_multiply.multiply)
+    :return: Multiplication between 2 matrices as a numpy array
+    """
+    return multiply(A, B)
 
 
 def row_addition_elementary_matrix(n, target_row, source_row, scalar=1.0):
@@ -178,33 +162,38 @@ def scalar_multiplication_elementary_matrix(n, row_index, scalar):
     return np.array(elementary_matrix)
 
 
-def Determinant(matrix, mul):
+def Determinant(matrix, mul=1):
     """
-    Recursive function for determinant calculation
+    Function for determinant calculation from a pivoted LU factorization - O(n^3)
     :param matrix: Matrix nxn
     :param mul: The double number
     :return: determinant of matrix
     """
-    width = len(matrix)
-    # Stop Conditions
-    if width == 1:
-        return mul * matrix[0][0]
-    else:
-        sign = -1
-        det = 0
-        for i in range(width):
-            m = []
-            for j in range(1, width):
-                buff = []
-                for k in range(width):
-                    if k != i:
-                        buff.append(matrix[j][k])
-                m.append(buff)
-            # Change the sign of the multiply number
-            sign *= -1
-            #  Recursive call for determinant calculation
-            det = det + mul * Determinant(m, sign * matrix[0][i])
-    return det
+    # Shape errors raise here; a ValueError of the factorization is a zero pivot
+    matrix = as_square_array(matrix)
+    try:
+        factorization = LUFactorization(matrix)
+    except ValueError:
+        # Zero pivot - the matrix is singular
+        return 0.0
+    return mul * factorization.det()
+
+
+def LogDeterminant(matrix):
+    """
+    Function for the sign and the log of the absolute determinant (like numpy's slogdet),
+    for matrices whose determinant would overflow
+    :param matrix: Matrix nxn
+    :return: (sign, logabsdet) with det = sign * exp(logabsdet); (0.0, -inf) for a singular matrix
+    """
+    # Shape errors raise here; a ValueError of the factorization is a zero pivot
+    matrix = as_square_array(matrix)
+    try:
+        factorization = LUFactorization(matrix)
+    except ValueError:
+        # Zero pivot - the matrix is singular
+        return 0.0, -np.inf
+    return factorization.slogdet()
 
 # Partial Pivoting: Find the pivot row with the largest absolute value in the current column
 def partial_pivoting(A,i,N):
@@ -231,19 +220,11 @@ def partial_pivoting(A,i,N):
 
 def MultiplyMatrix(matrixA, matrixB):
     """
-    Function for multiplying 2 matrices
+    Function for multiplying 2 matrices (see fast_multiply.multiply)
     :param matrixA: Matrix nxn    :param matrixB: 
     :return: Multiplication between 2 matrices
     """
-    # result matrix initialized as singularity matrix
-    result = [[0 for y in range(len(matrixB[0]))] for x in range(len(matrixA))]
-    for i in range(len(matrixA)):
-        # iterate through columns of Y
-        for j in range(len(matrixB[0])):
-            # iterate through rows of Y
-            for k in range(len(matrixB)):
-                result[i][j] += matrixA[i][k] * matrixB[k][j]
-    return result
+    return multiply(matrixA, matrixB).tolist()
 
 
 def MakeIMatrix(cols, rows):
@@ -252,21 +233,13 @@ def MakeIMatrix(cols, rows):
 
 def MulMatrixVector(InversedMat, b_vector):
     """
-    Function for multiplying a vector matrix
+    Function for multiplying a vector matrix (see fast_multiply.multiply)
     :param InversedMat: Matrix nxn
     :param b_vector: Vector n
     :return: Result vector
     """
-    result = []
-    # Initialize the x vector
-    for i in range(len(b_vector)):
-        result.append([])
-        result[i].append(0)
-    # Multiplication of inverse matrix in the result vector
-    for i in range(len(InversedMat)):
-        for k in range(len(b_vector)):
-            result[i][0] += InversedMat[i][k] * b_vector[k][0]
-    return result
+    # b_vector is a column ([[b1], [b2], ...]), so this is a matrix-matrix product
+    return multiply(InversedMat, b_vector).tolist()
 
 def RowXchageZero(matrix,vector):
     """
@@ -295,49 +268,76 @@ def Cond(matrix, invert):
     :param invert: Inverted matrix
     :return: CondA = ||A|| * ||A(-1)||
     """
-    print("|| A ||max = ", MaxNorm(matrix))
-    print("|| A(-1) ||max = ", MaxNorm(invert))
-    return MaxNorm(matrix)*MaxNorm(invert)
+    norm_A, norm_invert = matrix_norm(matrix, np.inf), matrix_norm(invert, np.inf)
+    print("|| A ||max = ", norm_A)
+    print("|| A(-1) ||max = ", norm_invert)
+    return norm_A * norm_invert
+
+def GaussJordanInverse(matrix, record=False):
+    """
+    In-place Gauss-Jordan inversion with the pivoting of RowXchange (largest absolute value
+    in the column). Each pivot step is a row exchange, a row scaling and one rank-1 update of
+    the whole matrix, so no elementary matrix is built unless record is True.
+    :param matrix: Matrix nxn (not modified)
+    :param record: If True, also return the elementary matrices of every row operation in order
+    :return: Inverse matrix (numpy array), or (inverse, elementary matrices) when record is True
+    :raises ValueError: If the matrix is not square or singular
+    """
+    a = as_square_array(matrix)
+    n = len(a)
+    result = np.identity(n)
+    operations = []
 
-def InverseMatrix(matrix,vector):
+    for i in range(n):
+        # pivoting process
+        pivot_row = i + int(np.argmax(np.abs(a[i:, i])))
+        if a[pivot_row, i] == 0:
+            raise ValueError("Matrix is singular – zero on diagonal.")
+        if pivot_row != i:
+            a[[i, pivot_row]] = a[[pivot_row, i]]
+            result[[i, pivot_row]] = result[[pivot_row, i]]
+            if record:
+                operations.append(swap_rows_elementary_matrix(n, i, pivot_row))
+
+        # turn the pivot into 1
+        scale = 1 / a[i, i]
+        a[i] *= scale
+        result[i] *= scale
+        if record:
+            operations.append(scalar_multiplication_elementary_matrix(n, i, scale))
+
+        # subtract the pivot row from every other row to zero the column
+        factors = a[:, i].copy()
+        factors[i] = 0
+        a -= np.outer(factors, a[i])
+        result -= np.outer(factors, result[i])
+        if record:
+            for j in np.flatnonzero(factors):
+                operations.append(row_addition_elementary_matrix(n, j, i, -factors[j]))
+
+    if record:
+        return result, operations
+    return result
+
+
+def InverseMatrix(matrix, vector, record=False):
     """
     Function for calculating an inverse matrix    :param matrix:   nxn
+    :param vector: Vector n (kept for compatibility - the rows are exchanged inside the
+                   elimination, so the result is the inverse of the given matrix)
+    :param record: If True, also return the elementary matrices used (for teaching output)
     :return: Inverse matrix
     """
-    # Unveri reversible matrix
-    if Determinant(matrix, 1) == 0:
+    as_square_array(matrix)
+    try:
+        inverse = GaussJordanInverse(matrix, record)
+    except ValueError:
+        # Zero pivot - the matrix is not reversible
         print("Error,Singular Matrix\n")
         return
-    # result matrix initialized as singularity matrix
-    result = MakeIMatrix(len(matrix), len(matrix))
-    # loop for each row
-    for i in range(len(matrix[0])):
-        # turn the pivot into 1 (make elementary matrix and multiply with the result matrix )
-        # pivoting process
-        matrix, vector = RowXchange(matrix, vector)
-        elementary = MakeIMatrix(len(matrix[0]), len(matrix))
-        elementary[i][i] = 1/matrix[i][i]
-        result = MultiplyMatrix(elementary, result)
-        matrix = MultiplyMatrix(elementary, matrix)
-        # make elementary loop to iterate for each row and subtracrt the number below (specific) pivot to zero  (make
-        # elementary matrix and multiply with the result matrix )
-        for j in range(i+1, len(matrix)):
-            elementary = MakeIMatrix(len(matrix[0]), len(matrix))
-            elementary[j][i] = -(matrix[j][i])
-            matrix = MultiplyMatrix(elementary, matrix)
-            result = MultiplyMatrix(elementary, result)
-
-
-    # after finishing with the lower part of the matrix subtract the numbers above the pivot with elementary for loop
-    # (make elementary matrix and multiply with the result matrix )
-    for i in range(len(matrix[0])-1, 0, -1):
-        for j in range(i-1, -1, -1):
-            elementary = MakeIMatrix(len(matrix[0]), len(matrix))
-            elementary[j][i] = -(matrix[j][i])
-            matrix = MultiplyMatrix(elementary, matrix)
-            result = MultiplyMatrix(elementary, result)
-
-    return result
+    if record:
+        return inverse[0].tolist(), inverse[1]
+    return inverse.tolist()
 
 
 def RowXchange(matrix, vector):
@@ -0,0 +1,135 @@
+import numpy as np
+
+from sparse_matrix import CSRMatrix
+
+
+def as_norm_operand(A):
+    """
+    Returns A as a CSRMatrix or as a float numpy array of 2 dimensions (one matrix) or 3
+    dimensions (a batch of matrices of the same shape, stacked on the first axis).
+
+    Raises:
+        ValueError: If A is not a matrix or a batch of matrices.
+    """
+    if isinstance(A, CSRMatrix):
+        return A
+    A = np.asarray(A, dtype=float)
+    if A.ndim not in (2, 3):
+        raise ValueError("Expected a matrix or a batch of matrices.")
+    return A
+
+
+def one_norm(A):
+    """
+    Maximum absolute column sum ‖A‖₁.
+    Args:
+        A: Matrix (2D list, numpy array or CSRMatrix) or a batch of matrices (m, r, c)
+
+    Returns: float, or a numpy array with one norm per matrix of a batch
+    """
+    A = as_norm_operand(A)
+    if isinstance(A, CSRMatrix):
+        sums = np.bincount(A.indices, weights=np.abs(A.data), minlength=A.shape[1])
+        return float(np.max(sums, initial=0.0))
+    return np.max(np.sum(np.abs(A), axis=-2), axis=-1, initial=0.0)[()]
+
+
+def inf_norm(A):
+    """
+    Maximum absolute row sum ‖A‖∞.
+    Args:
+        A: Matrix (2D list, numpy array or CSRMatrix) or a batch of matrices (m, r, c)
+
+    Returns: float, or a numpy array with one norm per matrix of a batch
+    """
+    A = as_norm_operand(A)
+    if isinstance(A, CSRMatrix):
+        return float(np.max(A.abs_row_sums(), initial=0.0))
+    return np.max(np.sum(np.abs(A), axis=-1), axis=-1, initial=0.0)[()]
+
+
+def frobenius_norm(A):
+    """
+    Frobenius norm sqrt(Σ a_ij²).
+    Args:
+        A: Matrix (2D list, numpy array or CSRMatrix) or a batch of matrices (m, r, c)
+
+    Returns: float, or a numpy array with one norm per matrix of a batch
+    """
+    A = as_norm_operand(A)
+    if isinstance(A, CSRMatrix):
+        return float(np.sqrt(A.data @ A.data))
+    return np.sqrt(np.einsum("...ij,...ij->...", A, A))[()]
+
+
+def two_norm_estimate(A, max_iter=100, tol=1e-3, seed=0):
+    """
+    Estimates the spectral norm ‖A‖₂ (the largest singular value) by power iteration on
+    AᵀA, so only products with A and Aᵀ are needed. A batch is iterated all at once.
+    Args:
+        A: Matrix (2D list, numpy array or CSRMatrix) or a batch of matrices (m, r, c)
+        max_iter: Maximum number of power steps
+        tol: Relative change of the estimate at which to stop
+        seed: Seed of the random start vector
+
+    Returns: float, or a numpy array with one estimate per matrix of a batch (a lower
+             bound that improves with more steps)
+    """
+    A = as_norm_operand(A)
+    if isinstance(A, CSRMatrix):
+        transpose = A.transpose()
+        product = lambda x: transpose @ (A @ x)
+    else:
+        product = lambda x: np.einsum("...ji,...j->...i", A, np.einsum("...ij,...j->...i", A, x))
+
+    batch, n = A.shape[:-2], A.shape[-1]
+    x = np.broadcast_to(np.random.default_rng(seed).random(n) + 0.5, batch + (n,))
+    x = x / np.linalg.norm(x, axis=-1, keepdims=True)
+    estimate = np.zeros(batch)
+    for _ in range(max_iter):
+        z = product(x)
+        size = np.linalg.norm(z, axis=-1)
+        sigma = np.sqrt(size)
+        converged = np.all(np.abs(sigma - estimate) <= tol * sigma)
+        estimate = sigma
+        if converged:
+            break
+        x = z / np.where(size == 0, 1.0, size)[..., None]
+
+    return float(estimate) if estimate.ndim == 0 else estimate
+
+
+def matrix_norm(A, ord=np.inf):
+    """
+    Matrix norm of a dense, sparse or batched input.
+    Args:
+        A: Matrix (2D list, numpy array or CSRMatrix) or a batch of matrices (m, r, c)
+        ord: 1, np.inf, "fro" or 2 (2 is estimated, see two_norm_estimate)
+
+    Returns: float, or a numpy array with one norm per matrix of a batch
+
+    Raises:
+        ValueError: If ord is not one of the supported norms.
+    """
+    if ord == 1:
+        return one_norm(A)
+    if ord == np.inf:
+        return inf_norm(A)
+    if ord == "fro":
+        return frobenius_norm(A)
+    if ord == 2:
+        return two_norm_estimate(A)
+    raise ValueError("ord must be 1, np.inf, 'fro' or 2.")
+
+
+if __name__ == '__main__':
+    """
+    The four norms of a rectangular matrix, of its CSR form and of a batch, against numpy.
+    """
+
+    A = np.array([[2.0, -1.0, 0.0, 3.0], [0.5, 4.0, -2.0, 0.0], [1.0, 0.0, 1.0, -1.0]])
+    batch = np.random.default_rng(0).standard_normal((3, 5, 5))
+    for ord in (1, np.inf, "fro", 2):
+        print(f"ord={ord}: dense {matrix_norm(A, ord):.6f}, CSR {matrix_norm(CSRMatrix.from_dense(A), ord):.6f}, "
+              f"numpy {np.linalg.norm(A, ord):.6f}")
+        print(f"    batch {matrix_norm(batch, ord)}, numpy {np.linalg.norm(batch, ord, axis=(-2, -1))}")
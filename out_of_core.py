@@ -0,0 +1,298 @@
+import os
+import time
+from collections import namedtuple
+
+import numpy as np
+
+from krylov_solvers import pcg
+from linear_operator import LinearOperator
+from sparse_matrix import CSRMatrix
+from stationary_solvers import jacobi
+
+# Bytes streamed per row block: large enough for the kernel's readahead to keep the reads
+# sequential and the per-block overhead negligible, small enough to stay far below RAM
+BLOCK_BYTES = 32 * 2 ** 20
+
+# products - passes over the file (the scan for the diagonal included), bytes_per_product -
+# bytes streamed by one pass, throughput - bytes per second of streaming time
+IOReport = namedtuple("IOReport", ["products", "bytes_per_product", "throughput"])
+
+
+def block_bytes(target_bytes=BLOCK_BYTES):
+    """
+    Bytes per row block: target_bytes, capped at 1/8 of the physical memory available now
+    (but not below 1 MiB) so that a block and the page cache around it never push the
+    process into swap.
+    """
+    try:
+        available = os.sysconf("SC_AVPHYS_PAGES") * os.sysconf("SC_PAGE_SIZE")
+    except (AttributeError, ValueError, OSError):
+        return target_bytes
+    return min(target_bytes, max(2 ** 20, available // 8))
+
+
+class StreamedOperator(LinearOperator):
+    """
+    Base class of the out-of-core operators: the matrix stays in a file and every product
+    streams it once, block of rows by block of rows. The bytes streamed and the time spent
+    in products are counted for io_report().
+    """
+
+    def __init__(self, n):
+        super().__init__(n)
+        self._diagonal = None
+        self._abs_row_sums = None
+        self.reset_io_stats()
+
+    def reset_io_stats(self):
+        self.products = 0
+        self.bytes_read = 0
+        self.seconds = 0.0
+
+    def io_report(self):
+        """Returns: IOReport of the products since the last reset_io_stats()"""
+        per_product = self.bytes_read / self.products if self.products else 0.0
+        throughput = self.bytes_read / self.seconds if self.seconds else 0.0
+        return IOReport(self.products, per_product, throughput)
+
+    def blocks(self):
+        """Yields (start, stop, block) for consecutive row blocks; block supports `@`"""
+        raise NotImplementedError
+
+    def block_nbytes(self, start, stop):
+        raise NotImplementedError
+
+    def matvec(self, x):
+        """
+        :param x: Vector n or an n x k block
+        :return: A·x, reading every block of the file once
+        """
+        x = np.asarray(x, dtype=float)
+        result = np.empty((self.n,) + x.shape[1:])
+        started = time.perf_counter()
+        for start, stop, block in self.blocks():
+            result[start:stop] = block @ x
+            self.bytes_read += self.block_nbytes(start, stop)
+        self.seconds += time.perf_counter() - started
+        self.products += 1
+        return result
+
+    def diagonal(self):
+        if self._diagonal is None:
+            self._scan()
+        return self._diagonal.copy()
+
+    def abs_row_sums(self):
+        if self._abs_row_sums is None:
+            self._scan()
+        return self._abs_row_sums.copy()
+
+    def _scan(self):
+        # One pass collects both the diagonal and the absolute row sums; it streams the file
+        # like a product, so it is counted as one
+        self._diagonal = np.empty(self.n)
+        self._abs_row_sums = np.empty(self.n)
+        started = time.perf_counter()
+        for start, stop, block in self.blocks():
+            self._diagonal[start:stop], self._abs_row_sums[start:stop] = self.block_diagonal_and_sums(start, block)
+            self.bytes_read += self.block_nbytes(start, stop)
+        self.seconds += time.perf_counter() - started
+        self.products += 1
+
+    def block_diagonal_and_sums(self, start, block):
+        raise NotImplementedError
+
+    def relax(self, b, x):
+        """
+        One Gauss-Seidel sweep in place, in the natural row order, reading every block once.
+        :param b: Right-hand side (numpy array)
+        :param x: Current iterate (numpy array), overwritten
+        """
+        diagonal = self.diagonal()
+        started = time.perf_counter()
+        for start, stop, block in self.blocks():
+            rows = self.block_rows(block)
+            for i in range(start, stop):
+                x[i] += (b[i] - rows(i - start) @ x) / diagonal[i]
+            self.bytes_read += self.block_nbytes(start, stop)
+        self.seconds += time.perf_counter() - started
+        self.products += 1
+
+    def block_rows(self, block):
+        """Returns a function local_row -> that row of the block (anything supporting `row @ x`)"""
+        raise NotImplementedError
+
+
+class MemmapMatrix(StreamedOperator):
+    """
+    Dense n x n matrix memory-mapped from a .npy file or a raw row-major binary file.
+    """
+
+    def __init__(self, path, shape=None, dtype=float, offset=0, target_bytes=BLOCK_BYTES):
+        """
+        Args:
+            path: .npy file (shape and dtype read from its header) or raw binary file
+            shape: (n, n) - required for a raw file
+            dtype: Element type of a raw file
+            offset: Bytes to skip at the start of a raw file
+            target_bytes: Bytes per row block (see block_bytes)
+
+        Raises:
+            ValueError: If the matrix is not square or a raw file comes without a shape.
+        """
+        if str(path).endswith(".npy"):
+            self.array = np.load(path, mmap_mode="r")
+        elif shape is None:
+            raise ValueError("The shape of a raw matrix file must be given.")
+        else:
+            self.array = np.memmap(path, dtype=dtype, mode="r", offset=offset, shape=tuple(shape))
+        if self.array.ndim != 2 or self.array.shape[0] != self.array.shape[1]:
+            raise ValueError("Matrix is not square.")
+        super().__init__(self.array.shape[0])
+        self.row_bytes = self.array.shape[1] * self.array.itemsize
+        self.rows_per_block = max(1, block_bytes(target_bytes) // self.row_bytes)
+
+    def blocks(self):
+        for start in range(0, self.n, self.rows_per_block):
+            stop = min(self.n, start + self.rows_per_block)
+            yield start, stop, np.asarray(self.array[start:stop], dtype=float)
+
+    def block_nbytes(self, start, stop):
+        return (stop - start) * self.row_bytes
+
+    def block_diagonal_and_sums(self, start, block):
+        local = np.arange(len(block))
+        return block[local, start + local], np.sum(np.abs(block), axis=1)
+
+    def block_rows(self, block):
+        return lambda i: block[i]
+
+
+class DiskCSRMatrix(StreamedOperator):
+    """
+    Square CSR matrix stored on disk as indptr.npy, indices.npy and data.npy in one
+    directory (see save_csr). indptr is kept in memory (O(n)); indices and data are
+    memory-mapped and streamed in blocks of about the same number of bytes.
+    """
+
+    def __init__(self, directory, target_bytes=BLOCK_BYTES):
+        """
+        Args:
+            directory: Directory written by save_csr
+            target_bytes: Bytes of indices and data per row block (see block_bytes)
+        """
+        self.indptr = np.load(os.path.join(directory, "indptr.npy"))
+        self.indices = np.load(os.path.join(directory, "indices.npy"), mmap_mode="r")
+        self.data = np.load(os.path.join(directory, "data.npy"), mmap_mode="r")
+        super().__init__(len(self.indptr) - 1)
+        self.entry_bytes = self.indices.itemsize + self.data.itemsize
+
+        # Block boundaries where the stored entries pass multiples of the target size
+        per_block = max(1, block_bytes(target_bytes) // self.entry_bytes)
+        cuts = np.searchsorted(self.indptr, np.arange(per_block, self.indptr[-1], per_block), side="right") - 1
+        self.boundaries = np.unique(np.concatenate(([0], cuts, [self.n])))
+
+    def blocks(self):
+        for start, stop in zip(self.boundaries[:-1], self.boundaries[1:]):
+            first, last = self.indptr[start], self.indptr[stop]
+            yield start, stop, CSRMatrix(self.indptr[start:stop + 1] - first, np.asarray(self.indices[first:last]),
+                                         np.asarray(self.data[first:last], dtype=float), (stop - start, self.n))
+
+    def block_nbytes(self, start, stop):
+        return int(self.indptr[stop] - self.indptr[start]) * self.entry_bytes
+
+    def block_diagonal_and_sums(self, start, block):
+        return (np.bincount(block.row_ids(), weights=block.data * (block.indices == block.row_ids() + start),
+                            minlength=len(block)), block.abs_row_sums())
+
+    def block_rows(self, block):
+        def row(i):
+            start, end = block.indptr[i], block.indptr[i + 1]
+            return _SparseRow(block.indices[start:end], block.data[start:end])
+        return row
+
+
+class _SparseRow:
+    """One stored row, with `row @ x` as its dot product with a dense vector"""
+
+    def __init__(self, indices, data):
+        self.indices = indices
+        self.data = data
+
+    def __matmul__(self, x):
+        return self.data @ x[self.indices]
+
+
+def save_csr(csr, directory):
+    """
+    Writes a CSRMatrix as the .npy files read by DiskCSRMatrix.
+    Args:
+        csr: CSRMatrix
+        directory: Target directory (created if missing)
+    """
+    os.makedirs(directory, exist_ok=True)
+    np.save(os.path.join(directory, "indptr.npy"), csr.indptr)
+    np.save(os.path.join(directory, "indices.npy"), csr.indices)
+    np.save(os.path.join(directory, "data.npy"), csr.data)
+
+
+def solve_out_of_core(A, b, method="jacobi", X0=None, TOL=0.00001, N=200):
+    """
+    Solves A·x = b with a matrix that stays on disk; every sweep or CG step streams the
+    file once.
+    Args:
+        A: StreamedOperator (MemmapMatrix or DiskCSRMatrix)
+        b: Vector n
+        method: "jacobi" (stationary_solvers.jacobi) or "cg" (krylov_solvers.pcg with a
+                Jacobi preconditioner, for symmetric positive definite A)
+        X0: Initial guess (zeros if None)
+        TOL: Tolerance of the chosen method (default is 0.00001).
+        N: Maximum number of iterations (default is 200).
+
+    Returns: Tuple (IterationResult, IOReport of the solve)
+
+    Raises:
+        ValueError: If the method is unknown.
+    """
+    A.reset_io_stats()
+    if method == "jacobi":
+        result = jacobi(A, b, X0, TOL, N)
+    elif method == "cg":
+        diagonal = A.diagonal()
+        result = pcg(A, b, X0, TOL, N, M=lambda r: r / diagonal)
+    else:
+        raise ValueError("method must be 'jacobi' or 'cg'.")
+    return result, A.io_report()
+
+
+if __name__ == '__main__':
+    """
+    Jacobi and CG on a dense memory-mapped .npy file and on an on-disk CSR matrix, with the
+    bytes streamed per sweep and the achieved throughput.
+    """
+    import tempfile
+
+    from sparse_matrix import poisson_2d
+
+    with tempfile.TemporaryDirectory() as directory:
+        n = 3000
+        rng = np.random.default_rng(0)
+        dense = rng.random((n, n))
+        dense = dense + dense.T
+        dense[np.diag_indices(n)] = 2 * dense.sum(axis=1)
+        np.save(os.path.join(directory, "dense.npy"), dense)
+        del dense
+        save_csr(poisson_2d(300), os.path.join(directory, "poisson"))
+
+        operators = [("dense .npy", MemmapMatrix(os.path.join(directory, "dense.npy"), target_bytes=8 * 2 ** 20)),
+                     ("CSR on disk", DiskCSRMatrix(os.path.join(directory, "poisson"), target_bytes=2 ** 20))]
+        print("{:<14}{:<8}{:>8}{:>10}{:>18}{:>16}".format("Matrix", "Method", "Steps", "Converged",
+                                                         "MiB per sweep", "MiB/s"))
+        print("-" * 74)
+        for name, A in operators:
+            b = np.ones(A.n)
+            for method in ("jacobi", "cg"):
+                result, report = solve_out_of_core(A, b, method, TOL=1e-8, N=2000)
+                print("{:<14}{:<8}{:>8}{:>10}{:>18.2f}{:>16.1f}".format(
+                    name, method, result.iterations, str(result.converged),
+                    report.bytes_per_product / 2 ** 20, report.throughput / 2 ** 20))
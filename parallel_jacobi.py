@@ -0,0 +1,171 @@
+import multiprocessing
+import time
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from stationary_solvers import IterationResult, as_columns, matrix_diagonal
+
+
+def shared_array(shape):
+    """
+    Allocates a float array in a new shared memory block.
+    Returns: Tuple (SharedMemory, numpy array view of it)
+    """
+    size = max(1, int(np.prod(shape))) * np.dtype(float).itemsize
+    block = shared_memory.SharedMemory(create=True, size=size)
+    return block, np.ndarray(shape, dtype=float, buffer=block.buf)
+
+
+def jacobi_worker(names, n, workers, rank, TOL, N, barrier, timeout):
+    """
+    Body of one worker process: Jacobi sweeps over its block of rows.
+
+    The iterate is double-buffered (sweep k reads buffer (k - 1) % 2 and writes k % 2) and
+    the per-worker steps are kept per parity too, so one barrier per sweep is enough: after
+    it every worker sees the whole new iterate and all steps, and takes the same decision
+    to stop. Rank 0 stores the sweep count and the convergence flag in `status`.
+
+    A worker that fails aborts the barrier, so the others get a BrokenBarrierError instead
+    of waiting for it forever; a worker killed outright is caught by the barrier timeout.
+    """
+    blocks = {name: shared_memory.SharedMemory(name=names[name]) for name in names}
+    try:
+        A = np.ndarray((n, n), dtype=float, buffer=blocks["A"].buf)
+        b = np.ndarray(n, dtype=float, buffer=blocks["b"].buf)
+        diagonal = np.ndarray(n, dtype=float, buffer=blocks["diagonal"].buf)
+        x = np.ndarray((2, n), dtype=float, buffer=blocks["x"].buf)
+        steps = np.ndarray((2, workers), dtype=float, buffer=blocks["steps"].buf)
+        status = np.ndarray(2, dtype=float, buffer=blocks["status"].buf)
+
+        rows = np.array_split(np.arange(n), workers)[rank]
+        start, stop = (rows[0], rows[-1] + 1) if len(rows) else (0, 0)
+        A_rows, b_rows, d_rows = A[start:stop], b[start:stop], diagonal[start:stop]
+
+        for k in range(1, N + 1):
+            current, new = x[(k - 1) % 2], x[k % 2]
+            # R·x = A·x - D·x, so the off-diagonal part is never built
+            new[start:stop] = (b_rows - A_rows @ current + d_rows * current[start:stop]) / d_rows
+            steps[k % 2, rank] = np.max(np.abs(new[start:stop] - current[start:stop]), initial=0.0)
+            barrier.wait(timeout)
+            if np.max(steps[k % 2]) < TOL:
+                if rank == 0:
+                    status[:] = k, 1.0
+                return
+        if rank == 0:
+            status[:] = N, 0.0
+    except BaseException:
+        barrier.abort()
+        raise
+    finally:
+        for block in blocks.values():
+            block.close()
+
+
+def parallel_jacobi(A, b, X0=None, TOL=0.00001, N=200, workers=2, timeout=60.0):
+    """
+    Jacobi iteration with the rows split over a team of worker processes.
+
+    A, b, the diagonal and the iterate live in `multiprocessing.shared_memory`, so nothing
+    is pickled per sweep; each worker updates its own block of rows and the workers meet at
+    a barrier after every sweep. The result matches `stationary_solvers.jacobi` (same
+    sweeps, same max-norm stopping rule). Worth it for large dense systems, where a sweep
+    is an O(n²) mat-vec; limit the BLAS threads of the workers (e.g. OMP_NUM_THREADS=1)
+    to avoid oversubscribing the cores.
+    Args:
+        A: Matrix nxn (list of lists or numpy array)
+        b: Vector n
+        X0: Initial guess (zeros if None)
+        TOL: Tolerance for convergence (default is 0.00001).
+        N: Maximum number of iterations (default is 200).
+        workers: Number of worker processes
+        timeout: Seconds a worker waits at the barrier for the others before giving up
+
+    Returns: IterationResult(x, iterations, converged)
+
+    Raises:
+        ValueError: If the shapes do not match or workers < 1.
+        ZeroDivisionError: If A has a zero on the diagonal.
+        RuntimeError: If a worker process fails or dies (the others are terminated).
+    """
+    if workers < 1:
+        raise ValueError("workers must be at least 1.")
+    A = np.asarray(A, dtype=float)
+    n = A.shape[0]
+    if A.shape != (n, n):
+        raise ValueError("Matrix is not square.")
+    b = as_columns(b, n)[0][:, 0]
+    diagonal = matrix_diagonal(A)
+
+    arrays = {"A": (n, n), "b": (n,), "diagonal": (n,), "x": (2, n), "steps": (2, workers), "status": (2,)}
+    blocks, views, processes = {}, {}, []
+    try:
+        for name, shape in arrays.items():
+            blocks[name], views[name] = shared_array(shape)
+        views["A"][:] = A
+        views["b"][:] = b
+        views["diagonal"][:] = diagonal
+        views["x"][0] = 0.0 if X0 is None else np.asarray(X0, dtype=float)
+
+        context = multiprocessing.get_context()
+        barrier = context.Barrier(workers)
+        names = {name: block.name for name, block in blocks.items()}
+        for rank in range(workers):
+            process = context.Process(target=jacobi_worker, args=(names, n, workers, rank, TOL, N, barrier, timeout))
+            process.start()
+            processes.append(process)
+        # Poll instead of a plain join, so one failed worker is noticed while the others run
+        while any(process.is_alive() for process in processes):
+            for process in processes:
+                process.join(0.05)
+            if any(process.exitcode not in (None, 0) for process in processes):
+                raise RuntimeError("A Jacobi worker process failed.")
+        if any(process.exitcode != 0 for process in processes):
+            raise RuntimeError("A Jacobi worker process failed.")
+
+        iterations, converged = views["status"]
+        x = views["x"][int(iterations) % 2].copy()
+        return IterationResult(x, int(iterations), bool(converged))
+    finally:
+        for process in processes:
+            if process.is_alive():
+                process.terminate()
+            process.join()
+        views.clear()
+        for block in blocks.values():
+            block.close()
+            block.unlink()
+
+
+if __name__ == '__main__':
+    """
+    Strong scaling of parallel_jacobi on a dense diagonally dominant system: wall time and
+    speedup for 1 ... N workers (N = the number of cores), against the single-process
+    stationary_solvers.jacobi.
+    """
+    import os
+
+    from stationary_solvers import jacobi
+
+    n = 4000
+    rng = np.random.default_rng(0)
+    A = rng.random((n, n))
+    A[np.diag_indices(n)] = 2 * A.sum(axis=1)
+    b = rng.random(n)
+
+    start = time.perf_counter()
+    reference = jacobi(A, b, TOL=1e-10, N=100)
+    base = time.perf_counter() - start
+    print(f"n = {n}, {reference.iterations} sweeps; stationary_solvers.jacobi: {base:.3f} s")
+
+    cores = os.cpu_count() or 1
+    print("{:<10}{:>12}{:>12}{:>16}".format("Workers", "Time [s]", "Speedup", "Max difference"))
+    print("-" * 50)
+    single = None
+    for workers in sorted({1, 2, 4, 8, cores} & set(range(1, max(cores, 2) + 1))):
+        start = time.perf_counter()
+        result = parallel_jacobi(A, b, TOL=1e-10, N=100, workers=workers)
+        elapsed = time.perf_counter() - start
+        single = single or elapsed
+        print("{:<10}{:>12.3f}{:>12.2f}{:>16.2e}".format(workers, elapsed, single / elapsed,
+                                                          np.max(np.abs(result.x - reference.x))))
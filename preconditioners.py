@@ -0,0 +1,263 @@
+import hashlib
+from collections import OrderedDict
+
+import numpy as np
+
+from sparse_matrix import CSRMatrix
+
+
+def as_csr(A):
+    """
+    Returns A as a CSRMatrix with the column indices of every row sorted.
+    :param A: 2D list, numpy array or CSRMatrix
+    """
+    if not isinstance(A, CSRMatrix):
+        return CSRMatrix.from_dense(A)
+    order = np.lexsort((A.indices, A.row_ids()))
+    return CSRMatrix(A.indptr, A.indices[order], A.data[order], A.shape)
+
+
+def matrix_fingerprint(A):
+    """
+    BLAKE2 hash of the stored arrays of a matrix (indptr, indices and data for a
+    CSRMatrix) together with its shape - one pass over the data, far cheaper than a setup.
+    :param A: 2D list, numpy array or CSRMatrix
+    """
+    if isinstance(A, CSRMatrix):
+        arrays, shape = (A.indptr, A.indices, A.data), tuple(A.shape)
+    else:
+        A = np.asarray(A)
+        arrays, shape = (A,), A.shape
+    digest = hashlib.blake2b(digest_size=16)
+    for array in arrays:
+        digest.update(array.dtype.str.encode())
+        digest.update(np.ascontiguousarray(array).tobytes())
+    return digest.hexdigest(), shape
+
+
+def split_triangles(A):
+    """
+    Splits a sorted CSRMatrix into its strict lower part, diagonal and strict upper part.
+    :param A: CSRMatrix
+    :return: Tuple (lower, diagonal, upper) - lower and upper as CSRMatrix
+    """
+    rows = A.row_ids()
+    parts = []
+    for keep in (A.indices < rows, A.indices > rows):
+        counts = np.bincount(rows[keep], minlength=len(A))
+        indptr = np.concatenate(([0], np.cumsum(counts)))
+        parts.append(CSRMatrix(indptr, A.indices[keep], A.data[keep], A.shape))
+    return parts[0], A.diagonal(), parts[1]
+
+
+def lower_solve(lower, diagonal, r):
+    """
+    Forward substitution (L + D) x = r, L strictly lower in CSR form (D = None for unit diagonal).
+    Works for a vector r or an n x k block.
+    """
+    x = np.array(r, dtype=float)
+    indptr, indices, data = lower.indptr, lower.indices, lower.data
+    for i in range(len(lower)):
+        start, end = indptr[i], indptr[i + 1]
+        if end > start:
+            x[i] -= data[start:end] @ x[indices[start:end]]
+        if diagonal is not None:
+            x[i] /= diagonal[i]
+    return x
+
+
+def upper_solve(upper, diagonal, r):
+    """
+    Back substitution (D + U) x = r, U strictly upper in CSR form.
+    Works for a vector r or an n x k block.
+    """
+    x = np.array(r, dtype=float)
+    indptr, indices, data = upper.indptr, upper.indices, upper.data
+    for i in range(len(upper) - 1, -1, -1):
+        start, end = indptr[i], indptr[i + 1]
+        if end > start:
+            x[i] -= data[start:end] @ x[indices[start:end]]
+        x[i] /= diagonal[i]
+    return x
+
+
+class Preconditioner:
+    """
+    Base class of the preconditioners.
+
+    `setup(A)` computes what `apply(r)` needs to return M^-1 r. The setups of the
+    `cache_size` most recently used matrices are cached by a fingerprint of their content,
+    so repeated solves with the same A skip it, and a matrix changed in place is set up
+    again. Subclasses implement `factor(A)`, which gets a row-sorted CSRMatrix and returns
+    the state stored in `self.state`, and `apply(r)`.
+    """
+
+    cache_size = 4
+
+    def __init__(self):
+        self.state = None
+        self._cache = OrderedDict()
+
+    def setup(self, A, force=False):
+        """
+        Prepares the preconditioner for the matrix A (cached per matrix content).
+        :param A: 2D list, numpy array or CSRMatrix
+        :param force: Recompute even if A was set up before
+        :return: self
+        """
+        key = matrix_fingerprint(A)
+        if force or key not in self._cache:
+            self._cache[key] = self.factor(as_csr(A))
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        self._cache.move_to_end(key)
+        self.state = self._cache[key]
+        return self
+
+    def factor(self, A):
+        raise NotImplementedError
+
+    def apply(self, r):
+        """
+        :param r: Residual vector, or an n x k block of residuals
+        :return: M^-1 r
+        """
+        raise NotImplementedError
+
+    def __call__(self, r):
+        return self.apply(r)
+
+
+class JacobiPreconditioner(Preconditioner):
+    """Diagonal (Jacobi) preconditioner, M = D"""
+
+    def factor(self, A):
+        diagonal = A.diagonal()
+        if np.any(diagonal == 0):
+            raise ZeroDivisionError("Zero on diagonal, cannot build a Jacobi preconditioner.")
+        return diagonal
+
+    def apply(self, r):
+        r = np.asarray(r, dtype=float)
+        return r / (self.state if r.ndim == 1 else self.state[:, None])
+
+
+class BlockJacobiPreconditioner(Preconditioner):
+    """Block-diagonal preconditioner - M holds the diagonal blocks of A of size block_size"""
+
+    def __init__(self, block_size=4):
+        super().__init__()
+        if block_size < 1:
+            raise ValueError("block_size must be positive.")
+        self.block_size = block_size
+
+    def factor(self, A):
+        n, size = len(A), self.block_size
+        count = -(-n // size)
+        # Pad the last block with the identity so every block is size x size
+        blocks = np.zeros((count, size, size))
+        padding = np.arange(n - (count - 1) * size, size)
+        blocks[-1, padding, padding] = 1.0
+        rows = A.row_ids()
+        inside = rows // size == A.indices // size
+        blocks[rows[inside] // size, rows[inside] % size, A.indices[inside] % size] = A.data[inside]
+        try:
+            return np.linalg.inv(blocks)
+        except np.linalg.LinAlgError:
+            pass
+        # Invert the blocks one by one to name the singular one
+        inverses = np.empty_like(blocks)
+        for k in range(count):
+            try:
+                inverses[k] = np.linalg.inv(blocks[k])
+            except np.linalg.LinAlgError:
+                raise ZeroDivisionError(f"Diagonal block {k} is singular, cannot build a "
+                                        f"block-Jacobi preconditioner.") from None
+        return inverses
+
+    def apply(self, r):
+        r = np.asarray(r, dtype=float)
+        inverses = self.state
+        count, size = inverses.shape[0], self.block_size
+        padded = np.zeros((count * size,) + r.shape[1:])
+        padded[:len(r)] = r
+        result = np.einsum("bij,bj...->bi...", inverses, padded.reshape((count, size) + r.shape[1:]))
+        return result.reshape(padded.shape)[:len(r)]
+
+
+class ILU0Preconditioner(Preconditioner):
+    """Incomplete LU factorization with zero fill-in - L and U keep the sparsity pattern of A"""
+
+    def factor(self, A):
+        indptr, indices = A.indptr, A.indices
+        data = A.data.copy()
+        diagonal_position = np.full(len(A), -1)
+        rows = A.row_ids()
+        diagonal_position[rows[rows == indices]] = np.flatnonzero(rows == indices)
+        if np.any(diagonal_position < 0) or np.any(data[diagonal_position] == 0):
+            raise ZeroDivisionError("Zero on diagonal, cannot build an ILU(0) preconditioner.")
+
+        for i in range(1, len(A)):
+            start, end = indptr[i], indptr[i + 1]
+            position = dict(zip(indices[start:end].tolist(), range(start, end)))
+            for p in range(start, end):
+                k = indices[p]
+                if k >= i:
+                    break
+                data[p] /= data[diagonal_position[k]]
+                # Update the entries of row i right of k that are also in row k
+                for q in range(diagonal_position[k] + 1, indptr[k + 1]):
+                    target = position.get(indices[q])
+                    if target is not None:
+                        data[target] -= data[p] * data[q]
+            # The pivot of row i is final once its lower part is eliminated
+            if data[diagonal_position[i]] == 0:
+                raise ZeroDivisionError(f"Zero pivot at row {i}, cannot build an ILU(0) preconditioner.")
+
+        lower, diagonal, upper = split_triangles(CSRMatrix(indptr, indices, data, A.shape))
+        return lower, diagonal, upper
+
+    def apply(self, r):
+        lower, diagonal, upper = self.state
+        return upper_solve(upper, diagonal, lower_solve(lower, None, r))
+
+
+class SSORPreconditioner(Preconditioner):
+    """
+    Symmetric SOR preconditioner,
+    M = omega / (2 - omega) * (D/omega + L) (D/omega)^-1 (D/omega + U)
+    """
+
+    def __init__(self, omega=1.0):
+        super().__init__()
+        if not 0 < omega < 2:
+            raise ValueError("omega must be between 0 and 2.")
+        self.omega = omega
+
+    def factor(self, A):
+        lower, diagonal, upper = split_triangles(A)
+        if np.any(diagonal == 0):
+            raise ZeroDivisionError("Zero on diagonal, cannot build an SSOR preconditioner.")
+        return lower, diagonal / self.omega, upper
+
+    def apply(self, r):
+        lower, scaled_diagonal, upper = self.state
+        y = lower_solve(lower, scaled_diagonal, r)
+        y = y * (scaled_diagonal if y.ndim == 1 else scaled_diagonal[:, None])
+        return (2 - self.omega) / self.omega * upper_solve(upper, scaled_diagonal, y)
+
+
+if __name__ == '__main__':
+    """
+    Iteration counts of PCG on a 2D Poisson system with each preconditioner.
+    """
+    from krylov_solvers import pcg
+    from sparse_matrix import poisson_2d
+
+    A = poisson_2d(30)
+    b = np.ones(len(A))
+    for name, M in [("none", lambda r: r), ("Jacobi", JacobiPreconditioner()),
+                    ("block-Jacobi (30)", BlockJacobiPreconditioner(30)),
+                    ("ILU(0)", ILU0Preconditioner()), ("SSOR (omega=1.5)", SSORPreconditioner(1.5))]:
+        result = pcg(A, b, TOL=1e-8, N=1000, M=M)
+        print(f"{name:<20} {result.iterations:>5} iterations, converged = {result.converged}")
@@ -0,0 +1,187 @@
+import numpy as np
+
+
+class CSRMatrix:
+    """
+    Compact sparse row (CSR) matrix.
+
+    Row i holds the values data[indptr[i]:indptr[i+1]] in the columns
+    indices[indptr[i]:indptr[i+1]], so storage and a matrix-vector product are O(nnz).
+    """
+
+    def __init__(self, indptr, indices, data, shape):
+        """
+        Args:
+            indptr: Row pointer array of length rows + 1
+            indices: Column index of every stored value
+            data: Stored values
+            shape: Tuple (rows, cols)
+
+        Raises:
+            ValueError: If the arrays are inconsistent with each other or with the shape.
+        """
+        self.indptr = np.asarray(indptr, dtype=np.int64)
+        self.indices = np.asarray(indices, dtype=np.int64)
+        self.data = np.asarray(data, dtype=float)
+        self.shape = (int(shape[0]), int(shape[1]))
+
+        if len(self.indptr) != self.shape[0] + 1 or self.indptr[0] != 0:
+            raise ValueError("indptr must start at 0 and have rows + 1 entries.")
+        if np.any(np.diff(self.indptr) < 0) or self.indptr[-1] != len(self.indices):
+            raise ValueError("indptr must be non-decreasing and end at the number of stored values.")
+        if len(self.indices) != len(self.data):
+            raise ValueError("indices and data must have the same length.")
+        if len(self.indices) and (self.indices.min() < 0 or self.indices.max() >= self.shape[1]):
+            raise ValueError("Column index out of range.")
+        self._row_ids = None
+
+    @classmethod
+    def from_dense(cls, matrix):
+        """
+        Builds a CSR matrix from the nonzero entries of a dense matrix.
+        Args:
+            matrix: 2D list or numpy array
+
+        Returns: CSRMatrix
+        """
+        matrix = np.asarray(matrix, dtype=float)
+        rows, cols = np.nonzero(matrix)
+        indptr = np.concatenate(([0], np.cumsum(np.bincount(rows, minlength=matrix.shape[0]))))
+        return cls(indptr, cols, matrix[rows, cols], matrix.shape)
+
+    @classmethod
+    def from_triplets(cls, rows, cols, values, shape):
+        """
+        Builds a CSR matrix from (row, col, value) triplets; duplicate entries are summed.
+        Args:
+            rows: Row index of every value
+            cols: Column index of every value
+            values: The values
+            shape: Tuple (rows, cols)
+
+        Returns: CSRMatrix
+        """
+        rows = np.asarray(rows, dtype=np.int64)
+        cols = np.asarray(cols, dtype=np.int64)
+        values = np.asarray(values, dtype=float)
+        keys, inverse = np.unique(rows * shape[1] + cols, return_inverse=True)
+        summed = np.bincount(inverse.ravel(), weights=values, minlength=len(keys))
+        rows, cols = np.divmod(keys, shape[1])
+        indptr = np.concatenate(([0], np.cumsum(np.bincount(rows, minlength=shape[0]))))
+        return cls(indptr, cols, summed, shape)
+
+    def __len__(self):
+        return self.shape[0]
+
+    @property
+    def nnz(self):
+        """Number of stored values"""
+        return len(self.data)
+
+    def row_ids(self):
+        """Row index of every stored value (computed once and cached)"""
+        if self._row_ids is None:
+            self._row_ids = np.repeat(np.arange(self.shape[0]), np.diff(self.indptr))
+        return self._row_ids
+
+    def to_dense(self):
+        """Returns the matrix as a dense numpy array"""
+        dense = np.zeros(self.shape)
+        np.add.at(dense, (self.row_ids(), self.indices), self.data)
+        return dense
+
+    def diagonal(self):
+        """Returns the main diagonal as a numpy array (zeros where nothing is stored)"""
+        diagonal = np.zeros(min(self.shape))
+        rows = self.row_ids()
+        on_diagonal = rows == self.indices
+        np.add.at(diagonal, rows[on_diagonal], self.data[on_diagonal])
+        return diagonal
+
+    def abs_row_sums(self):
+        """Returns the sum of absolute values of every row"""
+        return np.bincount(self.row_ids(), weights=np.abs(self.data), minlength=self.shape[0])
+
+    def matvec(self, x):
+        """
+        Multiplies the matrix by a vector, or by an n x k block of column vectors, in O(nnz).
+        Args:
+            x: Vector of length cols or a (cols, k) array
+
+        Returns: numpy array of length rows, or a (rows, k) array
+        """
+        x = np.asarray(x, dtype=float)
+        if x.ndim == 1:
+            return np.bincount(self.row_ids(), weights=self.data * x[self.indices], minlength=self.shape[0])
+        result = np.empty((self.shape[0], x.shape[1]))
+        for k in range(x.shape[1]):
+            result[:, k] = self.matvec(x[:, k])
+        return result
+
+    def __matmul__(self, x):
+        return self.matvec(x)
+
+    def transpose(self):
+        """Returns the transpose as a new CSR matrix (which is the CSC form of this one)"""
+        order = np.argsort(self.indices, kind="stable")
+        counts = np.bincount(self.indices, minlength=self.shape[1])
+        indptr = np.concatenate(([0], np.cumsum(counts)))
+        return CSRMatrix(indptr, self.row_ids()[order], self.data[order], (self.shape[1], self.shape[0]))
+
+    def take_rows(self, rows):
+        """
+        Returns a new CSR matrix made of the given rows (in that order), all columns kept.
+        Args:
+            rows: Row indices
+
+        Returns: CSRMatrix of shape (len(rows), cols)
+        """
+        rows = np.asarray(rows, dtype=np.int64)
+        counts = np.diff(self.indptr)[rows]
+        indptr = np.concatenate(([0], np.cumsum(counts)))
+        # Position of every value of the new matrix inside the old arrays
+        take = np.arange(indptr[-1]) + np.repeat(self.indptr[rows] - indptr[:-1], counts)
+        return CSRMatrix(indptr, self.indices[take], self.data[take], (len(rows), self.shape[1]))
+
+    def permute_rows(self, order):
+        """
+        Returns a new CSR matrix whose row i is row order[i] of this one.
+        Args:
+            order: Permutation of the row indices
+
+        Returns: CSRMatrix
+        """
+        return self.take_rows(order)
+
+
+def poisson_2d(m):
+    """
+    5-point finite-difference Laplacian on an m x m grid (Dirichlet boundary), in CSR form.
+    Args:
+        m: Grid points per side - the matrix has m^2 rows
+
+    Returns: CSRMatrix
+    """
+    n = m * m
+    idx = np.arange(n)
+    i, j = np.divmod(idx, m)
+    rows, cols, values = [idx], [idx], [np.full(n, 4.0)]
+    for di, dj in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
+        inside = (i + di >= 0) & (i + di < m) & (j + dj >= 0) & (j + dj < m)
+        rows.append(idx[inside])
+        cols.append(idx[inside] + di * m + dj)
+        values.append(np.full(int(inside.sum()), -1.0))
+    return CSRMatrix.from_triplets(np.concatenate(rows), np.concatenate(cols), np.concatenate(values), (n, n))
+
+
+if __name__ == '__main__':
+    """
+    Demonstration of the CSR storage of a small 2D Poisson matrix.
+    """
+
+    A = poisson_2d(3)
+    print("indptr :", A.indptr)
+    print("indices:", A.indices)
+    print("data   :", A.data)
+    print("Dense form:\n", A.to_dense())
+    print("A @ ones =", A @ np.ones(len(A)))
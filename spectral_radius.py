@@ -0,0 +1,210 @@
+import math
+
+import numpy as np
+
+from linear_operator import LinearOperator
+from preconditioners import as_csr, lower_solve, split_triangles
+
+
+def power_spectral_radius(apply, n, max_iter=100, tol=1e-3, seed=0, subspace=16):
+    """
+    Estimate of the spectral radius of a linear map given only as x -> T·x, by restarted
+    Arnoldi: each cycle builds a Krylov basis of `subspace` vectors and takes the largest
+    modulus among the eigenvalues of the small Hessenberg matrix (the Ritz values). Unlike
+    plain power iteration this also settles when the dominant eigenvalues are a pair ±λ or
+    a complex conjugate pair, both common for Jacobi and Gauss-Seidel matrices of
+    nonsymmetric systems. The next cycle starts from the dominant Ritz vector.
+    Args:
+        apply: Callable x -> T·x
+        n: Dimension
+        max_iter: Maximum number of applications of T
+        tol: Relative change of the estimate between cycles at which to stop
+        seed: Seed of the random start vector
+        subspace: Krylov vectors per cycle
+
+    Returns: float - estimate of ρ(T)
+    """
+    m = max(1, min(subspace, n, max_iter))
+    x = np.random.default_rng(seed).random(n) + 0.5
+    estimate = 0.0
+    for _ in range(max(1, max_iter // m)):
+        V = np.zeros((m + 1, n))
+        H = np.zeros((m + 1, m))
+        V[0] = x / np.linalg.norm(x)
+        steps = m
+        for j in range(m):
+            w = apply(V[j])
+            for i in range(j + 1):
+                H[i, j] = w @ V[i]
+                w = w - H[i, j] * V[i]
+            H[j + 1, j] = np.linalg.norm(w)
+            # An invariant subspace was found - its Ritz values are exact eigenvalues
+            if H[j + 1, j] <= 1e-12 * np.linalg.norm(H[:j + 2, j]):
+                steps = j + 1
+                break
+            V[j + 1] = w / H[j + 1, j]
+
+        ritz_values, ritz_vectors = np.linalg.eig(H[:steps, :steps])
+        dominant = int(np.argmax(np.abs(ritz_values)))
+        rho = float(np.abs(ritz_values[dominant]))
+        if rho == 0:
+            return 0.0
+        if steps < m or abs(rho - estimate) <= tol * rho:
+            return rho
+        estimate = rho
+        # A complex Ritz vector spans the plane of a conjugate pair; any real vector in it will do
+        y = V[:steps].T @ ritz_vectors[:, dominant]
+        x = y.real + y.imag
+    return estimate
+
+
+def lanczos_extreme_eigenvalues(matvec, n, steps=30, seed=0):
+    """
+    Smallest and largest eigenvalue of a symmetric operator estimated with the Lanczos method
+    (with full reorthogonalization, which is cheap for the few steps needed).
+    Args:
+        matvec: Callable x -> S·x for a symmetric S
+        n: Dimension
+        steps: Number of Lanczos steps
+        seed: Seed of the random start vector
+
+    Returns: Tuple (smallest, largest)
+    """
+    steps = min(steps, n)
+    Q = np.zeros((steps, n))
+    alpha, beta = np.zeros(steps), np.zeros(steps)
+    q = np.random.default_rng(seed).standard_normal(n)
+    Q[0] = q / np.linalg.norm(q)
+
+    count = steps
+    for j in range(steps):
+        w = matvec(Q[j])
+        alpha[j] = w @ Q[j]
+        size = np.linalg.norm(w)
+        # Orthogonalize twice - once is not enough when w is nearly in the Krylov space
+        for _ in range(2):
+            w -= Q[:j + 1].T @ (Q[:j + 1] @ w)
+        if j + 1 == steps:
+            break
+        beta[j] = np.linalg.norm(w)
+        if beta[j] <= 1e-10 * size:
+            # Invariant subspace found - its eigenvalues are exact
+            count = j + 1
+            break
+        Q[j + 1] = w / beta[j]
+
+    T = np.diag(alpha[:count]) + np.diag(beta[:count - 1], 1) + np.diag(beta[:count - 1], -1)
+    eigenvalues = np.linalg.eigvalsh(T)
+    return float(eigenvalues[0]), float(eigenvalues[-1])
+
+
+def is_symmetric(A):
+    """Whether a row-sorted CSRMatrix (see preconditioners.as_csr) equals its transpose"""
+    transpose = A.transpose()
+    return (np.array_equal(A.indptr, transpose.indptr) and np.array_equal(A.indices, transpose.indices)
+            and np.array_equal(A.data, transpose.data))
+
+
+def jacobi_spectral_radius(A, max_iter=100, tol=1e-3):
+    """
+    Estimates ρ(D⁻¹(L + U)), the spectral radius of the Jacobi iteration matrix, without
+    forming it. For a symmetric A with a positive diagonal the Jacobi matrix is similar to
+    I - D^-1/2 A D^-1/2, whose extreme eigenvalues Lanczos finds in a few steps; otherwise
+    power iteration on x -> x - D⁻¹A x is used.
+    Args:
+        A: 2D list, numpy array, CSRMatrix or LinearOperator
+        max_iter: Maximum number of Lanczos / power steps
+        tol: Relative tolerance of the power iteration
+
+    Returns: float - estimate of the spectral radius
+
+    Raises:
+        ZeroDivisionError: If A has a zero on the diagonal.
+    """
+    operator = isinstance(A, LinearOperator)
+    if not operator:
+        A = as_csr(A)
+    diagonal = A.diagonal()
+    if np.any(diagonal == 0):
+        raise ZeroDivisionError("Zero on diagonal, the Jacobi iteration is not defined.")
+
+    if np.all(diagonal > 0) and (A.symmetric if operator else is_symmetric(A)):
+        scale = 1 / np.sqrt(diagonal)
+        smallest, largest = lanczos_extreme_eigenvalues(lambda x: scale * (A @ (scale * x)), len(A),
+                                                        steps=min(max_iter, 60))
+        return max(abs(1 - smallest), abs(1 - largest))
+
+    return power_spectral_radius(lambda x: x - (A @ x) / diagonal, len(A), max_iter, tol)
+
+
+def gauss_seidel_spectral_radius(A, max_iter=100, tol=1e-3):
+    """
+    Estimates the spectral radius of the Gauss-Seidel iteration matrix -(D + L)⁻¹U by power
+    iteration; each step is one product with U and one forward substitution. For a
+    LinearOperator each step is one `relax` sweep with b = 0, i.e. the Gauss-Seidel matrix
+    in the ordering the operator relaxes in.
+    Args:
+        A: 2D list, numpy array, CSRMatrix or LinearOperator
+        max_iter: Maximum number of power steps
+        tol: Relative tolerance of the power iteration
+
+    Returns: float - estimate of the spectral radius
+
+    Raises:
+        ZeroDivisionError: If A has a zero on the diagonal.
+    """
+    if isinstance(A, LinearOperator):
+        if np.any(A.diagonal() == 0):
+            raise ZeroDivisionError("Zero on diagonal, the Gauss-Seidel iteration is not defined.")
+        zero = np.zeros(A.n)
+
+        def sweep(x):
+            x = x.copy()
+            A.relax(zero, x)
+            return x
+
+        return power_spectral_radius(sweep, A.n, max_iter, tol)
+
+    lower, diagonal, upper = split_triangles(as_csr(A))
+    if np.any(diagonal == 0):
+        raise ZeroDivisionError("Zero on diagonal, the Gauss-Seidel iteration is not defined.")
+    return power_spectral_radius(lambda x: -lower_solve(lower, diagonal, upper @ x), len(diagonal),
+                                 max_iter, tol)
+
+
+def predicted_sweeps(rho, TOL=0.00001, initial_error=1.0):
+    """
+    Number of sweeps for the error to shrink from initial_error to TOL when each sweep
+    multiplies it by about rho.
+    Returns: int, or math.inf when rho >= 1 (the iteration does not converge)
+    """
+    if rho >= 1:
+        return math.inf
+    if rho <= 0 or initial_error <= TOL:
+        return 1
+    return max(1, math.ceil(math.log(TOL / initial_error) / math.log(rho)))
+
+
+def optimal_sor_omega(rho_jacobi):
+    """
+    Optimal SOR relaxation parameter for a consistently ordered matrix (e.g. red-black
+    ordering of a stencil), from the spectral radius of its Jacobi iteration matrix.
+    """
+    if rho_jacobi >= 1:
+        return 1.0
+    return 2 / (1 + math.sqrt(1 - rho_jacobi ** 2))
+
+
+if __name__ == '__main__':
+    """
+    Spectral radius estimates, predicted sweeps and the optimal SOR parameter for the
+    iterative-methods matrix of main.py and a 2D Poisson system.
+    """
+    from sparse_matrix import poisson_2d
+
+    for name, A in [("main.py iter_A", [[4, 2, 0], [2, 10, 4], [0, 4, 5]]), ("Poisson 30x30", poisson_2d(30))]:
+        rho_j = jacobi_spectral_radius(A)
+        rho_gs = gauss_seidel_spectral_radius(A)
+        print(f"{name}: ρ(Jacobi) = {rho_j:.6f} ({predicted_sweeps(rho_j)} sweeps), "
+              f"ρ(Gauss-Seidel) = {rho_gs:.6f} ({predicted_sweeps(rho_gs)} sweeps), "
+              f"optimal SOR ω = {optimal_sor_omega(rho_j):.4f}")
@@ -0,0 +1,44 @@
+import numpy as np
+import pytest
+
+from acceleration import aitken, anderson, gauss_seidel_map, jacobi_map
+from sparse_matrix import poisson_2d
+from stationary_solvers import jacobi
+
+
+@pytest.fixture
+def system():
+    A = poisson_2d(10)
+    b = np.ones(len(A))
+    return A, b, np.linalg.solve(A.to_dense(), b)
+
+
+def test_plain_anderson_is_the_jacobi_iteration(system):
+    A, b, _ = system
+    plain = anderson(jacobi_map(A, b), np.zeros(len(b)), m=0, TOL=1e-8, N=5000)
+    reference = jacobi(A, b, TOL=1e-8, N=5000)
+    assert plain.iterations == reference.iterations
+    np.testing.assert_allclose(plain.x, reference.x)
+
+
+@pytest.mark.parametrize("fixed_point_map", [jacobi_map, gauss_seidel_map])
+def test_acceleration_cuts_the_iteration_count(fixed_point_map, system):
+    A, b, exact = system
+    G = fixed_point_map(A, b)
+    x0 = np.zeros(len(b))
+    plain = anderson(G, x0, m=0, TOL=1e-8, N=5000)
+    accelerated = anderson(G, x0, m=5, TOL=1e-8, N=5000)
+    extrapolated = aitken(G, x0, TOL=1e-8, N=5000)
+    for result in (plain, accelerated, extrapolated):
+        assert result.converged
+        np.testing.assert_allclose(result.x, exact, atol=1e-6)
+    # Anderson(5) needs a fraction of the plain sweeps; Aitken never needs more
+    assert accelerated.iterations * 4 < plain.iterations
+    assert extrapolated.iterations <= plain.iterations
+
+
+def test_aitken_solves_a_linear_scalar_map_in_one_extrapolation():
+    result = aitken(lambda x: 0.5 * x + 1.0, [0.0], TOL=1e-12, N=20)
+    assert result.converged
+    assert result.iterations <= 4
+    np.testing.assert_allclose(result.x, [2.0])
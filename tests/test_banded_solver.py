@@ -0,0 +1,46 @@
+import numpy as np
+import pytest
+
+from banded_solver import BandedLU, BandedMatrix, bandwidth, solve_banded, solve_tridiagonal
+from condition_of_linear_equations import solve_gaussian
+
+
+def band_matrix(n, lower, upper, seed=0):
+    A = np.random.default_rng(seed).standard_normal((n, n))
+    rows, cols = np.indices((n, n))
+    A[(rows - cols > lower) | (cols - rows > upper)] = 0.0
+    return A
+
+
+def test_storage_round_trip():
+    A = band_matrix(9, 2, 1)
+    banded = BandedMatrix.from_dense(A)
+    assert (banded.lower, banded.upper) == bandwidth(A) == (2, 1)
+    np.testing.assert_array_equal(banded.to_dense(), A)
+    x = np.arange(9.0)
+    np.testing.assert_allclose(banded @ x, A @ x)
+
+
+@pytest.mark.parametrize("lower, upper", [(1, 1), (2, 3), (3, 0)])
+def test_pivoted_solve_matches_numpy(lower, upper):
+    A = band_matrix(40, lower, upper, seed=lower + upper)
+    b = np.random.default_rng(5).standard_normal((40, 2))
+    np.testing.assert_allclose(solve_banded(A, b), np.linalg.solve(A, b), rtol=1e-8, atol=1e-10)
+
+
+def test_pivoting_handles_a_zero_diagonal():
+    # The first pivot is zero, so only the pivoted factorization can proceed
+    A = np.array([[0.0, 1.0, 0.0], [2.0, 1.0, 1.0], [0.0, 1.0, 3.0]])
+    np.testing.assert_allclose(solve_banded(A, [1.0, 2.0, 3.0]), np.linalg.solve(A, [1.0, 2.0, 3.0]))
+    with pytest.raises(ValueError):
+        BandedLU(BandedMatrix.from_dense(A), pivoting=False)
+
+
+def test_tridiagonal_and_solve_gaussian_band_path():
+    n = 100
+    sub, diag, sup = -np.ones(n - 1), np.full(n, 4.0), -np.ones(n - 1)
+    A = np.diag(diag) + np.diag(sub, -1) + np.diag(sup, 1)
+    b = np.arange(1.0, n + 1)
+    expected = np.linalg.solve(A, b)
+    np.testing.assert_allclose(solve_tridiagonal(sub, diag, sup, b), expected)
+    np.testing.assert_allclose(solve_gaussian(A.tolist(), b.tolist()), expected)
@@ -0,0 +1,32 @@
+import numpy as np
+import pytest
+
+from batched_solver import solve_batched
+
+
+def test_batch_matches_numpy():
+    rng = np.random.default_rng(0)
+    A, b = rng.standard_normal((500, 4, 4)), rng.standard_normal((500, 4))
+    x, singular = solve_batched(A, b)
+    assert not np.any(singular)
+    np.testing.assert_allclose(x, np.linalg.solve(A, b[..., None])[..., 0], rtol=1e-9, atol=1e-9)
+
+
+def test_singular_system_is_flagged_and_does_not_stop_the_others():
+    A = np.array([np.eye(3) * 2, [[1, 2, 3], [2, 4, 6], [1, 1, 1]], [[0, 1, 0], [1, 0, 0], [0, 0, 1]]], dtype=float)
+    b = np.ones((3, 3))
+    x, singular = solve_batched(A, b)
+    np.testing.assert_array_equal(singular, [False, True, False])
+    assert np.all(np.isnan(x[1]))
+    np.testing.assert_allclose(x[0], 0.5)
+    np.testing.assert_allclose(x[2], 1.0)
+
+
+def test_input_is_not_modified_and_shapes_are_checked():
+    A, b = np.eye(2)[None] * 3, np.ones((1, 2))
+    solve_batched(A, b)
+    np.testing.assert_array_equal(A[0], 3 * np.eye(2))
+    with pytest.raises(ValueError):
+        solve_batched(np.ones((2, 3, 4)), np.ones((2, 3)))
+    with pytest.raises(ValueError):
+        solve_batched(np.ones((2, 3, 3)), np.ones((3, 3)))
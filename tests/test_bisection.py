@@ -0,0 +1,39 @@
+import numpy as np
+import pytest
+
+from bisection_method import bisection_method, bisection_vectorized
+
+
+def test_lanes_match_scalar_bisection():
+    shifts = np.linspace(0.5, 3.5, 13)
+    a, b = np.zeros_like(shifts), np.full_like(shifts, 2.0)
+    result = bisection_vectorized(lambda x, s: x ** 3 - s, a, b, tol=1e-9, args=(shifts,))
+
+    for shift, root in zip(shifts, result.roots):
+        expected = bisection_method(lambda x: x ** 3 - shift, 0.0, 2.0, tol=1e-9, verbose=False)
+        assert root == expected
+    assert result.converged.all()
+    np.testing.assert_allclose(result.roots, np.cbrt(shifts), atol=1e-8)
+
+
+def test_non_bracketing_lanes_and_reversed_interval():
+    result = bisection_vectorized(np.cos, [2.0, 0.0, 0.0], [1.0, 1.0, 7.0], tol=1e-10)
+    assert result.roots[0] == pytest.approx(np.pi / 2, abs=1e-9)
+    # [0, 1] has no sign change; [0, 7] has cos(0) and cos(7) both positive
+    assert np.isnan(result.roots[1:]).all()
+    np.testing.assert_array_equal(result.converged, [True, False, False])
+    np.testing.assert_array_equal(result.iterations[1:], 0)
+
+
+def test_shape_is_kept():
+    a = np.zeros((2, 3))
+    b = np.arange(1.0, 7.0).reshape(2, 3) + 1.0
+    result = bisection_vectorized(lambda x: x - 0.75, a, b)
+    assert result.roots.shape == (2, 3)
+    np.testing.assert_allclose(result.roots, 0.75, atol=1e-6)
+
+
+@pytest.mark.parametrize("tol", [0.0, -1e-6])
+def test_bad_tolerance(tol):
+    with pytest.raises(ValueError):
+        bisection_vectorized(np.sin, 3.0, 4.0, tol=tol)
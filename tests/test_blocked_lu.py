@@ -0,0 +1,29 @@
+import numpy as np
+import pytest
+
+from blocked_lu import blocked_lu
+from lu_factorization import LUFactorization, row_lu
+
+
+@pytest.mark.parametrize("n, block_size, workers", [(50, 8, 1), (97, 16, 3), (10, 64, 1)])
+def test_blocked_lu_equals_row_lu(n, block_size, workers):
+    A = np.random.default_rng(n).standard_normal((n, n))
+    row, blocked = A.copy(), A.copy()
+    row_perm, row_swaps = row_lu(row)
+    blocked_perm, blocked_swaps = blocked_lu(blocked, block_size, workers)
+    np.testing.assert_array_equal(blocked_perm, row_perm)
+    assert blocked_swaps == row_swaps
+    np.testing.assert_allclose(blocked, row, atol=1e-12)
+
+
+def test_blocked_engine_solves():
+    rng = np.random.default_rng(0)
+    A, b = rng.standard_normal((120, 120)), rng.standard_normal(120)
+    x = LUFactorization(A, engine="blocked", block_size=32, workers=2).solve(b)
+    np.testing.assert_allclose(x, np.linalg.solve(A, b))
+
+
+def test_blocked_lu_rejects_singular_matrix():
+    A = np.ones((20, 20))
+    with pytest.raises(ValueError):
+        blocked_lu(A, 8)
@@ -0,0 +1,59 @@
+import numpy as np
+import pytest
+
+from GaussAndJacobi import gauss_seidel, jacobi_iterative
+from checkpoint import load_checkpoint, save_checkpoint
+from sparse_matrix import poisson_2d
+
+SOLVERS = [gauss_seidel, jacobi_iterative]
+
+
+@pytest.fixture
+def system():
+    A = poisson_2d(6)
+    return A, np.ones(len(A))
+
+
+@pytest.mark.parametrize("solver", SOLVERS)
+def test_resume_matches_uninterrupted_solve(solver, system, tmp_path):
+    A, b = system
+    straight = solver(A, b, None, TOL=1e-8, N=2000, verbose=False, checkpoint=tmp_path / "straight")
+    path = tmp_path / "interrupted"
+    solver(A, b, None, TOL=1e-8, N=20, verbose=False, checkpoint=path, checkpoint_every=5)
+    assert load_checkpoint(path).iterations == 20
+    resumed = solver(A, b, None, TOL=1e-8, N=2000, verbose=False, checkpoint=path, resume=True)
+
+    assert resumed == straight
+    expected, saved = load_checkpoint(tmp_path / "straight"), load_checkpoint(path)
+    assert saved.iterations == expected.iterations
+    np.testing.assert_array_equal(saved.history, expected.history)
+
+
+@pytest.mark.parametrize("solver", SOLVERS)
+def test_start_vector_is_honored(solver, system, tmp_path):
+    A, b = system
+    solution = solver(A, b, None, TOL=1e-12, N=2000, verbose=False)
+    path = tmp_path / "warm"
+    solver(A, b, np.array(solution), TOL=1e-8, N=2000, verbose=False, checkpoint=path)
+    assert load_checkpoint(path).iterations == 1
+
+
+@pytest.mark.parametrize("solver", SOLVERS)
+def test_damaged_checkpoint_is_rejected(solver, system, tmp_path):
+    A, b = system
+    path = tmp_path / "solve"
+    save_checkpoint(path, np.zeros(len(A)), 3, [1.0, 0.5, 0.25])
+    content = bytearray(path.read_bytes())
+    content[len(content) // 2] ^= 0xFF
+    path.write_bytes(bytes(content))
+    with pytest.raises(ValueError, match="checksum"):
+        solver(A, b, None, verbose=False, checkpoint=path, resume=True)
+
+
+@pytest.mark.parametrize("solver", SOLVERS)
+def test_checkpoint_of_another_size_is_rejected(solver, system, tmp_path):
+    A, b = system
+    path = tmp_path / "solve"
+    save_checkpoint(path, np.zeros(len(A) + 1), 3, [1.0, 0.5, 0.25])
+    with pytest.raises(ValueError, match="unknowns"):
+        solver(A, b, None, verbose=False, checkpoint=path, resume=True)
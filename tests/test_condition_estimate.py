@@ -0,0 +1,33 @@
+import numpy as np
+import pytest
+
+from condition_of_linear_equations import condition_estimate, condition_number
+from lu_factorization import LUFactorization
+
+
+def matrices():
+    rng = np.random.default_rng(0)
+    yield rng.standard_normal((20, 20))
+    yield np.array([[1.0 / (i + j + 1) for j in range(6)] for i in range(6)])
+    yield np.diag([1.0, 1e-3, 10.0])
+
+
+@pytest.mark.parametrize("A", list(matrices()))
+def test_estimate_is_close_lower_bound_of_cond(A):
+    exact = np.linalg.cond(A, np.inf)
+    estimate = condition_estimate(A)
+    # Hager's estimate never exceeds the true value and is usually within a small factor
+    assert estimate <= exact * (1 + 1e-10)
+    assert estimate >= exact / 3
+
+
+@pytest.mark.parametrize("ord", [1, np.inf])
+def test_inverse_norm_estimate_in_both_norms(ord):
+    A = next(matrices())
+    exact = np.linalg.norm(np.linalg.inv(A), ord)
+    assert LUFactorization(A).inverse_norm_estimate(ord) == pytest.approx(exact, rel=0.5)
+
+
+def test_condition_number_exact_matches_numpy():
+    A = next(matrices())
+    assert condition_number(A.tolist(), verbose=False) == pytest.approx(np.linalg.cond(A, np.inf))
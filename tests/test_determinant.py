@@ -0,0 +1,33 @@
+import numpy as np
+import pytest
+
+from matrix_utility import Determinant, LogDeterminant
+
+
+def test_determinant_matches_numpy():
+    A = np.random.default_rng(0).standard_normal((7, 7))
+    assert Determinant(A.tolist()) == pytest.approx(np.linalg.det(A))
+    assert Determinant([[0.0, 1.0], [1.0, 0.0]]) == -1.0
+    assert Determinant([[2.0, 1.0], [1.0, 1.0]], mul=3) == pytest.approx(3.0)
+
+
+def test_singular_determinant_is_float_zero():
+    result = Determinant([[1.0, 2.0], [2.0, 4.0]])
+    assert result == 0.0 and isinstance(result, float)
+    assert LogDeterminant([[1.0, 2.0], [2.0, 4.0]]) == (0.0, -np.inf)
+
+
+def test_log_determinant_matches_numpy_beyond_overflow():
+    A = 10 * np.eye(400) + np.random.default_rng(1).standard_normal((400, 400))
+    sign, logabsdet = LogDeterminant(A)
+    expected_sign, expected_log = np.linalg.slogdet(A)
+    assert sign == expected_sign
+    assert logabsdet == pytest.approx(expected_log)
+    assert logabsdet > np.log(np.finfo(float).max)
+
+
+def test_non_square_matrix_raises():
+    with pytest.raises(ValueError):
+        Determinant([[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]])
+    with pytest.raises(ValueError):
+        LogDeterminant([[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]])
@@ -0,0 +1,39 @@
+import numpy as np
+import pytest
+
+from GaussAndJacobi import fix, fix_greedy, is_diagonally_dominant
+from matrix_utility import DominantDiagonalFix
+from sparse_matrix import CSRMatrix
+
+# Dominant once the rows are ordered [2, 0, 1], but the greedy column search puts the row
+# with the 6 first (the largest value of column 0), where it is not dominant
+SCRAMBLED = [[6.0, 10.0, 1.0], [1.0, 1.0, 4.0], [-5.0, 1.0, 1.0]]
+ORDERED = [[-5.0, 1.0, 1.0], [6.0, 10.0, 1.0], [1.0, 1.0, 4.0]]
+b = [1.0, 2.0, 3.0]
+
+
+def test_greedy_fix_fails():
+    with pytest.raises(ValueError):
+        fix_greedy(SCRAMBLED, b)
+
+
+def test_fix_falls_back_to_matching():
+    matrix, vector = fix(SCRAMBLED, b)
+    assert matrix == ORDERED
+    assert vector == [3.0, 1.0, 2.0]
+    assert is_diagonally_dominant(matrix)
+
+
+def test_fix_falls_back_to_matching_for_csr():
+    matrix, vector = fix(CSRMatrix.from_dense(SCRAMBLED), b)
+    np.testing.assert_array_equal(matrix.to_dense(), ORDERED)
+    np.testing.assert_array_equal(vector, [3.0, 1.0, 2.0])
+
+
+def test_dominant_diagonal_fix_uses_matching():
+    assert DominantDiagonalFix(SCRAMBLED) == ORDERED
+
+
+def test_fix_still_raises_when_no_dominant_order_exists():
+    with pytest.raises(ValueError):
+        fix([[1.0, 2.0, 2.0], [2.0, 1.0, 2.0], [2.0, 2.0, 1.0]], b)
@@ -0,0 +1,18 @@
+import numpy as np
+
+from factorization_cache import FactorizationCache, fingerprint
+
+
+def test_fingerprint_keeps_the_dtype():
+    A = np.array([[4.0, 1.0], [1.0, 3.0]])
+    assert fingerprint(A)[2] == "<f8"
+    assert fingerprint(A.astype(np.float32))[2] == "<f4"
+    assert fingerprint(A.astype(np.float32)) != fingerprint(A)
+
+
+def test_equal_matrices_share_an_entry():
+    cache = FactorizationCache()
+    cache.factorization([[4.0, 1.0], [1.0, 3.0]])
+    cache.factorization(np.array([[4.0, 1.0], [1.0, 3.0]]))
+    assert cache.stats().hits == 1
+    assert len(cache) == 1
@@ -0,0 +1,38 @@
+import numpy as np
+import pytest
+
+from fast_multiply import multiply
+from matrix_utility import MulMatrixVector, MultiplyMatrix, matrix_multiply
+
+
+def triple_loop(A, B):
+    return [[sum(A[i][k] * B[k][j] for k in range(len(B))) for j in range(len(B[0]))] for i in range(len(A))]
+
+
+def test_list_wrappers_match_the_triple_loop():
+    rng = np.random.default_rng(0)
+    A, B = rng.integers(-5, 6, (4, 3)).tolist(), rng.integers(-5, 6, (3, 5)).tolist()
+    assert MultiplyMatrix(A, B) == triple_loop(A, B)
+    np.testing.assert_array_equal(matrix_multiply(A, B), triple_loop(A, B))
+    column = [[1], [2], [3]]
+    assert MulMatrixVector(A, column) == triple_loop(A, column)
+
+
+@pytest.mark.parametrize("A_shape, B_shape", [((6, 4), (4,)), ((6, 4), (4, 3)), ((5, 6, 4), (5, 4, 3)), ((5, 6, 4), (4, 3))])
+def test_shapes_match_numpy(A_shape, B_shape):
+    rng = np.random.default_rng(1)
+    A, B = rng.standard_normal(A_shape), rng.standard_normal(B_shape)
+    np.testing.assert_allclose(multiply(A, B), A @ B)
+
+
+def test_threaded_panels_match_numpy():
+    rng = np.random.default_rng(2)
+    A, B = rng.standard_normal((300, 40)), rng.standard_normal((40, 30))
+    np.testing.assert_allclose(multiply(A, B, workers=3, block_rows=64), A @ B)
+
+
+def test_incompatible_shapes_raise():
+    with pytest.raises(ValueError):
+        multiply(np.ones((2, 3)), np.ones((2, 3)))
+    with pytest.raises(ValueError):
+        multiply(np.ones((2, 3)), np.ones((4, 3, 2)))
@@ -0,0 +1,33 @@
+import numpy as np
+import pytest
+
+from matrix_utility import GaussJordanInverse, InverseMatrix
+
+
+def test_inverse_matches_numpy():
+    A = np.random.default_rng(0).standard_normal((12, 12))
+    original = A.copy()
+    np.testing.assert_allclose(GaussJordanInverse(A), np.linalg.inv(A), atol=1e-12)
+    np.testing.assert_array_equal(A, original)
+
+
+def test_recorded_operations_reproduce_the_inverse():
+    A = [[0.0, 2.0, 1.0], [1.0, 1.0, 0.0], [2.0, 0.0, 3.0]]
+    inverse, operations = GaussJordanInverse(A, record=True)
+    product = np.identity(3)
+    for elementary in operations:
+        product = elementary @ product
+    np.testing.assert_allclose(product, inverse, atol=1e-12)
+    np.testing.assert_allclose(product @ np.array(A), np.identity(3), atol=1e-12)
+
+
+def test_singular_matrix():
+    with pytest.raises(ValueError):
+        GaussJordanInverse([[1.0, 2.0], [2.0, 4.0]])
+    assert InverseMatrix([[1.0, 2.0], [2.0, 4.0]], [1.0, 1.0]) is None
+
+
+def test_inverse_matrix_returns_lists():
+    inverse = InverseMatrix([[4.0, 7.0], [2.0, 6.0]], [1.0, 1.0])
+    np.testing.assert_allclose(inverse, [[0.6, -0.7], [-0.2, 0.4]])
+    assert isinstance(inverse, list)
@@ -0,0 +1,37 @@
+import warnings
+
+import numpy as np
+
+from krylov_solvers import gmres
+
+
+def test_gmres_singular_system_returns_finite_iterate():
+    A = np.array([[1.0, 0.0], [0.0, 0.0]])
+    b = np.array([1.0, 1.0])
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        result = gmres(A, b)
+    assert np.all(np.isfinite(result.x))
+    assert not result.converged
+    # The best possible residual: the component of b outside the range of A
+    assert np.linalg.norm(b - A @ result.x) == 1.0
+
+
+def test_gmres_consistent_singular_system_converges():
+    A = np.diag([1.0, 2.0, 0.0])
+    result = gmres(A, [1.0, 1.0, 0.0], M=lambda r: r)
+    assert result.converged
+    np.testing.assert_allclose(A @ result.x, [1.0, 1.0, 0.0])
+
+
+def test_default_preconditioner_matches_dominance_check():
+    from GaussAndJacobi import is_diagonally_dominant
+    from krylov_solvers import default_preconditioner
+
+    rng = np.random.default_rng(0)
+    for _ in range(100):
+        A = rng.integers(-3, 4, (5, 5)).astype(float) + np.diag(rng.integers(0, 12, 5))
+        A[np.diag_indices(5)] += 0.5
+        r = rng.random(5)
+        expected = r / np.diag(A) if is_diagonally_dominant(A) else r
+        np.testing.assert_allclose(default_preconditioner(A)(r), expected)
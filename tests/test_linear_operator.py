@@ -0,0 +1,64 @@
+import numpy as np
+import pytest
+
+from linear_operator import LaplacianStencil, laplacian_1d, laplacian_2d, laplacian_3d
+from sparse_matrix import poisson_2d
+
+
+def dense_laplacian(shape):
+    """Kronecker-sum reference: sum over axes of I ⊗ T ⊗ I with T = tridiag(-1, 2, -1)"""
+    total = np.zeros((int(np.prod(shape)),) * 2)
+    for axis, size in enumerate(shape):
+        T = 2 * np.eye(size) - np.eye(size, k=1) - np.eye(size, k=-1)
+        term = np.ones((1, 1))
+        for other, other_size in enumerate(shape):
+            term = np.kron(term, T if other == axis else np.eye(other_size))
+        total += term
+    return total
+
+
+def test_2d_matches_poisson_2d():
+    m = 6
+    A = laplacian_2d(m)
+    dense = poisson_2d(m).to_dense()
+    x = np.random.default_rng(0).standard_normal((A.n, 2))
+    np.testing.assert_allclose(A @ x, dense @ x)
+    np.testing.assert_allclose(A.diagonal(), np.diag(dense))
+    np.testing.assert_allclose(A.abs_row_sums(), np.abs(dense).sum(axis=1))
+
+
+@pytest.mark.parametrize("A", [laplacian_1d(7), laplacian_2d(3, 5), laplacian_3d(3, 4, 2)])
+def test_matvec_matches_dense(A):
+    dense = dense_laplacian(A.grid_shape)
+    x = np.random.default_rng(1).standard_normal(A.n)
+    np.testing.assert_allclose(A.matvec(x), dense @ x)
+    np.testing.assert_allclose(A.diagonal(), np.diag(dense))
+    np.testing.assert_allclose(A.abs_row_sums(), np.abs(dense).sum(axis=1))
+
+
+def test_relax_is_red_black_gauss_seidel():
+    A = laplacian_2d(4, 5)
+    dense = dense_laplacian(A.grid_shape)
+    rng = np.random.default_rng(2)
+    b, x0 = rng.standard_normal(A.n), rng.standard_normal(A.n)
+
+    # Reference: a lexicographic Gauss-Seidel sweep over the red points, then the black ones
+    i, j = np.divmod(np.arange(A.n), 5)
+    order = np.concatenate([np.flatnonzero((i + j) % 2 == 0), np.flatnonzero((i + j) % 2 == 1)])
+    expected = x0.copy()
+    for row in order:
+        expected[row] += (b[row] - dense[row] @ expected) / dense[row, row]
+
+    x = x0.copy()
+    A.relax(b, x)
+    np.testing.assert_allclose(x, expected)
+
+    for _ in range(300):
+        A.relax(b, x)
+    np.testing.assert_allclose(x, np.linalg.solve(dense, b), atol=1e-10)
+
+
+@pytest.mark.parametrize("shape", [(), (2, 2, 2, 2), (3, 0)])
+def test_bad_grid(shape):
+    with pytest.raises(ValueError):
+        LaplacianStencil(shape)
@@ -0,0 +1,74 @@
+import numpy as np
+import pytest
+
+from low_rank_update import LowRankUpdate, update_inverse
+
+rng = np.random.default_rng(0)
+n = 12
+A0 = rng.standard_normal((n, n)) + n * np.eye(n)
+
+
+def updated(max_rank=16):
+    solver = LowRankUpdate(A0, max_rank=max_rank)
+    U = rng.standard_normal((n, 2))
+    V = rng.standard_normal((n, 2))
+    solver.update(U, V)
+    return solver, A0 + U @ V.T
+
+
+def test_solves_match_fresh_factorization():
+    solver, A = updated()
+    b = rng.standard_normal(n)
+    B = rng.standard_normal((n, 3))
+    np.testing.assert_allclose(solver.solve(b), np.linalg.solve(A, b), rtol=1e-10)
+    np.testing.assert_allclose(solver.solve(B), np.linalg.solve(A, B), rtol=1e-10)
+    np.testing.assert_allclose(solver.solve_transpose(b), np.linalg.solve(A.T, b), rtol=1e-10)
+    sign, logdet = np.linalg.slogdet(A)
+    assert solver.slogdet() == pytest.approx((sign, logdet))
+
+
+def test_row_and_column_replacement():
+    solver = LowRankUpdate(A0)
+    row = rng.standard_normal(n)
+    column = rng.standard_normal(n)
+    solver.update_row(3, row).update_column(5, column)
+    A = A0.copy()
+    A[3] = row
+    A[:, 5] = column
+    np.testing.assert_allclose(solver.matrix, A)
+    b = rng.standard_normal(n)
+    np.testing.assert_allclose(solver.solve(b), np.linalg.solve(A, b), rtol=1e-10)
+
+
+def test_refactors_past_max_rank():
+    solver = LowRankUpdate(A0, max_rank=3)
+    A = A0.copy()
+    for _ in range(4):
+        u, v = rng.standard_normal(n), rng.standard_normal(n)
+        solver.update(u, v)
+        A += np.outer(u, v)
+    assert solver.rank == 0
+    b = rng.standard_normal(n)
+    np.testing.assert_allclose(solver.solve(b), np.linalg.solve(A, b), rtol=1e-10)
+
+
+def test_condition_estimate_is_close_to_exact():
+    solver, A = updated()
+    exact = np.linalg.cond(A, np.inf)
+    estimate = solver.condition_estimate(np.inf)
+    assert exact / 3 <= estimate <= exact * (1 + 1e-10)
+
+
+def test_update_inverse_and_singular_update():
+    U = rng.standard_normal((n, 2))
+    V = rng.standard_normal((n, 2))
+    expected = np.linalg.inv(A0 + U @ V.T)
+    np.testing.assert_allclose(update_inverse(np.linalg.inv(A0), U, V), expected, rtol=1e-9, atol=1e-12)
+
+    # Zeroing the first row through a rank-1 update makes the matrix singular
+    e = np.zeros(n)
+    e[0] = 1.0
+    with pytest.raises(ValueError):
+        LowRankUpdate(np.eye(n)).update(e, -e)
+    with pytest.raises(ValueError):
+        LowRankUpdate(A0).update(np.ones(n), np.ones(n - 1))
@@ -0,0 +1,53 @@
+import numpy as np
+import pytest
+
+from condition_of_linear_equations import solve_gaussian
+from lu_factorization import LUFactorization
+
+
+def random_system(n=30, seed=0):
+    rng = np.random.default_rng(seed)
+    return rng.standard_normal((n, n)), rng.standard_normal(n)
+
+
+def test_solve_matches_numpy():
+    A, b = random_system()
+    factorization = LUFactorization(A)
+    np.testing.assert_allclose(factorization.solve(b), np.linalg.solve(A, b))
+    B = np.column_stack([b, 2 * b + 1])
+    np.testing.assert_allclose(factorization.solve(B), np.linalg.solve(A, B))
+
+
+def test_solve_transpose_matches_numpy():
+    A, b = random_system(seed=1)
+    np.testing.assert_allclose(LUFactorization(A).solve_transpose(b), np.linalg.solve(A.T, b))
+
+
+def test_slogdet_and_det_match_numpy():
+    A, _ = random_system(seed=2)
+    sign, logabsdet = LUFactorization(A).slogdet()
+    expected_sign, expected_log = np.linalg.slogdet(A)
+    assert sign == expected_sign
+    assert logabsdet == pytest.approx(expected_log)
+    assert LUFactorization(A[:6, :6]).det() == pytest.approx(np.linalg.det(A[:6, :6]))
+
+
+def test_pivoting_handles_zero_leading_entry():
+    A = [[0.0, 2.0, 1.0], [1.0, 1.0, 0.0], [2.0, 0.0, 3.0]]
+    np.testing.assert_allclose(LUFactorization(A).solve([1.0, 2.0, 3.0]), np.linalg.solve(A, [1.0, 2.0, 3.0]))
+
+
+def test_singular_and_malformed_input_raise():
+    with pytest.raises(ValueError):
+        LUFactorization([[1.0, 2.0], [2.0, 4.0]])
+    with pytest.raises(ValueError):
+        LUFactorization([[1.0, 2.0]])
+    with pytest.raises(ValueError):
+        LUFactorization(np.eye(3)).solve(np.ones(4))
+
+
+def test_solve_gaussian_returns_list():
+    A, b = random_system(8, seed=3)
+    x = solve_gaussian(A.tolist(), b.tolist())
+    assert isinstance(x, list)
+    np.testing.assert_allclose(x, np.linalg.solve(A, b))
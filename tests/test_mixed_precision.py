@@ -0,0 +1,46 @@
+import numpy as np
+
+from condition_of_linear_equations import RefinementResult, mixed_precision_solve, solve_gaussian
+
+
+def well_conditioned(n=40, seed=0):
+    rng = np.random.default_rng(seed)
+    return rng.standard_normal((n, n)) + n * np.eye(n), rng.standard_normal(n)
+
+
+def hilbert(n):
+    return np.array([[1.0 / (i + j + 1) for j in range(n)] for i in range(n)])
+
+
+def test_refinement_reaches_double_accuracy():
+    A, b = well_conditioned()
+    result = mixed_precision_solve(A, b)
+    assert result.precision == "mixed"
+    assert result.steps >= 1
+    np.testing.assert_allclose(result.x, np.linalg.solve(A, b), rtol=0, atol=1e-13)
+
+
+def test_ill_conditioned_matrix_falls_back_to_double():
+    A = hilbert(10)
+    result = mixed_precision_solve(A, np.ones(10))
+    assert result.precision == "double"
+    # cond(A) ~ 1e13, so only the residual is comparable with numpy, not x itself
+    assert np.max(np.abs(A @ result.x - 1.0)) < 1e-6
+
+
+def test_solve_gaussian_reports_refinement():
+    A, b = well_conditioned()
+    result = solve_gaussian(A.tolist(), b.tolist(), precision="mixed", return_info=True)
+    assert isinstance(result, RefinementResult)
+    assert isinstance(result.x, list)
+    assert result.precision == "mixed" and result.steps >= 1
+    assert solve_gaussian(A.tolist(), b.tolist(), precision="mixed") == result.x
+
+    fallback = solve_gaussian(hilbert(10).tolist(), [1.0] * 10, precision="mixed", return_info=True)
+    assert fallback.precision == "double"
+
+
+def test_solve_gaussian_double_info():
+    result = solve_gaussian([[2.0, 1.0], [1.0, 3.0]], [1.0, 2.0], return_info=True)
+    assert result.steps == 0 and result.precision == "double"
+    np.testing.assert_allclose(result.x, [0.2, 0.6])
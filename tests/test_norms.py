@@ -0,0 +1,42 @@
+import numpy as np
+import pytest
+
+from matrix_utility import MaxNorm
+from norms import matrix_norm
+from sparse_matrix import CSRMatrix
+
+A = np.array([[2.0, -1.0, 0.0, 3.0], [0.5, 4.0, -2.0, 0.0], [1.0, 0.0, 1.0, -1.0]])
+
+
+@pytest.mark.parametrize("ord", [1, np.inf, "fro"])
+def test_exact_norms_match_numpy(ord):
+    expected = np.linalg.norm(A, ord)
+    assert matrix_norm(A, ord) == pytest.approx(expected)
+    assert matrix_norm(A.tolist(), ord) == pytest.approx(expected)
+    assert matrix_norm(CSRMatrix.from_dense(A), ord) == pytest.approx(expected)
+
+
+@pytest.mark.parametrize("ord", [1, np.inf, "fro", 2])
+def test_batched_norms_match_numpy(ord):
+    batch = np.random.default_rng(0).standard_normal((6, 5, 5))
+    expected = np.linalg.norm(batch, ord, axis=(-2, -1))
+    rtol = 1e-2 if ord == 2 else 1e-12
+    np.testing.assert_allclose(matrix_norm(batch, ord), expected, rtol=rtol)
+
+
+def test_two_norm_estimate_is_close_lower_bound():
+    B = np.random.default_rng(1).standard_normal((30, 20))
+    exact = np.linalg.norm(B, 2)
+    for operand in (B, CSRMatrix.from_dense(B)):
+        estimate = matrix_norm(operand, 2)
+        assert estimate <= exact * (1 + 1e-12)
+        assert estimate == pytest.approx(exact, rel=1e-2)
+
+
+def test_max_norm_and_bad_input():
+    assert MaxNorm(A.tolist()) == pytest.approx(np.linalg.norm(A, np.inf))
+    assert matrix_norm(np.zeros((3, 3)), 2) == 0.0
+    with pytest.raises(ValueError):
+        matrix_norm(A, 3)
+    with pytest.raises(ValueError):
+        matrix_norm(np.ones(4))
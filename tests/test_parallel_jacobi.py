@@ -0,0 +1,51 @@
+import multiprocessing
+import os
+import signal
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from parallel_jacobi import parallel_jacobi
+from stationary_solvers import jacobi
+
+
+def dominant_system(n=60, seed=0):
+    rng = np.random.default_rng(seed)
+    A = rng.random((n, n))
+    A[np.diag_indices(n)] = 2 * A.sum(axis=1)
+    return A, rng.random(n)
+
+
+def test_matches_single_process_jacobi():
+    A, b = dominant_system()
+    reference = jacobi(A, b, TOL=1e-10, N=100)
+    result = parallel_jacobi(A, b, TOL=1e-10, N=100, workers=2)
+    assert result.iterations == reference.iterations
+    assert result.converged
+    np.testing.assert_allclose(result.x, reference.x, rtol=0, atol=1e-12)
+
+
+def test_killed_worker_raises_instead_of_hanging():
+    A, b = dominant_system()
+
+    def kill_one_worker():
+        deadline = time.monotonic() + 10
+        while time.monotonic() < deadline:
+            children = multiprocessing.active_children()
+            if children:
+                time.sleep(0.2)
+                os.kill(children[0].pid, signal.SIGKILL)
+                return
+            time.sleep(0.01)
+
+    killer = threading.Thread(target=kill_one_worker)
+    killer.start()
+    started = time.monotonic()
+    # TOL=0 never converges, so the workers sweep until one of them is killed
+    with pytest.raises(RuntimeError):
+        parallel_jacobi(A, b, TOL=0.0, N=10 ** 9, workers=2, timeout=5.0)
+    killer.join()
+    assert time.monotonic() - started < 10
+    assert not multiprocessing.active_children()
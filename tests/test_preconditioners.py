@@ -0,0 +1,64 @@
+import numpy as np
+import pytest
+
+from preconditioners import BlockJacobiPreconditioner, ILU0Preconditioner, JacobiPreconditioner, matrix_fingerprint
+from sparse_matrix import CSRMatrix
+
+
+def block_inverse_apply(A, r, size):
+    return np.concatenate([np.linalg.solve(A[i:i + size, i:i + size], r[i:i + size])
+                           for i in range(0, len(A), size)])
+
+
+@pytest.mark.parametrize("n", [6, 7, 8])
+@pytest.mark.parametrize("sparse", [False, True])
+def test_block_jacobi_keeps_zero_diagonal_entries(n, sparse):
+    rng = np.random.default_rng(n)
+    A = rng.random((n, n)) + 3 * np.eye(n)
+    # A structural zero on the diagonal of a full block; the block stays invertible
+    A[1, 1] = 0.0
+    A[1, 2], A[2, 1] = 5.0, 4.0
+    r = rng.random(n)
+    M = BlockJacobiPreconditioner(3).setup(CSRMatrix.from_dense(A) if sparse else A)
+    np.testing.assert_allclose(M.apply(r), block_inverse_apply(A, r, 3))
+
+
+def test_setup_sees_in_place_changes():
+    A = np.diag([2.0, 4.0, 8.0])
+    M = JacobiPreconditioner()
+    np.testing.assert_allclose(M.setup(A).apply(np.ones(3)), [0.5, 0.25, 0.125])
+    A[0, 0] = 1.0
+    np.testing.assert_allclose(M.setup(A).apply(np.ones(3)), [1.0, 0.25, 0.125])
+
+
+def test_setup_cache_evicts_least_recently_used():
+    M = JacobiPreconditioner()
+    M.cache_size = 2
+    first, second, third = (np.diag([float(k), 1.0]) for k in (2, 3, 4))
+    M.setup(first)
+    M.setup(second)
+    M.setup(first)
+    M.setup(third)
+    assert matrix_fingerprint(first) in M._cache
+    assert matrix_fingerprint(second) not in M._cache
+
+
+def test_ilu0_rejects_zero_pivot_from_elimination():
+    # Nonsingular with a nonzero diagonal, but the second pivot becomes 1 - 1·1 = 0
+    A = np.array([[1.0, 1.0, 0.0], [1.0, 1.0, 1.0], [0.0, 1.0, 1.0]])
+    with pytest.raises(ZeroDivisionError):
+        ILU0Preconditioner().setup(A)
+
+
+def test_ilu0_is_exact_for_tridiagonal_matrices():
+    # No fill-in, so ILU(0) is the full LU factorization
+    A = np.diag(np.full(6, 4.0)) + np.diag(np.full(5, -1.0), 1) + np.diag(np.full(5, -2.0), -1)
+    r = np.arange(1.0, 7.0)
+    np.testing.assert_allclose(ILU0Preconditioner().setup(A).apply(r), np.linalg.solve(A, r))
+
+
+def test_block_jacobi_singular_block_raises_zero_division():
+    A = np.eye(6)
+    A[3:5, 3:5] = [[1.0, 2.0], [2.0, 4.0]]
+    with pytest.raises(ZeroDivisionError, match="block 1"):
+        BlockJacobiPreconditioner(3).setup(A)
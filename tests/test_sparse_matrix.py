@@ -0,0 +1,59 @@
+import numpy as np
+
+from GaussAndJacobi import csr_gauss_seidel_sweep, fix, gauss_seidel, jacobi_iterative
+from sparse_matrix import CSRMatrix, poisson_2d
+
+
+def dominant_dense(n=12, seed=0):
+    rng = np.random.default_rng(seed)
+    A = rng.random((n, n)) * (rng.random((n, n)) < 0.3)
+    A[np.diag_indices(n)] = A.sum(axis=1) + 1.0
+    return A, rng.random(n)
+
+
+def test_csr_round_trip_and_products():
+    A, x = dominant_dense()
+    csr = CSRMatrix.from_dense(A)
+    np.testing.assert_array_equal(csr.to_dense(), A)
+    np.testing.assert_allclose(csr @ x, A @ x)
+    np.testing.assert_array_equal(csr.transpose().to_dense(), A.T)
+    np.testing.assert_array_equal(csr.diagonal(), np.diag(A))
+    np.testing.assert_allclose(csr.abs_row_sums(), np.abs(A).sum(axis=1))
+
+
+def test_poisson_2d_is_the_5_point_laplacian():
+    A = poisson_2d(3).to_dense()
+    assert A.shape == (9, 9)
+    np.testing.assert_array_equal(np.diag(A), 4.0)
+    assert A[4, 1] == A[4, 3] == A[4, 5] == A[4, 7] == -1.0
+    assert A[2, 3] == 0.0
+    np.testing.assert_array_equal(A, A.T)
+
+
+def test_csr_sweep_equals_dense_sweep():
+    A, b = dominant_dense()
+    x_dense = np.zeros(len(A))
+    for i in range(len(A)):
+        x_dense[i] = (b[i] - A[i] @ x_dense + A[i, i] * x_dense[i]) / A[i, i]
+    x_csr = np.zeros(len(A))
+    csr_gauss_seidel_sweep(CSRMatrix.from_dense(A), b, x_csr, np.diag(A))
+    np.testing.assert_allclose(x_csr, x_dense)
+
+
+def test_csr_solvers_equal_dense_solvers():
+    A, b = dominant_dense()
+    csr = CSRMatrix.from_dense(A)
+    for solver in (gauss_seidel, jacobi_iterative):
+        dense_x = solver(A.tolist(), b.tolist(), None, TOL=1e-10, N=500, verbose=False)
+        csr_x = solver(csr, b, None, TOL=1e-10, N=500, verbose=False)
+        np.testing.assert_allclose(csr_x, dense_x, atol=1e-12)
+        np.testing.assert_allclose(csr_x, np.linalg.solve(A, b), atol=1e-9)
+
+
+def test_csr_fix_permutes_like_dense_fix():
+    A, b = dominant_dense()
+    order = np.random.default_rng(1).permutation(len(A))
+    dense_matrix, dense_b = fix(A[order].tolist(), b[order].tolist())
+    csr_matrix, csr_b = fix(CSRMatrix.from_dense(A[order]), b[order])
+    np.testing.assert_array_equal(csr_matrix.to_dense(), dense_matrix)
+    np.testing.assert_array_equal(csr_b, dense_b)
@@ -0,0 +1,64 @@
+import math
+
+import numpy as np
+import pytest
+
+from linear_operator import laplacian_2d
+from sparse_matrix import poisson_2d
+from spectral_radius import (gauss_seidel_spectral_radius, jacobi_spectral_radius, optimal_sor_omega,
+                             predicted_sweeps)
+
+
+def exact_radii(A):
+    D = np.diag(np.diag(A))
+    L = np.tril(A, -1)
+    jacobi = np.max(np.abs(np.linalg.eigvals(np.linalg.solve(D, D - A))))
+    gauss_seidel = np.max(np.abs(np.linalg.eigvals(-np.linalg.solve(D + L, np.triu(A, 1)))))
+    return jacobi, gauss_seidel
+
+
+@pytest.mark.parametrize("m", [5, 10, 20])
+def test_poisson_radii_match_eigenvalues(m):
+    A = poisson_2d(m)
+    jacobi, gauss_seidel = exact_radii(A.to_dense())
+    # Known closed form for the 5-point Laplacian
+    assert jacobi == pytest.approx(math.cos(math.pi / (m + 1)))
+    assert jacobi_spectral_radius(A) == pytest.approx(jacobi, rel=1e-6)
+    assert jacobi_spectral_radius(laplacian_2d(m)) == pytest.approx(jacobi, rel=1e-6)
+    assert gauss_seidel_spectral_radius(A, max_iter=2000, tol=1e-8) == pytest.approx(gauss_seidel, rel=1e-3)
+
+
+def test_nonsymmetric_matrix_with_complex_dominant_pair():
+    rng = np.random.default_rng(0)
+    A = rng.random((15, 15))
+    A[np.diag_indices(15)] = A.sum(axis=1) * 0.8
+    jacobi, gauss_seidel = exact_radii(A)
+    # The Gauss-Seidel matrix of A has a complex conjugate pair of largest modulus
+    assert jacobi_spectral_radius(A) == pytest.approx(jacobi, rel=1e-3)
+    assert gauss_seidel_spectral_radius(A) == pytest.approx(gauss_seidel, rel=1e-3)
+
+
+def test_random_nonsymmetric_matrices():
+    rng = np.random.default_rng(5)
+    for _ in range(50):
+        n = int(rng.integers(3, 40))
+        A = rng.standard_normal((n, n))
+        A[np.diag_indices(n)] = np.abs(A).sum(axis=1) * rng.uniform(0.5, 1.5)
+        jacobi, gauss_seidel = exact_radii(A)
+        assert jacobi_spectral_radius(A) == pytest.approx(jacobi, rel=1e-2)
+        assert gauss_seidel_spectral_radius(A) == pytest.approx(gauss_seidel, rel=1e-2)
+
+
+def test_zero_diagonal_raises():
+    with pytest.raises(ZeroDivisionError):
+        jacobi_spectral_radius([[0.0, 1.0], [1.0, 2.0]])
+    with pytest.raises(ZeroDivisionError):
+        gauss_seidel_spectral_radius([[0.0, 1.0], [1.0, 2.0]])
+
+
+def test_predicted_sweeps_and_optimal_omega():
+    assert predicted_sweeps(0.5, TOL=1e-3) == 10
+    assert predicted_sweeps(1.0) == math.inf
+    assert optimal_sor_omega(0.0) == 1.0
+    assert optimal_sor_omega(1.5) == 1.0
+    assert optimal_sor_omega(math.cos(math.pi / 21)) == pytest.approx(2 / (1 + math.sin(math.pi / 21)))
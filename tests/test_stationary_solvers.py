@@ -0,0 +1,84 @@
+import numpy as np
+
+from preconditioners import JacobiPreconditioner
+from sparse_matrix import poisson_2d
+from stationary_solvers import jacobi
+
+
+def test_jacobi_accepts_callable_preconditioner_with_zero_diagonal():
+    # The diagonal is zero, but M = A⁻¹ never divides by it
+    A = np.array([[0.0, 1.0], [1.0, 0.0]])
+    result = jacobi(A, [1.0, 2.0], M=lambda r: A @ r, N=5)
+    assert result.converged
+    np.testing.assert_allclose(result.x, [2.0, 1.0])
+
+
+def test_jacobi_preconditioner_equals_plain_sweep():
+    A = poisson_2d(8)
+    b = np.ones(len(A))
+    plain = jacobi(A, b, TOL=1e-8, N=2000)
+    preconditioned = jacobi(A, b, TOL=1e-8, N=2000, M=JacobiPreconditioner())
+    assert preconditioned.iterations == plain.iterations
+    np.testing.assert_allclose(preconditioned.x, plain.x)
+
+
+def test_jacobi_multiple_right_hand_sides_match_single_solves():
+    A = poisson_2d(6)
+    rng = np.random.default_rng(0)
+    B = rng.random((len(A), 3))
+    B[:, 2] = 0.0
+    block = jacobi(A, B, TOL=1e-9, N=2000)
+    assert np.all(block.converged)
+    for column in range(3):
+        single = jacobi(A, B[:, column], TOL=1e-9, N=2000)
+        np.testing.assert_array_equal(block.x[:, column], single.x)
+        assert block.iterations[column] == single.iterations
+    np.testing.assert_allclose(block.x, np.linalg.solve(A.to_dense(), B), atol=1e-7)
+
+
+def test_jacobi_converged_columns_stop_updating():
+    A = poisson_2d(6)
+    b = np.ones(len(A))
+    block = jacobi(A, np.column_stack([b, np.zeros(len(A))]), TOL=1e-9, N=2000)
+    # The zero right-hand side is solved by the zero start after one sweep
+    assert block.iterations[1] == 1
+    assert block.iterations[0] == jacobi(A, b, TOL=1e-9, N=2000).iterations
+    np.testing.assert_array_equal(block.x[:, 1], 0.0)
+
+
+def test_multicolor_gauss_seidel_converges_to_the_solution():
+    from stationary_solvers import greedy_coloring, multicolor_sor, red_black_coloring
+
+    A = poisson_2d(10)
+    b = np.ones(len(A))
+    exact = np.linalg.solve(A.to_dense(), b)
+    for colors in (red_black_coloring((10, 10)), greedy_coloring(A), None):
+        result = multicolor_sor(A, b, TOL=1e-10, N=2000, colors=colors)
+        assert result.converged
+        np.testing.assert_allclose(result.x, exact, atol=1e-8)
+
+
+def test_colorings_leave_same_colored_rows_uncoupled():
+    from stationary_solvers import greedy_coloring, red_black_coloring
+
+    A = poisson_2d(7)
+    dense = A.to_dense()
+    for colors in (red_black_coloring((7, 7)), greedy_coloring(A)):
+        same = colors[:, None] == colors[None, :]
+        np.fill_diagonal(same, False)
+        assert not np.any(dense[same])
+
+
+def test_optimal_sor_needs_far_fewer_sweeps():
+    from stationary_solvers import multicolor_sor, red_black_coloring
+
+    A = poisson_2d(20)
+    b = np.ones(len(A))
+    colors = red_black_coloring((20, 20))
+    gauss_seidel = multicolor_sor(A, b, TOL=1e-8, N=5000, colors=colors)
+    sor = multicolor_sor(A, b, TOL=1e-8, N=5000, omega="auto", colors=colors)
+    threaded = multicolor_sor(A, b, TOL=1e-8, N=5000, omega="auto", colors=colors, workers=3)
+    assert gauss_seidel.converged and sor.converged
+    assert sor.iterations * 5 < gauss_seidel.iterations
+    assert threaded.iterations == sor.iterations
+    np.testing.assert_allclose(threaded.x, sor.x)